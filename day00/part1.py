@@ -1,8 +1,6 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
-import sys
-import timeit
 from pathlib import Path
 
 import pytest
@@ -52,15 +50,3 @@ def read_input() -> str:
 if __name__ == "__main__":
     input_data = read_input()
     print("Answer is:     ", compute(input_data))
-
-    if "-b" in sys.argv:
-        number_of_runs = 100
-        bench_time = timeit.timeit(
-            "compute(data)",
-            setup="from __main__ import compute",
-            globals={"data": input_data},
-            number=number_of_runs,
-        )
-        print(f"{number_of_runs} runs took: {bench_time}s")
-        one_run = sup.humanized_seconds(bench_time / number_of_runs)
-        print(f"Average time:   {one_run}")
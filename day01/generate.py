@@ -0,0 +1,21 @@
+#!/usr/bin/env python3
+"""Synthetic input: two columns of 5-digit location ids, ~`size` bytes."""
+from __future__ import annotations
+
+import random
+import sys
+
+
+def generate(size: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    lines = []
+    right = [rng.randint(10000, 99999) for _ in range(max(size // 14, 1))]
+    for num in right:
+        # some ids of left list are in right list too, like in real input
+        left = rng.choice(right) if rng.random() < 0.5 else rng.randint(10000, 99999)
+        lines.append(f"{left}   {num}")
+    return "\n".join(lines) + "\n"
+
+
+if __name__ == "__main__":
+    print(generate(int(sys.argv[1])), end="")
@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""Synthetic input: reports of 5-8 levels, about half of them safe."""
+from __future__ import annotations
+
+import random
+import sys
+
+
+def generate(size: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    lines = []
+    total = 0
+    while total < size:
+        direction = rng.choice([-1, 1])
+        report = [rng.randint(10, 89)]
+        for _ in range(rng.randint(4, 7)):
+            step = rng.randint(1, 3) if rng.random() < 0.9 else rng.randint(-2, 5)
+            report.append(report[-1] + direction * step)
+        line = " ".join(map(str, report))
+        lines.append(line)
+        total += len(line) + 1
+    return "\n".join(lines) + "\n"
+
+
+if __name__ == "__main__":
+    print(generate(int(sys.argv[1])), end="")
@@ -1,19 +1,20 @@
 from __future__ import annotations
 
-import sys
-import timeit
+from collections.abc import Iterable
 from pathlib import Path
 
 import pytest
 
-import support as sup
-
 INPUT_TXT = Path(__file__).parent / "input.txt"
 
 
 def compute(s: str) -> int:
+    return compute_stream((line.encode() for line in s.splitlines()))
+
+
+def compute_stream(lines: Iterable[bytes]) -> int:
     total = 0
-    for line in s.splitlines():
+    for line in lines:
         report = list(map(int, line.split()))
         if check_safe_report(report):
             total += 1
@@ -74,15 +75,3 @@ def read_input() -> str:
 if __name__ == "__main__":
     input_data = read_input()
     print("Answer is:     ", compute(input_data))
-
-    if "-b" in sys.argv:
-        number_of_runs = 1000
-        bench_time = timeit.timeit(
-            "compute(data)",
-            setup="from __main__ import compute",
-            globals={"data": input_data},
-            number=number_of_runs,
-        )
-        print(f"{number_of_runs} runs took: {bench_time}s")
-        one_run = sup.humanized_seconds(bench_time / number_of_runs)
-        print(f"Average time:   {one_run}")
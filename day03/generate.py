@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""Synthetic input: corrupted memory with `mul(X,Y)`, `do()` and `don't()`."""
+from __future__ import annotations
+
+import random
+import sys
+
+NOISE = "~!@#$%^&*()[]{}<>,;:'? how when where who what select from"
+LINE_LEN = 3000
+
+
+def generate(size: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    lines = []
+    chunks = []
+    line_len = total = 0
+    while total < size:
+        roll = rng.random()
+        if roll < 0.15:
+            chunk = f"mul({rng.randint(1, 999)},{rng.randint(1, 999)})"
+        elif roll < 0.17:
+            chunk = rng.choice(["do()", "don't()"])
+        elif roll < 0.2:
+            # almost valid instructions
+            chunk = rng.choice(["mul(4*", "mul(6,9!", "?(12,34)", "mul ( 2 , 4 )"])
+        else:
+            chunk = rng.choice(NOISE)
+        chunks.append(chunk)
+        line_len += len(chunk)
+        total += len(chunk)
+        if line_len >= LINE_LEN:
+            lines.append("".join(chunks))
+            chunks = []
+            line_len = 0
+            total += 1
+    lines.append("".join(chunks))
+    return "\n".join(lines) + "\n"
+
+
+if __name__ == "__main__":
+    print(generate(int(sys.argv[1])), end="")
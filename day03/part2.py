@@ -1,29 +1,30 @@
 from __future__ import annotations
 
 import re
-import sys
-import timeit
+from collections.abc import Iterable
 from pathlib import Path
 
 import pytest
 
-import support as sup
-
 INPUT_TXT = Path(__file__).parent / "input.txt"
 
 
-mul_re = re.compile(r"mul\((\d+),(\d+)\)|don't\(\)|do\(\)")
+mul_re = re.compile(rb"mul\((\d+),(\d+)\)|don't\(\)|do\(\)")
 
 
 def compute(s: str) -> int:
+    return compute_stream((line.encode() for line in s.splitlines()))
+
+
+def compute_stream(lines: Iterable[bytes]) -> int:
     total = 0
     skip = False
-    for line in s.splitlines():
+    for line in lines:
         for match in mul_re.finditer(line):
             matched = match.group(0)
-            if matched == "don't()":
+            if matched == b"don't()":
                 skip = True
-            elif matched == "do()":
+            elif matched == b"do()":
                 skip = False
             elif not skip:
                 a, b = map(int, match.groups())
@@ -62,15 +63,3 @@ def read_input() -> str:
 if __name__ == "__main__":
     input_data = read_input()
     print("Answer is:     ", compute(input_data))
-
-    if "-b" in sys.argv:
-        number_of_runs = 1000
-        bench_time = timeit.timeit(
-            "compute(data)",
-            setup="from __main__ import compute",
-            globals={"data": input_data},
-            number=number_of_runs,
-        )
-        print(f"{number_of_runs} runs took: {bench_time}s")
-        one_run = sup.humanized_seconds(bench_time / number_of_runs)
-        print(f"Average time:   {one_run}")
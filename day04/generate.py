@@ -0,0 +1,17 @@
+#!/usr/bin/env python3
+"""Synthetic input: square grid of X, M, A and S letters."""
+from __future__ import annotations
+
+import math
+import random
+import sys
+
+
+def generate(size: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    side = max(math.isqrt(size), 4)
+    return "".join("".join(rng.choices("XMAS", k=side)) + "\n" for _ in range(side))
+
+
+if __name__ == "__main__":
+    print(generate(int(sys.argv[1])), end="")
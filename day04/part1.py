@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-import sys
-import timeit
 from pathlib import Path
 
 import pytest
@@ -11,15 +9,15 @@ import support as sup
 INPUT_TXT = Path(__file__).parent / "input.txt"
 
 
-XMAS = ["X", "M", "A", "S"]
+XMAS = b"XMAS"
 
 
 def compute(s: str) -> int:
     total = 0
-    matrix = sup.Matrix.create_from_input(s)
+    matrix = sup.Grid.create_from_input(s)
     for m, line in enumerate(matrix):
         for n, char in enumerate(line):
-            if char != "X":
+            if char != XMAS[0]:
                 continue
             for direction in sup.Direction:
                 values = matrix.get_values(m, n, direction, 4)
@@ -67,15 +65,3 @@ def read_input() -> str:
 if __name__ == "__main__":
     input_data = read_input()
     print("Answer is:     ", compute(input_data))
-
-    if "-b" in sys.argv:
-        number_of_runs = 100
-        bench_time = timeit.timeit(
-            "compute(data)",
-            setup="from __main__ import compute",
-            globals={"data": input_data},
-            number=number_of_runs,
-        )
-        print(f"{number_of_runs} runs took: {bench_time}s")
-        one_run = sup.humanized_seconds(bench_time / number_of_runs)
-        print(f"Average time:   {one_run}")
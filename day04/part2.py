@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-import sys
-import timeit
 from pathlib import Path
 
 import pytest
@@ -11,12 +9,12 @@ import support as sup
 INPUT_TXT = Path(__file__).parent / "input.txt"
 
 
-MAS = [["M", "A", "S"], ["S", "A", "M"]]
+MAS = [b"MAS", b"SAM"]
 
 
 def compute(s: str) -> int:
     total = 0
-    matrix = sup.Matrix.create_from_input(s)
+    matrix = sup.Grid.create_from_input(s)
     down_right = sup.Direction.DOWNRIGHT
     down_left = sup.Direction.DOWNLEFT
     for m, line in enumerate(matrix):
@@ -73,15 +71,3 @@ def read_input() -> str:
 if __name__ == "__main__":
     input_data = read_input()
     print("Answer is:     ", compute(input_data))
-
-    if "-b" in sys.argv:
-        number_of_runs = 100
-        bench_time = timeit.timeit(
-            "compute(data)",
-            setup="from __main__ import compute",
-            globals={"data": input_data},
-            number=number_of_runs,
-        )
-        print(f"{number_of_runs} runs took: {bench_time}s")
-        one_run = sup.humanized_seconds(bench_time / number_of_runs)
-        print(f"Average time:   {one_run}")
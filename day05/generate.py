@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Synthetic input: ordering rules for every pair of pages and updates.
+
+Real input has rules for all pairs of 49 pages, here number of pages
+grows with `size` so rules are about half of the input.
+"""
+from __future__ import annotations
+
+import math
+import random
+import sys
+
+
+def generate(size: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    pages_count = max(math.isqrt(size // 6), 5)
+    order = rng.sample(range(10, 10 + pages_count * 10), pages_count)
+    rules = [
+        f"{before}|{after}"
+        for i, before in enumerate(order)
+        for after in order[i + 1 :]
+    ]
+    rng.shuffle(rules)
+
+    updates = []
+    total = len(rules) * 6
+    while total < size:
+        length = rng.randrange(5, min(24, pages_count + 1), 2)
+        positions = sorted(rng.sample(range(pages_count), length))
+        update = [order[pos] for pos in positions]
+        if rng.random() < 0.5:
+            rng.shuffle(update)
+        line = ",".join(map(str, update))
+        updates.append(line)
+        total += len(line) + 1
+    return "\n".join(rules) + "\n\n" + "\n".join(updates) + "\n"
+
+
+if __name__ == "__main__":
+    print(generate(int(sys.argv[1])), end="")
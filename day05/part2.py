@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-import sys
-import timeit
 from collections import defaultdict
 from pathlib import Path
 
@@ -17,30 +15,27 @@ def compute(s: str) -> int:
     rules = [tuple(line.split("|")) for line in sections[0].splitlines()]
     updates = [line.split(",") for line in sections[1].splitlines()]
 
-    total = 0
-    for update in updates:
-        if not is_valid_update(update, rules):
-            sorted_pages = topological_sort(update, rules)
-            total += int(find_middle_page(sorted_pages))
-
-    return total
-
+    rules_set = set(rules)
+    invalid_updates = [
+        update for update in updates if not is_valid_update(update, rules_set)
+    ]
 
-def topological_sort(pages, rules):
     graph = defaultdict(list)
     for x, y in rules:
-        if x in pages and y in pages:
-            graph[x].append(y)
+        graph[x].append(y)
 
-    return sup.topological_sort(graph)
+    total = 0
+    for sorted_pages in sup.topological_sort_many(graph, invalid_updates):
+        total += int(find_middle_page(sorted_pages))
 
+    return total
 
-def is_valid_update(update, rules):
-    relevant_rules = [rule for rule in rules if rule[0] in update and rule[1] in update]
 
-    for x, y in relevant_rules:
-        if update.index(x) > update.index(y):
-            return False
+def is_valid_update(update, rules_set):
+    for i, x in enumerate(update):
+        for y in update[i + 1 :]:
+            if (y, x) in rules_set:
+                return False
     return True
 
 
@@ -106,15 +101,3 @@ def read_input() -> str:
 if __name__ == "__main__":
     input_data = read_input()
     print("Answer is:     ", compute(input_data))
-
-    if "-b" in sys.argv:
-        number_of_runs = 100
-        bench_time = timeit.timeit(
-            "compute(data)",
-            setup="from __main__ import compute",
-            globals={"data": input_data},
-            number=number_of_runs,
-        )
-        print(f"{number_of_runs} runs took: {bench_time}s")
-        one_run = sup.humanized_seconds(bench_time / number_of_runs)
-        print(f"Average time:   {one_run}")
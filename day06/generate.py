@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""Synthetic input: square lab map with sparse obstacles and a guard."""
+from __future__ import annotations
+
+import math
+import random
+import sys
+
+DIRECTIONS = [(-1, 0), (0, 1), (1, 0), (0, -1)]
+
+
+def generate(size: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    side = max(math.isqrt(size), 4)
+    while True:
+        rows = [
+            ["#" if rng.random() < 0.015 else "." for _ in range(side)]
+            for _ in range(side)
+        ]
+        guard_m, guard_n = rng.randrange(side), rng.randrange(side)
+        rows[guard_m][guard_n] = "^"
+        if _guard_leaves(rows, guard_m, guard_n):
+            return "".join("".join(row) + "\n" for row in rows)
+
+
+def _guard_leaves(rows: list[list[str]], m: int, n: int) -> bool:
+    """Solutions expect guard to leave the map if there is no extra obstacle."""
+    side = len(rows)
+    direction = 0
+    seen = set()
+    while (m, n, direction) not in seen:
+        seen.add((m, n, direction))
+        next_m, next_n = m + DIRECTIONS[direction][0], n + DIRECTIONS[direction][1]
+        if not (0 <= next_m < side and 0 <= next_n < side):
+            return True
+        if rows[next_m][next_n] == "#":
+            direction = (direction + 1) % 4
+        else:
+            m, n = next_m, next_n
+    return False
+
+
+if __name__ == "__main__":
+    print(generate(int(sys.argv[1])), end="")
@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-import sys
-import timeit
 from itertools import cycle
 from pathlib import Path
 
@@ -13,35 +11,42 @@ INPUT_TXT = Path(__file__).parent / "input.txt"
 
 
 def compute(s: str) -> int:
-    data = []
-    guard_pos = None
-    directions = cycle(
-        [sup.Direction.UP, sup.Direction.RIGHT, sup.Direction.DOWN, sup.Direction.LEFT]
-    )
-    for m, line in enumerate(s.splitlines()):
-        row = []
-        for n, char in enumerate(line):
-            if char == "^":
-                guard_pos = (m, n)
-            row.append(char)
-        data.append(row)
-
-    matrix = sup.Matrix(data)
+    with sup.trace("parse"):
+        data = []
+        guard_pos = None
+        directions = cycle(
+            [
+                sup.Direction.UP,
+                sup.Direction.RIGHT,
+                sup.Direction.DOWN,
+                sup.Direction.LEFT,
+            ]
+        )
+        for m, line in enumerate(s.splitlines()):
+            row = []
+            for n, char in enumerate(line):
+                if char == "^":
+                    guard_pos = (m, n)
+                row.append(char)
+            data.append(row)
+
+        matrix = sup.Matrix(data)
     next_coords = guard_pos
     current_direction = next(directions)
     visited = {next_coords}
-    while True:
-        try_next = matrix.next_coords(*next_coords, direction=current_direction)
-        if try_next is None:
-            break
-
-        next_m, next_n = try_next
-        next_val = matrix[next_m][next_n]
-        if next_val == "#":
-            current_direction = next(directions)
-            continue
-        next_coords = (next_m, next_n)
-        visited.add(next_coords)
+    with sup.trace("walk"):
+        while True:
+            try_next = matrix.next_coords(*next_coords, direction=current_direction)
+            if try_next is None:
+                break
+
+            next_m, next_n = try_next
+            next_val = matrix[next_m][next_n]
+            if next_val == "#":
+                current_direction = next(directions)
+                continue
+            next_coords = (next_m, next_n)
+            visited.add(next_coords)
 
     return len(visited)
 
@@ -85,15 +90,3 @@ def read_input() -> str:
 if __name__ == "__main__":
     input_data = read_input()
     print("Answer is:     ", compute(input_data))
-
-    if "-b" in sys.argv:
-        number_of_runs = 100
-        bench_time = timeit.timeit(
-            "compute(data)",
-            setup="from __main__ import compute",
-            globals={"data": input_data},
-            number=number_of_runs,
-        )
-        print(f"{number_of_runs} runs took: {bench_time}s")
-        one_run = sup.humanized_seconds(bench_time / number_of_runs)
-        print(f"Average time:   {one_run}")
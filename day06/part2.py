@@ -1,11 +1,8 @@
 from __future__ import annotations
 
-import sys
-import timeit
-from concurrent.futures.process import ProcessPoolExecutor
 from itertools import cycle
 from pathlib import Path
-from typing import Iterator, NamedTuple
+from typing import NamedTuple
 
 import pytest
 
@@ -14,91 +11,76 @@ import support as sup
 INPUT_TXT = Path(__file__).parent / "input.txt"
 
 
+DIRECTIONS = [
+    sup.Direction.UP,
+    sup.Direction.RIGHT,
+    sup.Direction.DOWN,
+    sup.Direction.LEFT,
+]
+
+OBSTACLE = ord("#")
+
+
 class PuzzleData(NamedTuple):
-    obstacles: set[tuple[int, int]]
+    grid: sup.SharedGrid
     guard_pos: tuple[int, int]
-    directions: Iterator[sup.Vector2D]
     m_bound: int
     n_bound: int
 
 
 def compute(s: str) -> int:
-    obstacles = set()
-    guard_pos = None
-    bound_m = 0
-    bound_n = 0
-    for m, line in enumerate(s.splitlines()):
-        for n, char in enumerate(line):
-            if char == "^":
-                guard_pos = (m, n)
-            elif char == "#":
-                obstacles.add((m, n))
-        bound_n = len(line) - 1
-        bound_m = m
-
-    directions = cycle(
-        [sup.Direction.UP, sup.Direction.RIGHT, sup.Direction.DOWN, sup.Direction.LEFT]
-    )
-    visited = set()
-    first_run_loop = find_loop(
-        PuzzleData(obstacles, guard_pos, directions, bound_m, bound_n), visited
-    )
-    assert first_run_loop is False, "First run should not have a loop"
-
-    variants = build_variants(
-        original_path=visited,
-        guard_pos=guard_pos,
-        obstacles=obstacles,
-        m_bound=bound_m,
-        n_bound=bound_n,
-    )
-
-    with ProcessPoolExecutor() as executor:
-        return sum(executor.map(find_loop, variants))
+    with sup.trace("parse"):
+        guard_pos = None
+        for m, line in enumerate(s.splitlines()):
+            if "^" in line:
+                guard_pos = (m, line.index("^"))
+
+    # workers attach to the grid in shared memory, so they get
+    # only the new obstacle for every variant
+    with sup.shared_grid(s) as grid:
+        data = PuzzleData(grid, guard_pos, *grid.bounds)
+        with sup.trace("walk"):
+            visited = set()
+            first_run_loop = find_loop(data, visited_container=visited)
+            assert first_run_loop is False, "First run should not have a loop"
+
+        with sup.trace("build variants"):
+            new_obstacles = build_variants(original_path=visited, data=data)
+
+        with sup.trace("search loops"):
+            return sum(sup.pool().map(find_loop, new_obstacles, shared=data))
 
 
 def build_variants(
-    original_path: set[tuple[int, int, sup.Vector2D]],
-    guard_pos: tuple[int, int],
-    obstacles: set[tuple[int, int]],
-    m_bound: int,
-    n_bound: int,
-) -> list[PuzzleData]:
+    original_path: set[tuple[int, int, sup.Vector2D]], data: PuzzleData
+) -> list[tuple[int, int]]:
     results = []
-    added = set(guard_pos) | obstacles
+    added = {data.guard_pos}
     for pos_m, pos_n, pos_dir in original_path:
         new_obstacle = get_next_coords(
-            pos_m, pos_n, direction=pos_dir, m_bound=m_bound, n_bound=n_bound
+            pos_m, pos_n, direction=pos_dir, m_bound=data.m_bound, n_bound=data.n_bound
         )
-        if new_obstacle is None or new_obstacle in added:
+        if (
+            new_obstacle is None
+            or new_obstacle in added
+            or data.grid[new_obstacle] == "#"
+        ):
             continue
 
-        results.append(
-            PuzzleData(
-                obstacles=obstacles | {new_obstacle},
-                guard_pos=guard_pos,
-                directions=cycle(
-                    [
-                        sup.Direction.UP,
-                        sup.Direction.RIGHT,
-                        sup.Direction.DOWN,
-                        sup.Direction.LEFT,
-                    ]
-                ),
-                m_bound=m_bound,
-                n_bound=n_bound,
-            )
-        )
+        results.append(new_obstacle)
         added.add(new_obstacle)
     return results
 
 
 def find_loop(
     data: PuzzleData,
+    new_obstacle: tuple[int, int] | None = None,
     visited_container: set[tuple[int, int, sup.Vector2D]] | None = None,
 ) -> bool:
+    cells, n_len = data.grid.cells, data.grid.n_len
+    directions = cycle(DIRECTIONS)
     next_coords = data.guard_pos
-    current_direction = next(data.directions)
+    current_direction = next(directions)
     visited = {(*next_coords, current_direction)}
 
     while True:
@@ -111,8 +93,9 @@ def find_loop(
         if try_next is None:
             break
 
-        if try_next in data.obstacles:
-            current_direction = next(data.directions)
+        next_m, next_n = try_next
+        if try_next == new_obstacle or cells[next_m * n_len + next_n] == OBSTACLE:
+            current_direction = next(directions)
             visited.add((*next_coords, current_direction))
             continue
         next_coords = try_next
@@ -175,15 +158,3 @@ def read_input() -> str:
 if __name__ == "__main__":
     input_data = read_input()
     print("Answer is:     ", compute(input_data))
-
-    if "-b" in sys.argv:
-        number_of_runs = 10
-        bench_time = timeit.timeit(
-            "compute(data)",
-            setup="from __main__ import compute",
-            globals={"data": input_data},
-            number=number_of_runs,
-        )
-        print(f"{number_of_runs} runs took: {bench_time}s")
-        one_run = sup.humanized_seconds(bench_time / number_of_runs)
-        print(f"Average time:   {one_run}")
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""Synthetic input: calibration equations, about half of them solvable."""
+from __future__ import annotations
+
+import random
+import sys
+
+# distribution of numbers count per equation and digits per number in real input
+COUNTS = range(3, 13)
+COUNT_WEIGHTS = [15, 24, 248, 150, 103, 74, 67, 61, 46, 62]
+DIGITS = [1, 1, 1, 1, 2, 2, 2, 3, 3]
+
+
+def generate(size: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    lines = []
+    total = 0
+    while total < size:
+        (count,) = rng.choices(COUNTS, weights=COUNT_WEIGHTS)
+        numbers = [rng.randint(1, 10 ** rng.choice(DIGITS) - 1) for _ in range(count)]
+        value = numbers[0]
+        for num in numbers[1:]:
+            op = rng.choice("+*|")
+            if op == "+":
+                value += num
+            elif op == "*":
+                value *= num
+            else:
+                value = int(f"{value}{num}")
+        if rng.random() < 0.5:
+            value += rng.randint(1, 10)
+        line = f"{value}: {' '.join(map(str, numbers))}"
+        lines.append(line)
+        total += len(line) + 1
+    return "\n".join(lines) + "\n"
+
+
+if __name__ == "__main__":
+    print(generate(int(sys.argv[1])), end="")
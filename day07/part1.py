@@ -1,27 +1,26 @@
 from __future__ import annotations
 
-import sys
-import timeit
+from collections.abc import Iterable
 from pathlib import Path
 
 import pytest
 
-import support as sup
-
 INPUT_TXT = Path(__file__).parent / "input.txt"
 
 
 def compute(s: str) -> int:
+    return compute_stream((line.encode() for line in s.splitlines()))
+
+
+def compute_stream(lines: Iterable[bytes]) -> int:
     total = 0
-    results = []
-    for line in s.splitlines():
-        split = line.split(": ")
+    for line in lines:
+        split = line.split(b": ")
         test_value = int(split[0])
         numbers = [int(item) for item in split[1].split()]
 
         if _check(test_value, numbers):
             total += test_value
-            results.append(test_value)
 
     return total
 
@@ -74,15 +73,3 @@ def read_input() -> str:
 if __name__ == "__main__":
     input_data = read_input()
     print("Answer is:     ", compute(input_data))
-
-    if "-b" in sys.argv:
-        number_of_runs = 100
-        bench_time = timeit.timeit(
-            "compute(data)",
-            setup="from __main__ import compute",
-            globals={"data": input_data},
-            number=number_of_runs,
-        )
-        print(f"{number_of_runs} runs took: {bench_time}s")
-        one_run = sup.humanized_seconds(bench_time / number_of_runs)
-        print(f"Average time:   {one_run}")
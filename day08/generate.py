@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+"""Synthetic input: square map with antennas of 62 frequencies."""
+from __future__ import annotations
+
+import math
+import random
+import string
+import sys
+
+FREQUENCIES = string.ascii_letters + string.digits
+
+
+def generate(size: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    side = max(math.isqrt(size), 4)
+    rows = [["."] * side for _ in range(side)]
+    # part 2 solution expects no antennas of same frequency in one column
+    used_columns = set()
+    for m in range(side):
+        for n in range(side):
+            frequency = rng.choice(FREQUENCIES)
+            if rng.random() < 0.08 and (frequency, n) not in used_columns:
+                rows[m][n] = frequency
+                used_columns.add((frequency, n))
+    return "".join("".join(row) + "\n" for row in rows)
+
+
+if __name__ == "__main__":
+    print(generate(int(sys.argv[1])), end="")
@@ -0,0 +1,19 @@
+#!/usr/bin/env python3
+"""Synthetic input: disk map of `size` digits, files are never empty."""
+from __future__ import annotations
+
+import random
+import sys
+
+
+def generate(size: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    digits = [
+        str(rng.randint(1, 9) if i % 2 == 0 else rng.randint(0, 9))
+        for i in range(size | 1)
+    ]
+    return "".join(digits) + "\n"
+
+
+if __name__ == "__main__":
+    print(generate(int(sys.argv[1])), end="")
@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-import sys
-import timeit
 from pathlib import Path
 
 import pytest
@@ -32,23 +30,22 @@ def compute(s: str) -> int:
 
 
 def defrag_disk(disk, file_blocks, free_blocks):
+    free_space = sup.RangeSet(
+        sup.Range(free_id, free_id + free_size)
+        for free_id, free_size in free_blocks
+        if free_size
+    )
     for file_id, file_size in reversed(file_blocks):
-        for free_id, free_size in free_blocks:
-            if free_id > file_id:
-                break
+        free = free_space.find_first_fit(file_size)
+        if free is None or free.start > file_id:
+            continue
 
-            if free_size >= file_size:
-                free_slice = slice(free_id, free_id + file_size)
-                file_slice = slice(file_id, file_id + file_size)
+        free_slice = slice(free.start, free.start + file_size)
+        file_slice = slice(file_id, file_id + file_size)
 
-                disk[free_slice] = disk[file_slice]
-                disk[file_slice] = ["."] * file_size
-                idx = free_blocks.index((free_id, free_size))
-                if file_size == free_size:
-                    free_blocks.pop(idx)
-                else:
-                    free_blocks[idx] = (free_id + file_size, free_size - file_size)
-                break
+        disk[free_slice] = disk[file_slice]
+        disk[file_slice] = ["."] * file_size
+        free_space.remove(free.start, free.start + file_size)
 
 
 INPUT_S = """\
@@ -81,15 +78,3 @@ def read_input() -> str:
 if __name__ == "__main__":
     input_data = read_input()
     print("Answer is:     ", compute(input_data))
-
-    if "-b" in sys.argv:
-        number_of_runs = 100
-        bench_time = timeit.timeit(
-            "compute(data)",
-            setup="from __main__ import compute",
-            globals={"data": input_data},
-            number=number_of_runs,
-        )
-        print(f"{number_of_runs} runs took: {bench_time}s")
-        one_run = sup.humanized_seconds(bench_time / number_of_runs)
-        print(f"Average time:   {one_run}")
@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""Synthetic input: topographic map of slopes with heights 0-9."""
+from __future__ import annotations
+
+import math
+import random
+import sys
+
+BLOCK = 12
+
+
+def generate(size: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    side = max(math.isqrt(size), 4)
+    # each block is a slope in random direction, so there are a lot of trails
+    slopes_side = side // BLOCK + 1
+    slopes = [
+        [(rng.choice([-1, 1]), rng.choice([-1, 1])) for _ in range(slopes_side)]
+        for _ in range(slopes_side)
+    ]
+    rows = []
+    for m in range(side):
+        row = []
+        for n in range(side):
+            dm, dn = slopes[m // BLOCK][n // BLOCK]
+            if rng.random() < 0.1:
+                row.append(str(rng.randint(0, 9)))
+            else:
+                row.append(str((dm * m + dn * n) % 10))
+        rows.append("".join(row))
+    return "\n".join(rows) + "\n"
+
+
+if __name__ == "__main__":
+    print(generate(int(sys.argv[1])), end="")
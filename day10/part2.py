@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-import sys
-import timeit
 from pathlib import Path
 
 import pytest
@@ -13,6 +11,7 @@ INPUT_TXT = Path(__file__).parent / "input.txt"
 
 def compute(s: str) -> int:
     matrix = sup.Matrix.create_from_input(s, cast_func=int)
+    matrix.build_neighbor_index("cross")
 
     total = 0
     for m, row in enumerate(matrix):
@@ -75,15 +74,3 @@ def read_input() -> str:
 if __name__ == "__main__":
     input_data = read_input()
     print("Answer is:     ", compute(input_data))
-
-    if "-b" in sys.argv:
-        number_of_runs = 100
-        bench_time = timeit.timeit(
-            "compute(data)",
-            setup="from __main__ import compute",
-            globals={"data": input_data},
-            number=number_of_runs,
-        )
-        print(f"{number_of_runs} runs took: {bench_time}s")
-        one_run = sup.humanized_seconds(bench_time / number_of_runs)
-        print(f"Average time:   {one_run}")
@@ -0,0 +1,21 @@
+#!/usr/bin/env python3
+"""Synthetic input: one line of stones with up to 7 digits engraved."""
+from __future__ import annotations
+
+import random
+import sys
+
+
+def generate(size: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    stones = []
+    total = 0
+    while total < size:
+        stone = str(rng.randint(0, 10 ** rng.randint(1, 7) - 1))
+        stones.append(stone)
+        total += len(stone) + 1
+    return " ".join(stones) + "\n"
+
+
+if __name__ == "__main__":
+    print(generate(int(sys.argv[1])), end="")
@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""Synthetic input: garden of rectangular-ish plant regions with noise."""
+from __future__ import annotations
+
+import math
+import random
+import string
+import sys
+
+BLOCK = 8
+
+
+def generate(size: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    side = max(math.isqrt(size), 4)
+    blocks_side = side // BLOCK + 1
+    blocks = [
+        rng.choices(string.ascii_uppercase, k=blocks_side) for _ in range(blocks_side)
+    ]
+    rows = []
+    for m in range(side):
+        row = []
+        for n in range(side):
+            if rng.random() < 0.05:
+                row.append(rng.choice(string.ascii_uppercase))
+            else:
+                row.append(blocks[m // BLOCK][n // BLOCK])
+        rows.append("".join(row))
+    return "\n".join(rows) + "\n"
+
+
+if __name__ == "__main__":
+    print(generate(int(sys.argv[1])), end="")
@@ -1,8 +1,6 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
-import sys
-import timeit
 from pathlib import Path
 
 import pytest
@@ -14,6 +12,7 @@ INPUT_TXT = Path(__file__).parent / "input.txt"
 
 def compute(s: str) -> int:
     matrix = sup.Matrix.create_from_input(s)
+    matrix.build_neighbor_index("cross_diag_all")
     seen = set()
     total = 0
     for m, row in enumerate(matrix):
@@ -148,15 +147,3 @@ def read_input() -> str:
 if __name__ == "__main__":
     input_data = read_input()
     print("Answer is:     ", compute(input_data))
-
-    if "-b" in sys.argv:
-        number_of_runs = 100
-        bench_time = timeit.timeit(
-            "compute(data)",
-            setup="from __main__ import compute",
-            globals={"data": input_data},
-            number=number_of_runs,
-        )
-        print(f"{number_of_runs} runs took: {bench_time}s")
-        one_run = sup.humanized_seconds(bench_time / number_of_runs)
-        print(f"Average time:   {one_run}")
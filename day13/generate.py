@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""Synthetic input: claw machines, about a third of them winnable."""
+from __future__ import annotations
+
+import random
+import sys
+
+
+def generate(size: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    machines = []
+    for _ in range(max(size // 64, 1)):
+        ax, ay, bx, by = (rng.randint(10, 99) for _ in range(4))
+        if ax * by == ay * bx:
+            # solutions expect that buttons move claw in different directions
+            bx += 1
+        if rng.random() < 0.3:
+            a, b = rng.randint(1, 100), rng.randint(1, 100)
+            px, py = a * ax + b * bx, a * ay + b * by
+        else:
+            px, py = rng.randint(1000, 20000), rng.randint(1000, 20000)
+        machines.append(
+            f"Button A: X+{ax}, Y+{ay}\n"
+            f"Button B: X+{bx}, Y+{by}\n"
+            f"Prize: X={px}, Y={py}\n"
+        )
+    return "\n".join(machines)
+
+
+if __name__ == "__main__":
+    print(generate(int(sys.argv[1])), end="")
@@ -1,28 +1,30 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
-import sys
-import timeit
+from collections.abc import Iterable
+from itertools import chain
 from pathlib import Path
 
 import pytest
 
-import support as sup
-
 INPUT_TXT = Path(__file__).parent / "input.txt"
 
 
 def compute(s: str) -> int:
+    return compute_stream((line.encode() for line in s.splitlines()))
+
+
+def compute_stream(lines: Iterable[bytes]) -> int:
     button_a = None
     button_b = None
     prize = None
     total = 0
-    for line in s.splitlines() + [""]:
-        if line.startswith("Button A:"):
+    for line in chain(lines, [b""]):
+        if line.startswith(b"Button A:"):
             button_a = _parse_button(line)
-        elif line.startswith("Button B:"):
+        elif line.startswith(b"Button B:"):
             button_b = _parse_button(line)
-        elif line.startswith("Prize:"):
+        elif line.startswith(b"Prize:"):
             prize = _parse_prize(line)
         elif not line.strip():
             res = solve_equation(button_a, button_b, prize)
@@ -31,7 +33,7 @@ def compute(s: str) -> int:
             a, b = res
             total += a * 3 + b
         else:
-            raise ValueError(f"Unknown line: {line}")
+            raise ValueError(f"Unknown line: {line!r}")
 
     return int(total)
 
@@ -48,16 +50,16 @@ def solve_equation(button_a, button_b, prize) -> tuple[int, int] | None:
     return a, b
 
 
-def _parse_button(line: str) -> tuple[int, int]:
-    _, coords = line.split(": ")
-    coords = coords.replace("X", "").replace("Y", "")
-    return tuple(map(int, coords.split(", ")))
+def _parse_button(line: bytes) -> tuple[int, int]:
+    _, coords = line.split(b": ")
+    coords = coords.replace(b"X", b"").replace(b"Y", b"")
+    return tuple(map(int, coords.split(b", ")))
 
 
-def _parse_prize(line: str) -> tuple[int, int]:
-    _, coords = line.split(": ")
-    coords = coords.replace("X=", "").replace("Y=", "")
-    return tuple(map(int, coords.split(", ")))
+def _parse_prize(line: bytes) -> tuple[int, int]:
+    _, coords = line.split(b": ")
+    coords = coords.replace(b"X=", b"").replace(b"Y=", b"")
+    return tuple(map(int, coords.split(b", ")))
 
 
 INPUT_S = """\
@@ -104,15 +106,3 @@ def read_input() -> str:
 if __name__ == "__main__":
     input_data = read_input()
     print("Answer is:     ", compute(input_data))
-
-    if "-b" in sys.argv:
-        number_of_runs = 100
-        bench_time = timeit.timeit(
-            "compute(data)",
-            setup="from __main__ import compute",
-            globals={"data": input_data},
-            number=number_of_runs,
-        )
-        print(f"{number_of_runs} runs took: {bench_time}s")
-        one_run = sup.humanized_seconds(bench_time / number_of_runs)
-        print(f"Average time:   {one_run}")
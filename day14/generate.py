@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Synthetic input: robots on a room which grows with `size`.
+
+Part 2 looks for a moment when all robots are in unique positions,
+so robots are placed in unique positions after `UNIQUE_AFTER` seconds.
+"""
+from __future__ import annotations
+
+import math
+import random
+import sys
+
+UNIQUE_AFTER = 100
+
+
+def compute_kwargs(size: int) -> dict[str, int]:
+    robots = _robots_count(size)
+    side = max(math.isqrt(robots * 20), 11)
+    return {"width": side, "height": side + 2}
+
+
+def generate(size: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    kwargs = compute_kwargs(size)
+    width, height = kwargs["width"], kwargs["height"]
+    positions = rng.sample(range(width * height), _robots_count(size))
+    lines = []
+    for position in positions:
+        end_x, end_y = divmod(position, height)
+        vx, vy = rng.randint(-width // 2, width // 2), rng.randint(
+            -height // 2, height // 2
+        )
+        x = (end_x - vx * UNIQUE_AFTER) % width
+        y = (end_y - vy * UNIQUE_AFTER) % height
+        lines.append(f"p={x},{y} v={vx},{vy}")
+    return "\n".join(lines) + "\n"
+
+
+def _robots_count(size: int) -> int:
+    return max(size // 17, 2)
+
+
+if __name__ == "__main__":
+    print(generate(int(sys.argv[1])), end="")
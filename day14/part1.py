@@ -2,24 +2,25 @@
 from __future__ import annotations
 
 import math
-import sys
-import timeit
+from collections.abc import Iterable
 from pathlib import Path
 
 import pytest
 
-import support as sup
-
 INPUT_TXT = Path(__file__).parent / "input.txt"
 
 
 def compute(s: str, width: int = 101, height: int = 103) -> int:
+    return compute_stream((line.encode() for line in s.splitlines()), width, height)
+
+
+def compute_stream(lines: Iterable[bytes], width: int = 101, height: int = 103) -> int:
     quadrants_counters = [0, 0, 0, 0]
 
-    for line in s.splitlines():
-        first, second = line.split(" ")
-        start_x, start_y = map(int, first[2:].split(","))
-        velocity_x, velocity_y = map(int, second[2:].split(","))
+    for line in lines:
+        first, second = line.split(b" ")
+        start_x, start_y = map(int, first[2:].split(b","))
+        velocity_x, velocity_y = map(int, second[2:].split(b","))
         end_x, end_y = simulate(
             start_x, start_y, velocity_x, velocity_y, 100, width, height
         )
@@ -114,15 +115,3 @@ def read_input() -> str:
 if __name__ == "__main__":
     input_data = read_input()
     print("Answer is:     ", compute(input_data))
-
-    if "-b" in sys.argv:
-        number_of_runs = 100
-        bench_time = timeit.timeit(
-            "compute(data)",
-            setup="from __main__ import compute",
-            globals={"data": input_data},
-            number=number_of_runs,
-        )
-        print(f"{number_of_runs} runs took: {bench_time}s")
-        one_run = sup.humanized_seconds(bench_time / number_of_runs)
-        print(f"Average time:   {one_run}")
@@ -1,8 +1,6 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
-import sys
-import timeit
 from itertools import count
 from pathlib import Path
 
@@ -12,12 +10,13 @@ INPUT_TXT = Path(__file__).parent / "input.txt"
 
 
 def compute(s: str, width: int = 101, height: int = 103) -> int:
-    robots = []
-    for line in s.splitlines():
-        first, second = line.split(" ")
-        start_x, start_y = map(int, first[2:].split(","))
-        velocity_x, velocity_y = map(int, second[2:].split(","))
-        robots.append([start_x, start_y, velocity_x, velocity_y])
+    with sup.trace("parse"):
+        robots = []
+        for line in s.splitlines():
+            first, second = line.split(" ")
+            start_x, start_y = map(int, first[2:].split(","))
+            velocity_x, velocity_y = map(int, second[2:].split(","))
+            robots.append([start_x, start_y, velocity_x, velocity_y])
 
     for i in count(1):
         quadrants_counters = [0, 0, 0, 0]
@@ -108,15 +107,3 @@ def read_input() -> str:
 if __name__ == "__main__":
     input_data = read_input()
     print("Answer is:     ", compute(input_data))
-
-    if "-b" in sys.argv:
-        number_of_runs = 100
-        bench_time = timeit.timeit(
-            "compute(data)",
-            setup="from __main__ import compute",
-            globals={"data": input_data},
-            number=number_of_runs,
-        )
-        print(f"{number_of_runs} runs took: {bench_time}s")
-        one_run = sup.humanized_seconds(bench_time / number_of_runs)
-        print(f"Average time:   {one_run}")
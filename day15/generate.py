@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""Synthetic input: warehouse map with boxes and robot moves, half and half."""
+from __future__ import annotations
+
+import math
+import random
+import sys
+
+MOVES_LINE_LEN = 1000
+
+
+def generate(size: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    side = max(math.isqrt(size // 2), 5)
+    rows = [["#"] * side]
+    for _ in range(side - 2):
+        row = ["#"]
+        for _ in range(side - 2):
+            roll = rng.random()
+            row.append("O" if roll < 0.25 else "#" if roll < 0.3 else ".")
+        rows.append(row + ["#"])
+    rows.append(["#"] * side)
+    rows[side // 2][side // 2] = "@"
+
+    moves = rng.choices("<>^v", k=max(size // 2, 1))
+    lines = [
+        "".join(moves[i : i + MOVES_LINE_LEN])
+        for i in range(0, len(moves), MOVES_LINE_LEN)
+    ]
+    return "".join("".join(row) + "\n" for row in rows) + "\n" + "\n".join(lines) + "\n"
+
+
+if __name__ == "__main__":
+    print(generate(int(sys.argv[1])), end="")
@@ -1,8 +1,6 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
-import sys
-import timeit
 from pathlib import Path
 
 import pytest
@@ -21,23 +19,25 @@ instruction_to_direction = {
 
 
 def compute(s: str) -> int:
-    matrix_data = []
-    robot_pos = None
-    field, instructions = s.split("\n\n")
-    for m, line in enumerate(field.splitlines()):
-        row = []
-        for n, char in enumerate(line):
-            if char == "@":
-                robot_pos = [m, n]
-            row.append(char)
-        matrix_data.append(row)
-    matrix = sup.Matrix(matrix_data)
-
-    for instruction in instructions:
-        if instruction == "\n":
-            continue
-        direction = instruction_to_direction[instruction]
-        simulate(matrix, robot_pos, direction)
+    with sup.trace("parse"):
+        matrix_data = []
+        robot_pos = None
+        field, instructions = s.split("\n\n")
+        for m, line in enumerate(field.splitlines()):
+            row = []
+            for n, char in enumerate(line):
+                if char == "@":
+                    robot_pos = [m, n]
+                row.append(char)
+            matrix_data.append(row)
+        matrix = sup.Matrix(matrix_data)
+
+    with sup.trace("simulate"):
+        for instruction in instructions:
+            if instruction == "\n":
+                continue
+            direction = instruction_to_direction[instruction]
+            simulate(matrix, robot_pos, direction)
 
     return sum(get_gps_coordinates(matrix))
 
@@ -168,15 +168,3 @@ def read_input() -> str:
 if __name__ == "__main__":
     input_data = read_input()
     print("Answer is:     ", compute(input_data))
-
-    if "-b" in sys.argv:
-        number_of_runs = 100
-        bench_time = timeit.timeit(
-            "compute(data)",
-            setup="from __main__ import compute",
-            globals={"data": input_data},
-            number=number_of_runs,
-        )
-        print(f"{number_of_runs} runs took: {bench_time}s")
-        one_run = sup.humanized_seconds(bench_time / number_of_runs)
-        print(f"Average time:   {one_run}")
@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+"""Synthetic input: maze with loops, S in bottom left and E in top right."""
+from __future__ import annotations
+
+import math
+import random
+import sys
+
+import support as sup
+
+
+def generate(size: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    # odd, so corners are maze cells
+    side = max(math.isqrt(size), 5) | 1
+    maze = sup.random_maze(side, side, rng, loops=0.05)
+    maze[side - 2][1] = "S"
+    maze[1][side - 2] = "E"
+    return "".join("".join(row) + "\n" for row in maze)
+
+
+if __name__ == "__main__":
+    print(generate(int(sys.argv[1])), end="")
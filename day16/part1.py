@@ -2,8 +2,6 @@
 from __future__ import annotations
 
 import heapq
-import sys
-import timeit
 from pathlib import Path
 
 import pytest
@@ -14,19 +12,20 @@ INPUT_TXT = Path(__file__).parent / "input.txt"
 
 
 def compute(s: str) -> int:
-    matrix_data = []
-    start = None
-    end = None
-    for m, line in enumerate(s.splitlines()):
-        matrix_data.append([])
-        for n, char in enumerate(line):
-            matrix_data[m].append(char)
-            if char == "S":
-                start = (m, n)
-            elif char == "E":
-                end = (m, n)
-
-    matrix = sup.Matrix(matrix_data)
+    with sup.trace("parse"):
+        matrix_data = []
+        start = None
+        end = None
+        for m, line in enumerate(s.splitlines()):
+            matrix_data.append([])
+            for n, char in enumerate(line):
+                matrix_data[m].append(char)
+                if char == "S":
+                    start = (m, n)
+                elif char == "E":
+                    end = (m, n)
+
+        matrix = sup.Matrix(matrix_data)
 
     return search_shortest_path_score(matrix, start, end)
 
@@ -39,6 +38,7 @@ DIRECTIONS = [
 ]
 
 
+@sup.trace
 def search_shortest_path_score(
     matrix: sup.Matrix, start: tuple[int, int], end: tuple[int, int]
 ) -> int:
@@ -132,15 +132,3 @@ def read_input() -> str:
 if __name__ == "__main__":
     input_data = read_input()
     print("Answer is:     ", compute(input_data))
-
-    if "-b" in sys.argv:
-        number_of_runs = 100
-        bench_time = timeit.timeit(
-            "compute(data)",
-            setup="from __main__ import compute",
-            globals={"data": input_data},
-            number=number_of_runs,
-        )
-        print(f"{number_of_runs} runs took: {bench_time}s")
-        one_run = sup.humanized_seconds(bench_time / number_of_runs)
-        print(f"Average time:   {one_run}")
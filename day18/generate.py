@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Synthetic input: almost every cell of a square memory space except corners
+falls in random order, so part 2 always has an answer.
+"""
+from __future__ import annotations
+
+import math
+import random
+import sys
+
+BYTES_SHARE = 0.2
+
+
+def compute_kwargs(size: int) -> dict[str, int]:
+    # "m,n\n" takes ~6 bytes
+    side = max(math.isqrt(size // 6), 3)
+    return {"max_coord": side - 1, "bytes_count": int(side * side * BYTES_SHARE)}
+
+
+def generate(size: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    max_coord = compute_kwargs(size)["max_coord"]
+    cells = [
+        (m, n)
+        for m in range(max_coord + 1)
+        for n in range(max_coord + 1)
+        if (m, n) not in ((0, 0), (max_coord, max_coord))
+    ]
+    rng.shuffle(cells)
+    fallen = set()
+    lines = []
+    for m, n in cells:
+        neighbors = [
+            (m + dm, n + dn)
+            for dm, dn in ((-1, 0), (0, 1), (1, 0), (0, -1))
+            if 0 <= m + dm <= max_coord and 0 <= n + dn <= max_coord
+        ]
+        # solutions expect that byte doesn't fall in already isolated cell
+        if all(neighbor in fallen for neighbor in neighbors):
+            continue
+        fallen.add((m, n))
+        lines.append(f"{m},{n}\n")
+    return "".join(lines)
+
+
+if __name__ == "__main__":
+    print(generate(int(sys.argv[1])), end="")
@@ -1,8 +1,6 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
-import sys
-import timeit
 from pathlib import Path
 
 import pytest
@@ -13,27 +11,26 @@ INPUT_TXT = Path(__file__).parent / "input.txt"
 
 
 def compute(s: str, max_coord: int = 70, bytes_count: int = 1024) -> int:
+    return solve(parse(s, max_coord, bytes_count))
+
+
+def parse(
+    s: str, max_coord: int = 70, bytes_count: int = 1024
+) -> tuple[sup.CSRGraph, int, int]:
     coords = []
     for line in s.splitlines():
         coords.append(tuple(map(int, line.split(","))))
 
-    start = (0, 0)
-    end = (max_coord, max_coord)
-
-    grid = [["." for _ in range(max_coord + 1)] for _ in range(max_coord + 1)]
+    grid = sup.Grid.filled(max_coord + 1, max_coord + 1)
     for m, n in coords[:bytes_count]:
-        grid[m][n] = "#"
-    matrix = sup.Matrix(grid)
-
-    graph = {}
-    for i, row in enumerate(matrix):
-        for j, cell in enumerate(row):
-            for n_i, n_j in matrix.neighbors_cross(i, j):
-                if matrix[n_i][n_j] == "#":
-                    continue
-                graph.setdefault((i, j), {})[(n_i, n_j)] = 1
-
-    dest, _ = sup.dijkstra(graph, start)
+        grid[m][n] = ord("#")
+    graph = sup.grid_to_csr(grid, passable=lambda value: value != ord("#"))
+    return graph, graph.index(0, 0), graph.index(max_coord, max_coord)
+
+
+def solve(data: tuple[sup.CSRGraph, int, int]) -> int:
+    graph, start, end = data
+    dest, _ = sup.dial_shortest_path(graph, start)
     return dest[end]
 
 
@@ -91,15 +88,3 @@ def read_input() -> str:
 if __name__ == "__main__":
     input_data = read_input()
     print("Answer is:     ", compute(input_data))
-
-    if "-b" in sys.argv:
-        number_of_runs = 100
-        bench_time = timeit.timeit(
-            "compute(data)",
-            setup="from __main__ import compute",
-            globals={"data": input_data},
-            number=number_of_runs,
-        )
-        print(f"{number_of_runs} runs took: {bench_time}s")
-        one_run = sup.humanized_seconds(bench_time / number_of_runs)
-        print(f"Average time:   {one_run}")
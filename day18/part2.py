@@ -1,8 +1,6 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
-import sys
-import timeit
 from pathlib import Path
 
 import pytest
@@ -13,13 +11,16 @@ INPUT_TXT = Path(__file__).parent / "input.txt"
 
 
 def compute(s: str, max_coord: int = 70, bytes_count: int = 1024) -> str:
+    return solve(parse(s, max_coord, bytes_count))
+
+
+def parse(
+    s: str, max_coord: int = 70, bytes_count: int = 1024
+) -> tuple[sup.Matrix, dict, list[tuple[int, int]], tuple[int, int]]:
     coords = []
     for line in s.splitlines():
         coords.append(tuple(map(int, line.split(","))))
 
-    start = (0, 0)
-    end = (max_coord, max_coord)
-
     grid = [["." for _ in range(max_coord + 1)] for _ in range(max_coord + 1)]
     for m, n in coords[:bytes_count]:
         grid[m][n] = "#"
@@ -33,9 +34,15 @@ def compute(s: str, max_coord: int = 70, bytes_count: int = 1024) -> str:
                     continue
                 graph.setdefault((i, j), {})[(n_i, n_j)] = 1
 
-    for byte in coords[bytes_count:]:
+    return matrix, graph, coords[bytes_count:], (max_coord, max_coord)
+
+
+def solve(data: tuple[sup.Matrix, dict, list[tuple[int, int]], tuple[int, int]]) -> str:
+    matrix, graph, new_bytes, end = data
+    start = (0, 0)
+    for byte in new_bytes:
         add_new_byte(byte, matrix, graph)
-        _, prev = sup.dijkstra(graph, start)
+        _, prev = sup.dijkstra(graph, start, target=end)
         if prev.get(end) is None:
             return f"{byte[0]},{byte[1]}"
 
@@ -107,15 +114,3 @@ def read_input() -> str:
 if __name__ == "__main__":
     input_data = read_input()
     print("Answer is:     ", compute(input_data))
-
-    if "-b" in sys.argv:
-        number_of_runs = 10
-        bench_time = timeit.timeit(
-            "compute(data)",
-            setup="from __main__ import compute",
-            globals={"data": input_data},
-            number=number_of_runs,
-        )
-        print(f"{number_of_runs} runs took: {bench_time}s")
-        one_run = sup.humanized_seconds(bench_time / number_of_runs)
-        print(f"Average time:   {one_run}")
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""Synthetic input: towel patterns and designs, about half are possible."""
+from __future__ import annotations
+
+import random
+import sys
+
+COLORS = "wubrg"
+
+
+def generate(size: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    towels_count = max(size // 50, 5)
+    towels = {
+        "".join(rng.choices(COLORS, k=rng.randint(1, 8))) for _ in range(towels_count)
+    }
+    # without single "r" towel a lot of designs are impossible, like in real input
+    towels.discard("r")
+    towels = sorted(towels)
+
+    designs = []
+    total = sum(len(towel) + 2 for towel in towels)
+    while total < size:
+        if rng.random() < 0.5:
+            design = ""
+            while len(design) < 20:
+                design += rng.choice(towels)
+        else:
+            design = "".join(rng.choices(COLORS, k=rng.randint(20, 60)))
+        designs.append(design)
+        total += len(design) + 1
+    return ", ".join(towels) + "\n\n" + "\n".join(designs) + "\n"
+
+
+if __name__ == "__main__":
+    print(generate(int(sys.argv[1])), end="")
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""Synthetic input: racetrack, single path from S to E through a maze."""
+from __future__ import annotations
+
+import math
+import random
+import sys
+
+import support as sup
+
+
+def generate(size: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    # odd, so corners are maze cells
+    side = max(math.isqrt(size), 5) | 1
+    maze = sup.random_maze(side, side, rng)
+    start, end = (side - 2, 1), (1, side - 2)
+    prev = sup.bfs(_maze_graph(maze), start)
+    track = set()
+    node = end
+    while node is not None:
+        track.add(node)
+        node = prev[node]
+
+    rows = []
+    for m, row in enumerate(maze):
+        rows.append("".join("." if (m, n) in track else "#" for n in range(len(row))))
+    rows[start[0]] = rows[start[0]][: start[1]] + "S" + rows[start[0]][start[1] + 1 :]
+    rows[end[0]] = rows[end[0]][: end[1]] + "E" + rows[end[0]][end[1] + 1 :]
+    return "\n".join(rows) + "\n"
+
+
+def _maze_graph(maze: list[list[str]]) -> dict[tuple[int, int], dict]:
+    matrix = sup.Matrix(maze)
+    return {
+        (m, n): {
+            coords: 1
+            for coords in matrix.neighbors_cross(m, n)
+            if matrix[coords[0]][coords[1]] != "#"
+        }
+        for m, row in enumerate(matrix)
+        for n, cell in enumerate(row)
+        if cell != "#"
+    }
+
+
+if __name__ == "__main__":
+    print(generate(int(sys.argv[1])), end="")
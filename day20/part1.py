@@ -1,8 +1,6 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
-import sys
-import timeit
 from pathlib import Path
 
 import pytest
@@ -24,18 +22,16 @@ def compute(s: str, min_save: int = 100) -> int:
         matrix_data.append(list(line))
 
     matrix = sup.Matrix(matrix_data)
-    graph = make_graph(matrix, start)
-
-    from_start_dist, from_start_prev = sup.dijkstra(graph, start)
-    to_end_dist, to_end_prev = sup.dijkstra(graph, end)
+    from_start_dist = sup.distance_field(matrix, [start], passable=is_track)
+    to_end_dist = sup.distance_field(matrix, [end], passable=is_track)
     candidates = get_candidates(matrix)
-    optimal_path_len = from_start_dist[end]
+    optimal_path_len = from_start_dist[index(matrix, end)]
 
     cheats = set()
     for from_start, obstacle, to_end in candidates:
-        from_start_val = from_start_dist.get(from_start)
-        to_end_val = to_end_dist.get(to_end)
-        if from_start_val is None or to_end_val is None:
+        from_start_val = from_start_dist[index(matrix, from_start)]
+        to_end_val = to_end_dist[index(matrix, to_end)]
+        if sup.UNREACHABLE in (from_start_val, to_end_val):
             continue
 
         new_path_len = from_start_val + to_end_val + 1
@@ -45,6 +41,15 @@ def compute(s: str, min_save: int = 100) -> int:
     return len(cheats)
 
 
+def is_track(char: str) -> bool:
+    return char != "#"
+
+
+def index(matrix: sup.Matrix, coords: tuple[int, int]) -> int:
+    m, n = coords
+    return m * matrix.n_len + n
+
+
 DIRECTION_PAIRS = [
     (sup.Direction.UP, sup.Direction.DOWN),
     (sup.Direction.DOWN, sup.Direction.UP),
@@ -74,30 +79,6 @@ def get_candidates(
     return candidates
 
 
-def parse_path(prev, end) -> list[tuple[int, int]]:
-    path = []
-    while end:
-        path.append(end)
-        end = prev[end]
-    return path[::-1]
-
-
-def make_graph(
-    matrix: sup.Matrix, start: tuple[int, int]
-) -> dict[tuple[int, int], dict[tuple[int, int], int]]:
-    graph = {}
-    stack = [start]
-    while stack:
-        m, n = stack.pop()
-        for n_m, n_n in matrix.neighbors_cross(m, n):
-            if matrix[n_m][n_n] == "#":
-                continue
-            graph.setdefault((m, n), {})[(n_m, n_n)] = 1
-            if (n_m, n_n) not in graph:
-                stack.append((n_m, n_n))
-    return graph
-
-
 INPUT_S = """\
 ###############
 #...#...#.....#
@@ -142,15 +123,3 @@ def read_input() -> str:
 if __name__ == "__main__":
     input_data = read_input()
     print("Answer is:     ", compute(input_data))
-
-    if "-b" in sys.argv:
-        number_of_runs = 100
-        bench_time = timeit.timeit(
-            "compute(data)",
-            setup="from __main__ import compute",
-            globals={"data": input_data},
-            number=number_of_runs,
-        )
-        print(f"{number_of_runs} runs took: {bench_time}s")
-        one_run = sup.humanized_seconds(bench_time / number_of_runs)
-        print(f"Average time:   {one_run}")
@@ -0,0 +1,15 @@
+#!/usr/bin/env python3
+"""Synthetic input: initial secret numbers of buyers, one per line."""
+from __future__ import annotations
+
+import random
+import sys
+
+
+def generate(size: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    return "".join(f"{rng.randint(1, 16777215)}\n" for _ in range(max(size // 8, 1)))
+
+
+if __name__ == "__main__":
+    print(generate(int(sys.argv[1])), end="")
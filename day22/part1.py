@@ -1,8 +1,7 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
-import sys
-import timeit
+from collections.abc import Iterable
 from pathlib import Path
 
 import pytest
@@ -13,9 +12,21 @@ INPUT_TXT = Path(__file__).parent / "input.txt"
 
 
 def compute(s: str) -> int:
+    return compute_stream((line.encode() for line in s.splitlines()))
+
+
+def compute_stream(lines: Iterable[bytes]) -> int:
+    return sum(sup.map_batches(resolve_batch, lines, BATCH_SIZE))
+
+
+# each secret takes ~2ms, so batches of this size are worth sending to pool
+BATCH_SIZE = 200
+
+
+def resolve_batch(lines: list[bytes]) -> int:
     total = 0
-    for num in sup.iter_lines_as_numbers(s):
-        total += resolve_secret(num, 2000)
+    for line in lines:
+        total += resolve_secret(int(line), 2000)
     return total
 
 
@@ -65,15 +76,3 @@ def read_input() -> str:
 if __name__ == "__main__":
     input_data = read_input()
     print("Answer is:     ", compute(input_data))
-
-    if "-b" in sys.argv:
-        number_of_runs = 100
-        bench_time = timeit.timeit(
-            "compute(data)",
-            setup="from __main__ import compute",
-            globals={"data": input_data},
-            number=number_of_runs,
-        )
-        print(f"{number_of_runs} runs took: {bench_time}s")
-        one_run = sup.humanized_seconds(bench_time / number_of_runs)
-        print(f"Average time:   {one_run}")
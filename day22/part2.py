@@ -1,9 +1,8 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
-import sys
-import timeit
 from collections import Counter
+from collections.abc import Iterable
 from pathlib import Path
 
 import pytest
@@ -14,8 +13,25 @@ INPUT_TXT = Path(__file__).parent / "input.txt"
 
 
 def compute(s: str) -> int:
+    return compute_stream((line.encode() for line in s.splitlines()))
+
+
+def compute_stream(lines: Iterable[bytes]) -> int:
+    prices_map = Counter()
+    for batch_prices_map in sup.map_batches(collect_prices, lines, BATCH_SIZE):
+        prices_map.update(batch_prices_map)
+    return prices_map.most_common(1)[0][1]
+
+
+# each secret takes ~7ms, so batches of this size are worth sending to pool
+BATCH_SIZE = 200
+
+
+def collect_prices(lines: list[bytes]) -> Counter:
+    """Sum of first prices of every changes sequence for secrets in `lines`."""
     prices_map = Counter()
-    for num in sup.iter_lines_as_numbers(s):
+    for line in lines:
+        num = int(line)
         local_prices_map = {}
         prices = resolve_secret(num, 2000)
         i = 4
@@ -25,7 +41,7 @@ def compute(s: str) -> int:
                 local_prices_map[key] = prices[i][0]
             i += 1
         prices_map.update(local_prices_map)
-    return prices_map.most_common(1)[0][1]
+    return prices_map
 
 
 def resolve_secret(secret: int, steps: int) -> list[tuple[int, int]]:
@@ -79,15 +95,3 @@ def read_input() -> str:
 if __name__ == "__main__":
     input_data = read_input()
     print("Answer is:     ", compute(input_data))
-
-    if "-b" in sys.argv:
-        number_of_runs = 10
-        bench_time = timeit.timeit(
-            "compute(data)",
-            setup="from __main__ import compute",
-            globals={"data": input_data},
-            number=number_of_runs,
-        )
-        print(f"{number_of_runs} runs took: {bench_time}s")
-        one_run = sup.humanized_seconds(bench_time / number_of_runs)
-        print(f"Average time:   {one_run}")
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Synthetic input: network map with average degree 13 and one planted
+clique of 13 computers, like in real input.
+"""
+from __future__ import annotations
+
+import random
+import string
+import sys
+
+DEGREE = 13
+
+
+def generate(size: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    edges_count = max(size // 6, DEGREE * DEGREE)
+    nodes = _names(max(edges_count * 2 // DEGREE, DEGREE + 1))
+    clique = rng.sample(nodes, DEGREE)
+    # dict to keep order stable, set order depends on string hashes
+    edges = dict.fromkeys(
+        (first, second) for i, first in enumerate(clique) for second in clique[i + 1 :]
+    )
+    while len(edges) < edges_count:
+        first, second = rng.sample(nodes, 2)
+        if (second, first) not in edges:
+            edges[(first, second)] = None
+    lines = [f"{first}-{second}" for first, second in edges]
+    rng.shuffle(lines)
+    return "\n".join(lines) + "\n"
+
+
+def _names(count: int) -> list[str]:
+    """Two letter names, longer ones when they are over."""
+    length = 2
+    while len(string.ascii_lowercase) ** length < count:
+        length += 1
+    names = []
+    for i in range(count):
+        name = ""
+        for _ in range(length):
+            i, letter = divmod(i, len(string.ascii_lowercase))
+            name += string.ascii_lowercase[letter]
+        names.append(name)
+    return names
+
+
+if __name__ == "__main__":
+    print(generate(int(sys.argv[1])), end="")
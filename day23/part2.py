@@ -1,8 +1,6 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
-import sys
-import timeit
 from pathlib import Path
 
 import pytest
@@ -18,8 +16,7 @@ def compute(s: str) -> str:
         copm1, comp2 = line.split("-")
         graph_finder.add_edge(copm1, comp2)
 
-    max_cycle = max(graph_finder.find_cycles(), key=len)
-    return ",".join(sorted(max_cycle))
+    return ",".join(sorted(graph_finder.max_clique()))
 
 
 INPUT_S = """\
@@ -57,15 +54,3 @@ def read_input() -> str:
 if __name__ == "__main__":
     input_data = read_input()
     print("Answer is:     ", compute(input_data))
-
-    if "-b" in sys.argv:
-        number_of_runs = 10
-        bench_time = timeit.timeit(
-            "compute(data)",
-            setup="from __main__ import compute",
-            globals={"data": input_data},
-            number=number_of_runs,
-        )
-        print(f"{number_of_runs} runs took: {bench_time}s")
-        one_run = sup.humanized_seconds(bench_time / number_of_runs)
-        print(f"Average time:   {one_run}")
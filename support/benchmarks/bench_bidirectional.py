@@ -0,0 +1,61 @@
+"""
+Compare one-sided and bidirectional point-to-point searches on open grid.
+
+    python bench_bidirectional.py [size]
+"""
+
+from __future__ import annotations
+
+import sys
+import timeit
+
+import support as sup
+
+
+class CountingGraph(dict):
+    expansions = 0
+
+    def __getitem__(self, key):
+        self.expansions += 1
+        return super().__getitem__(key)
+
+
+def bench(label: str, func) -> None:
+    graph.expansions = 0
+    result = None
+
+    def run():
+        nonlocal result
+        result = func()
+
+    run_time = timeit.timeit(run, number=1)
+    expanded = getattr(result, "expanded", graph.expansions)
+    print(f"| {label:<24} | {sup.humanized_seconds(run_time):>8} | {expanded:>8} |")
+
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    matrix = sup.Matrix([[0] * size for _ in range(size)])
+    graph = CountingGraph(
+        {
+            (m, n): {coords: 1 for coords in matrix.neighbors_cross(m, n)}
+            for m in range(size)
+            for n in range(size)
+        }
+    )
+    source, target = (size // 2, size // 3), (size // 2, size * 2 // 3)
+    manhattan = sup.cartesian_shortest_path
+
+    print(f"Grid {size}x{size}, {source} -> {target}")
+    print("| Search                   | Time     | Expanded |")
+    print("|--------------------------|----------|----------|")
+    bench("dijkstra", lambda: sup.dijkstra(graph, source, target=target))
+    bench("a_star", lambda: sup.a_star(graph, source, target, manhattan))
+    bench(
+        "bidirectional_dijkstra",
+        lambda: sup.bidirectional_dijkstra(graph, source, target, graph),
+    )
+    bench(
+        "bidirectional_a_star",
+        lambda: sup.bidirectional_a_star(graph, source, target, manhattan, graph),
+    )
@@ -0,0 +1,37 @@
+"""
+Compare Matrix.neighbors_* with and without precomputed neighbor index.
+
+    python bench_neighbors.py [size]
+"""
+
+from __future__ import annotations
+
+import sys
+import timeit
+
+import support as sup
+
+
+def walk(matrix: sup.Matrix) -> int:
+    total = 0
+    for m in range(matrix.m_len):
+        for n in range(matrix.n_len):
+            for _ in matrix.neighbors_cross(m, n):
+                total += 1
+    return total
+
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    matrix = sup.Matrix([[0] * size for _ in range(size)])
+    print(f"Grid:           {size}x{size}")
+
+    generators_time = timeit.timeit(lambda: walk(matrix), number=1)
+    print(f"Generators:     {sup.humanized_seconds(generators_time)}")
+
+    build_time = timeit.timeit(lambda: matrix.build_neighbor_index("cross"), number=1)
+    print(f"Index build:    {sup.humanized_seconds(build_time)}")
+
+    indexed_time = timeit.timeit(lambda: walk(matrix), number=1)
+    print(f"Indexed:        {sup.humanized_seconds(indexed_time)}")
+    print(f"Speedup:        {generators_time / indexed_time:.2f}x")
@@ -0,0 +1,111 @@
+"""
+Compare bytes-based input helpers with str-based parsing.
+
+    python bench_parse_ints.py [size_mb]
+
+Synthetic inputs are written to a temporary directory: day01-like
+pairs of numbers, one number per line and a square digit grid.
+Every variant reads the file itself, so decoding is included.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+import sys
+import tempfile
+import timeit
+import tracemalloc
+from pathlib import Path
+
+import support as sup
+
+
+def make_pairs(size: int) -> bytes:
+    rnd = random.Random(42)
+    lines = []
+    total = 0
+    while total < size:
+        line = f"{rnd.randrange(10**5)}   {rnd.randrange(10**5)}\n"
+        lines.append(line)
+        total += len(line)
+    return "".join(lines).encode()
+
+
+def make_numbers(size: int) -> bytes:
+    rnd = random.Random(42)
+    lines = []
+    total = 0
+    while total < size:
+        line = f"{rnd.randrange(2**24)}\n"
+        lines.append(line)
+        total += len(line)
+    return "".join(lines).encode()
+
+
+def make_digits(size: int) -> bytes:
+    rnd = random.Random(42)
+    side = math.isqrt(size)
+    return b"".join(
+        bytes(rnd.choices(b"0123456789", k=side)) + b"\n" for _ in range(side)
+    )
+
+
+def read_text(path: Path) -> str:
+    with open(path) as f:
+        return f.read()
+
+
+def split_pairs(path: Path) -> int:
+    result = []
+    for line in read_text(path).splitlines():
+        result.extend(map(int, line.split("   ")))
+    return len(result)
+
+
+def lines_as_numbers(path: Path) -> int:
+    return len(list(sup.iter_lines_as_numbers(read_text(path))))
+
+
+def create_from_input(path: Path) -> int:
+    return len(sup.Grid.create_from_input(read_text(path), digits=True).data)
+
+
+def ints(path: Path) -> int:
+    return len(sup.ints(sup.read_input_bytes(path)))
+
+
+def int_grid(path: Path) -> int:
+    return len(sup.int_grid(sup.read_input_bytes(path)).data)
+
+
+def measure(func, path: Path) -> tuple[float, int]:
+    seconds = min(timeit.repeat(lambda: func(path), number=1, repeat=3))
+    tracemalloc.start()
+    func(path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return seconds, peak
+
+
+if __name__ == "__main__":
+    size = int(float(sys.argv[1]) * 1024 * 1024) if len(sys.argv) > 1 else 8 << 20
+    cases = (
+        ("pairs", make_pairs, (split_pairs, ints)),
+        ("numbers", make_numbers, (lines_as_numbers, ints)),
+        ("digit grid", make_digits, (create_from_input, int_grid)),
+    )
+    print(f"Input size: {sup.humanized_bytes(size)}")
+    print("| Input      | Helper            | Time     | Peak memory |")
+    print("|------------|-------------------|----------|-------------|")
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, make, funcs in cases:
+            path = Path(tmp) / "input.txt"
+            path.write_bytes(make(size))
+            for func in funcs:
+                seconds, peak = measure(func, path)
+                print(
+                    f"| {name:<10} | {func.__name__:<17} "
+                    f"| {sup.humanized_seconds(seconds):>8} "
+                    f"| {sup.humanized_bytes(peak):>11} |"
+                )
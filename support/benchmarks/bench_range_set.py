@@ -0,0 +1,82 @@
+"""
+Compare RangeSet with naive list of Range objects.
+
+    python bench_range_set.py [size]
+
+Naive version is quadratic, so it runs on at most 10^4 intervals.
+One by one `add` shifts the tail of the arrays, so it runs on at most 10^5.
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import timeit
+
+import support as sup
+
+NAIVE_MAX_SIZE = 10_000
+ADD_MAX_SIZE = 100_000
+
+
+def make_intervals(size: int) -> list[tuple[int, int]]:
+    rnd = random.Random(42)
+    result = []
+    for _ in range(size):
+        start = rnd.randrange(size * 20)
+        result.append((start, start + rnd.randrange(1, 20)))
+    return result
+
+
+def naive_add(ranges: list[sup.Range], new: sup.Range) -> list[sup.Range]:
+    result = []
+    for item in ranges:
+        if item.has_intersection(new) or item.end == new.start or new.end == item.start:
+            new = sup.Range(min(item.start, new.start), max(item.end, new.end))
+        else:
+            result.append(item)
+    result.append(new)
+    return result
+
+
+def naive(intervals, points) -> int:
+    ranges = []
+    for start, end in intervals:
+        ranges = naive_add(ranges, sup.Range(start, end))
+    return sum(any(point in item for item in ranges) for point in points)
+
+
+def range_set(intervals, points) -> int:
+    result = sup.RangeSet()
+    for start, end in intervals:
+        result.add(start, end)
+    return sum(result.contains(point) for point in points)
+
+
+def range_set_bulk(intervals, points) -> int:
+    result = sup.RangeSet(sup.Range(start, end) for start, end in intervals)
+    return sum(result.contains(point) for point in points)
+
+
+if __name__ == "__main__":
+    max_size = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    print("| Intervals | Naive    | RangeSet.add | RangeSet bulk |")
+    print("|-----------|----------|--------------|---------------|")
+    size = 1000
+    while size <= max_size:
+        intervals = make_intervals(size)
+        points = [start for start, _ in make_intervals(1000)]
+        results = []
+        for func, limit in (
+            (naive, NAIVE_MAX_SIZE),
+            (range_set, ADD_MAX_SIZE),
+            (range_set_bulk, max_size),
+        ):
+            if size > limit:
+                results.append("-")
+                continue
+            seconds = timeit.timeit(lambda: func(intervals, points), number=1)
+            results.append(sup.humanized_seconds(seconds))
+        naive_time, add_time, bulk_time = results
+        print(f"| {size:>9} | {naive_time:>8} | {add_time:>12} | {bulk_time:>13} |")
+        size *= 10
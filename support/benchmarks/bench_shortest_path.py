@@ -0,0 +1,84 @@
+"""
+Compare heapq-based dijkstra with bucket queue (Dial) on real inputs.
+
+    python bench_shortest_path.py
+"""
+
+from __future__ import annotations
+
+import timeit
+from pathlib import Path
+
+import support as sup
+
+ROOT = Path(__file__).parents[2]
+NUMBER_OF_RUNS = 10
+
+
+def read_matrix(day: str) -> sup.Matrix:
+    s = (ROOT / day / "input.txt").read_text()
+    return sup.Matrix.create_from_input(s)
+
+
+def find(matrix: sup.Matrix, char: str) -> tuple[int, int]:
+    for m, row in enumerate(matrix):
+        for n, value in enumerate(row):
+            if value == char:
+                return m, n
+    raise ValueError(f"{char=} not found")
+
+
+def day16_graph() -> tuple[dict, tuple, None]:
+    """States are (m, n, direction index): step costs 1, turn costs 1000."""
+    matrix = read_matrix("day16")
+    graph = {}
+    for m, row in enumerate(matrix):
+        for n, char in enumerate(row):
+            if char == "#":
+                continue
+            for i in range(4):
+                dm, dn = ((-1, 0), (0, 1), (1, 0), (0, -1))[i]
+                edges = {(m, n, (i + 1) % 4): 1000, (m, n, (i - 1) % 4): 1000}
+                if matrix[m + dm][n + dn] != "#":
+                    edges[(m + dm, n + dn, i)] = 1
+                graph[(m, n, i)] = edges
+    return graph, (*find(matrix, "S"), 1), None
+
+
+def day18_matrix() -> tuple[sup.Matrix, tuple[int, int]]:
+    grid = [["."] * 71 for _ in range(71)]
+    for line in (ROOT / "day18" / "input.txt").read_text().splitlines()[:1024]:
+        m, n = map(int, line.split(","))
+        grid[m][n] = "#"
+    return sup.Matrix(grid), (0, 0)
+
+
+def day20_matrix() -> tuple[sup.Matrix, tuple[int, int]]:
+    matrix = read_matrix("day20")
+    return matrix, find(matrix, "S")
+
+
+def bench(label: str, graph, source) -> None:
+    heap_time = timeit.timeit(
+        lambda: sup.dijkstra(graph, source), number=NUMBER_OF_RUNS
+    )
+    dial_time = timeit.timeit(
+        lambda: sup.dial_shortest_path(graph, source), number=NUMBER_OF_RUNS
+    )
+    print(
+        f"| {label:<10} | {sup.humanized_seconds(heap_time / NUMBER_OF_RUNS):>8} "
+        f"| {sup.humanized_seconds(dial_time / NUMBER_OF_RUNS):>8} "
+        f"| {heap_time / dial_time:>6.2f}x |"
+    )
+
+
+if __name__ == "__main__":
+    print("| Graph      | heapq    | Dial     | Speedup |")
+    print("|------------|----------|----------|---------|")
+    bench("day16", *day16_graph()[:2])
+    for label, (matrix, source) in (
+        ("day18", day18_matrix()),
+        ("day20", day20_matrix()),
+    ):
+        csr = sup.grid_to_csr(matrix, passable=lambda char: char != "#")
+        bench(f"{label} CSR", csr, csr.index(*source))
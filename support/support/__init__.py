@@ -0,0 +1,183 @@
+"""
+Helpers for solutions, used as `import support as sup`.
+
+Names are imported from submodules on first access, so a day which needs
+only `sup.Matrix` doesn't import benchmark, multiprocessing and HTTP code
+(neither do processes spawned by its pool).
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import Any
+
+_SUBMODULES = {
+    "io": [
+        "humanized_seconds",
+        "humanized_bytes",
+        "print_matrix",
+        "iter_lines_as_numbers",
+        "read_input_bytes",
+        "ints",
+        "int_grid",
+    ],
+    "net": [
+        "get_input",
+        "get_year_day",
+        "download_input",
+        "TOO_QUICK",
+        "WRONG",
+        "RIGHT",
+        "ALREADY_DONE",
+        "submit_solution",
+        "submit_25_pt2",
+    ],
+    "tracing": [
+        "TRACE_ENV",
+        "SpanNode",
+        "Tracer",
+        "TRACER",
+        "Span",
+        "trace",
+        "enable_trace",
+        "trace_report",
+        "write_chrome_trace",
+    ],
+    "ranges": ["Range", "RangeSet"],
+    "grid": [
+        "Vector2D",
+        "Direction",
+        "Coords",
+        "inf_coords",
+        "CROSS_OFFSETS",
+        "DIAG_OFFSETS",
+        "ALL_OFFSETS",
+        "NEIGHBOR_OFFSETS",
+        "NeighborIndex",
+        "Matrix",
+        "DIGITS_TO_VALUES",
+        "Grid",
+        "filter_neighbors",
+        "cartesian_shortest_path",
+        "random_maze",
+    ],
+    "graph": [
+        "UNREACHABLE",
+        "CSRGraph",
+        "grid_to_csr",
+        "distance_field",
+        "path_order",
+        "bfs",
+        "dijkstra",
+        "dial_shortest_path",
+        "a_star",
+        "reversed_graph",
+        "BidirectionalSearchResult",
+        "bidirectional_dijkstra",
+        "bidirectional_a_star",
+        "CycleError",
+        "topological_sort",
+        "topological_sort_many",
+        "iter_bits",
+        "GraphCycleFinder",
+    ],
+    "days": [
+        "ROOT",
+        "DAY_DIR_RE",
+        "PART_FILE_RE",
+        "Part",
+        "discover_parts",
+        "import_part",
+        "import_day_module",
+    ],
+    "cache": [
+        "PARSED_CACHE_DIR",
+        "parsed_input_cache",
+        "ANSWER_CACHE_DIR",
+        "ANSWER_CACHE_MAX_SIZE",
+        "file_digest",
+        "code_digest",
+        "support_digest",
+        "AnswerCache",
+        "cached_compute",
+    ],
+    "bench": [
+        "Stats",
+        "measure",
+        "AllocationSite",
+        "MemoryStats",
+        "BenchResult",
+        "has_parse_solve",
+        "bench_part",
+        "memory_part",
+        "interpreter_name",
+        "make_report",
+        "format_markdown",
+        "format_markdown_comparison",
+        "baseline_path",
+        "load_report",
+        "save_baseline",
+        "Comparison",
+        "compare_reports",
+        "format_markdown_regressions",
+        "DEFAULT_INPUT_SIZE",
+        "import_generator",
+        "input_size",
+        "fit_exponent",
+        "ScalingResult",
+        "geometric_factors",
+        "scale_part",
+        "format_markdown_scaling",
+        "scaling_main",
+        "frame_label",
+        "StackSampler",
+        "cprofile_collapsed",
+        "profile_part",
+        "profile_main",
+        "bench_main",
+    ],
+    "runner": [
+        "RunResult",
+        "run_part",
+        "run_parts",
+        "run_timings_path",
+        "load_past_timings",
+        "save_run_timings",
+        "RUN_TABLE_HEADER",
+        "format_run_row",
+        "format_markdown_run",
+        "current_day",
+        "run_main",
+        "aoc_main",
+    ],
+    "parallel": [
+        "MAX_WORKERS_ENV",
+        "max_workers",
+        "pool_chunksize",
+        "WorkerPool",
+        "pool",
+        "SharedGrid",
+        "shared_grid",
+    ],
+    "stream": [
+        "STREAM_CHUNK_SIZE",
+        "iter_chunks",
+        "iter_lines",
+        "iter_blocks",
+        "map_batches",
+    ],
+}
+_NAMES = {name: module for module, names in _SUBMODULES.items() for name in names}
+
+
+def __getattr__(name: str) -> Any:
+    module = _NAMES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_NAMES})
@@ -0,0 +1,883 @@
+"""Benchmarks of day parts: timings, memory, scaling and profiles (`aoc-bench`)."""
+
+from __future__ import annotations
+
+import argparse
+import cProfile
+import json
+import math
+import multiprocessing
+import os.path
+import platform
+import pstats
+import signal
+import statistics
+import sys
+import time
+import tracemalloc
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from types import ModuleType
+from typing import Any, Callable, Iterable, NamedTuple
+
+from support.cache import PARSED_CACHE_DIR, parsed_input_cache
+from support.days import ROOT, Part, discover_parts, import_day_module, import_part
+from support.io import humanized_bytes, humanized_seconds
+
+
+class Stats(NamedTuple):
+    runs: int
+    min: float
+    median: float
+    p95: float
+    # 95% confidence interval of the median
+    ci_low: float
+    ci_high: float
+
+    @classmethod
+    def from_samples(cls, samples: list[float]) -> Stats:
+        """
+        Median CI is distribution-free, from order statistics:
+        https://en.wikipedia.org/wiki/Median#Confidence_intervals
+        """
+        data = sorted(samples)
+        n = len(data)
+        spread = 0.98 * math.sqrt(n)  # 1.96 * sqrt(n) / 2
+        low = max(math.floor(n / 2 - spread), 0)
+        high = min(math.ceil(n / 2 + spread), n - 1)
+        return cls(
+            runs=n,
+            min=data[0],
+            median=statistics.median(data),
+            p95=data[max(math.ceil(0.95 * n) - 1, 0)],
+            ci_low=data[low],
+            ci_high=data[high],
+        )
+
+
+def measure(
+    func: Callable[..., Any],
+    *,
+    setup: Callable[[], Any] | None = None,
+    min_time: float = 1.0,
+    max_time: float = 20.0,
+    min_runs: int = 5,
+    max_runs: int = 1000,
+) -> tuple[Any, list[float]]:
+    """
+    Call `func` until it has run for `min_time` seconds and `min_runs` times.
+
+    Slow functions stop after `max_time` seconds (but run at least once),
+    fast ones after `max_runs` runs. When there is `setup`, its result
+    is passed to `func` and isn't timed.
+    :return: result of the last call and duration of every call
+    """
+    samples = []
+    total = 0.0
+    result = None
+    while len(samples) < max_runs and (total < min_time or len(samples) < min_runs):
+        if samples and total >= max_time:
+            break
+        args = () if setup is None else (setup(),)
+        start = time.perf_counter()
+        result = func(*args)
+        elapsed = time.perf_counter() - start
+        samples.append(elapsed)
+        total += elapsed
+    return result, samples
+
+
+class AllocationSite(NamedTuple):
+    site: str
+    size: int
+    count: int
+
+
+class MemoryStats(NamedTuple):
+    # whole process high-water mark, None where `resource` is unavailable
+    peak_rss: int | None
+    peak_traced: int
+    top: list[AllocationSite]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {**self._asdict(), "top": [site._asdict() for site in self.top]}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> MemoryStats:
+        return cls(
+            peak_rss=data["peak_rss"],
+            peak_traced=data["peak_traced"],
+            top=[AllocationSite(**site) for site in data["top"]],
+        )
+
+
+class BenchResult(NamedTuple):
+    part: Part
+    answer: str
+    # `read_input()` only, parsing is in `compute`
+    read: Stats
+    compute: Stats
+    memory: MemoryStats | None = None
+    # `solve` without `parse`, for days which have them
+    solve: Stats | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        result = {
+            "day": self.part.day,
+            "part": self.part.part,
+            "answer": self.answer,
+            "read": self.read._asdict(),
+            "compute": self.compute._asdict(),
+        }
+        if self.memory is not None:
+            result["memory"] = self.memory.to_dict()
+        if self.solve is not None:
+            result["solve"] = self.solve._asdict()
+        return result
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> BenchResult:
+        return cls(
+            part=Part(data["day"], data["part"]),
+            answer=data["answer"],
+            read=Stats(**data["read"]),
+            compute=Stats(**data["compute"]),
+            memory=MemoryStats.from_dict(data["memory"]) if "memory" in data else None,
+            solve=Stats(**data["solve"]) if "solve" in data else None,
+        )
+
+
+def has_parse_solve(module: ModuleType) -> bool:
+    """
+    Part is split to `parse(s, ...)` and `solve(parsed)`: it has both and
+    `compute` calls them, not just a helper which happens to be named `parse`.
+    """
+    code = getattr(getattr(module, "compute", None), "__code__", None)
+    return (
+        code is not None
+        and callable(getattr(module, "parse", None))
+        and callable(getattr(module, "solve", None))
+        and {"parse", "solve"} <= set(code.co_names)
+    )
+
+
+def bench_part(part: Part, root: str = ROOT, **measure_kwargs: Any) -> BenchResult:
+    """
+    Time `read_input()` and `compute` separately. Read is only the file
+    read, parsing happens inside `compute` and is timed with it. It can
+    be separated only for days with `parse` and `solve`: for them also
+    time `solve` alone, on a fresh copy of parsed input from
+    `parsed_input_cache` for every run.
+    """
+    module = import_part(part, root)
+    data, read_samples = measure(module.read_input, **measure_kwargs)
+    answer, compute_samples = measure(lambda: module.compute(data), **measure_kwargs)
+    solve = None
+    if has_parse_solve(module):
+        cache_dir = os.path.join(root, PARSED_CACHE_DIR)
+        _, solve_samples = measure(
+            module.solve,
+            setup=lambda: parsed_input_cache(module.parse, data, cache_dir=cache_dir),
+            **measure_kwargs,
+        )
+        solve = Stats.from_samples(solve_samples)
+    return BenchResult(
+        part=part,
+        answer=str(answer),
+        read=Stats.from_samples(read_samples),
+        compute=Stats.from_samples(compute_samples),
+        solve=solve,
+    )
+
+
+def memory_part(part: Part, root: str = ROOT, *, top: int = 5) -> MemoryStats:
+    """
+    Run `compute` once under tracemalloc in a fresh process,
+    so peak RSS and tracemalloc overhead belong only to this part.
+    """
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(1, mp_context=context) as executor:
+        return executor.submit(_memory_worker, part, str(root), top).result()
+
+
+def _memory_worker(part: Part, root: str, top: int) -> MemoryStats:
+    module = import_part(part, root)
+    data = module.read_input()
+    peak: list[Any] = [0, None, False]  # traced bytes, snapshot, in handler
+
+    def take_snapshot_on_peak(*args: Any) -> None:
+        current, _ = tracemalloc.get_traced_memory()
+        # taking snapshot is slow, so only on 10% growth and not reentrant
+        if current > peak[0] * 1.1 and not peak[2]:
+            peak[2] = True
+            peak[:] = current, tracemalloc.take_snapshot(), False
+
+    # sites at the end of compute() are mostly freed already, so snapshot
+    # is taken on the highest traced memory seen on timer ticks
+    sample = hasattr(signal, "setitimer")
+    tracemalloc.start()
+    if sample:
+        old_handler = signal.signal(signal.SIGPROF, take_snapshot_on_peak)
+        signal.setitimer(signal.ITIMER_PROF, 0.01, 0.01)
+    try:
+        module.compute(data)
+    finally:
+        if sample:
+            signal.setitimer(signal.ITIMER_PROF, 0, 0)
+            signal.signal(signal.SIGPROF, old_handler)
+    if peak[1] is None:
+        peak[1] = tracemalloc.take_snapshot()
+    _, peak_traced = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    snapshot = peak[1].filter_traces(
+        [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+        ]
+    )
+    return MemoryStats(
+        peak_rss=_peak_rss(),
+        peak_traced=peak_traced,
+        top=[
+            AllocationSite(
+                site=f"{os.path.basename(stat.traceback[0].filename)}"
+                f":{stat.traceback[0].lineno}",
+                size=stat.size,
+                count=stat.count,
+            )
+            for stat in snapshot.statistics("lineno")[:top]
+        ],
+    )
+
+
+def _peak_rss() -> int | None:
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def interpreter_name() -> str:
+    return platform.python_implementation().lower()
+
+
+def make_report(results: Iterable[BenchResult]) -> dict[str, Any]:
+    return {
+        "interpreter": interpreter_name(),
+        "python": platform.python_version(),
+        "results": [result.to_dict() for result in results],
+    }
+
+
+def format_markdown(results: Iterable[BenchResult]) -> str:
+    results = list(results)
+    with_memory = any(r.memory is not None for r in results)
+    with_solve = any(r.solve is not None for r in results)
+    h = humanized_seconds
+    lines = [
+        "| Day   | Part  | Min     | Median  | p95     | Median 95% CI     | Read    |",
+        "|-------|-------|---------|---------|---------|-------------------|---------|",
+    ]
+    if with_solve:
+        lines[0] += " Solve   |"
+        lines[1] += "---------|"
+    if with_memory:
+        lines[0] += " Peak traced | Peak RSS |"
+        lines[1] += "-------------|----------|"
+    for r in results:
+        c = r.compute
+        ci = f"{h(c.ci_low)}..{h(c.ci_high)}"
+        line = (
+            f"| day{r.part.day:02} | part{r.part.part} | {h(c.min):<7} "
+            f"| {h(c.median):<7} | {h(c.p95):<7} | {ci:<17} "
+            f"| {h(r.read.median):<7} |"
+        )
+        if with_solve:
+            solve = "-" if r.solve is None else h(r.solve.median)
+            line += f" {solve:<7} |"
+        if with_memory:
+            traced = rss = "-"
+            if r.memory is not None:
+                traced = humanized_bytes(r.memory.peak_traced)
+                if r.memory.peak_rss is not None:
+                    rss = humanized_bytes(r.memory.peak_rss)
+            line += f" {traced:<11} | {rss:<8} |"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def format_markdown_comparison(reports: list[dict[str, Any]]) -> str:
+    """Table with compute median of every part for every report (interpreter)."""
+    columns = [report["interpreter"] for report in reports]
+    medians = {}
+    for i, report in enumerate(reports):
+        for data in report["results"]:
+            result = BenchResult.from_dict(data)
+            medians.setdefault(result.part, [None] * len(reports))[i] = (
+                humanized_seconds(result.compute.median)
+            )
+    lines = [
+        "| Day   | Part  | " + " | ".join(f"{column:<7}" for column in columns) + " |",
+        "|-------|-------|" + "|".join("-" * 9 for _ in columns) + "|",
+    ]
+    for part, values in sorted(medians.items()):
+        cells = " | ".join(f"{value or '-':<7}" for value in values)
+        lines.append(f"| day{part.day:02} | part{part.part} | {cells} |")
+    return "\n".join(lines)
+
+
+def baseline_path(root: str = ROOT, interpreter: str | None = None) -> str:
+    interpreter = interpreter or interpreter_name()
+    return os.path.join(root, ".benchmarks", f"baseline-{interpreter}.json")
+
+
+def load_report(path: str) -> dict[str, Any]:
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_baseline(report: dict[str, Any], path: str) -> None:
+    """Save report as baseline, results of parts not in report are kept."""
+    results = {}
+    if os.path.exists(path):
+        old_report = load_report(path)
+        if old_report["interpreter"] != report["interpreter"]:
+            raise ValueError(
+                f"baseline {path} is for {old_report['interpreter']},"
+                f" not {report['interpreter']}"
+            )
+        results = {(r["day"], r["part"]): r for r in old_report["results"]}
+    results.update({(r["day"], r["part"]): r for r in report["results"]})
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(
+            {**report, "results": [results[k] for k in sorted(results)]}, f, indent=2
+        )
+
+
+class Comparison(NamedTuple):
+    part: Part
+    baseline: Stats
+    current: Stats
+    threshold: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current.median / self.baseline.median
+
+    @property
+    def significant(self) -> bool:
+        """Confidence intervals of medians don't overlap."""
+        return (
+            self.current.ci_low > self.baseline.ci_high
+            or self.current.ci_high < self.baseline.ci_low
+        )
+
+    @property
+    def regressed(self) -> bool:
+        return self.significant and self.ratio > 1 + self.threshold
+
+
+def compare_reports(
+    baseline: dict[str, Any], current: dict[str, Any], threshold: float = 0.1
+) -> list[Comparison]:
+    """Compare compute time of parts which are in both reports."""
+    if baseline["interpreter"] != current["interpreter"]:
+        raise ValueError(
+            f"can't compare {current['interpreter']} results"
+            f" with {baseline['interpreter']} baseline"
+        )
+    baseline_results = {
+        result.part: result
+        for result in map(BenchResult.from_dict, baseline["results"])
+    }
+    comparisons = []
+    for result in map(BenchResult.from_dict, current["results"]):
+        if result.part in baseline_results:
+            comparisons.append(
+                Comparison(
+                    part=result.part,
+                    baseline=baseline_results[result.part].compute,
+                    current=result.compute,
+                    threshold=threshold,
+                )
+            )
+    return comparisons
+
+
+def format_markdown_regressions(comparisons: Iterable[Comparison]) -> str:
+    h = humanized_seconds
+    lines = [
+        "| Day   | Part  | Baseline | Current | Change  | Status     |",
+        "|-------|-------|----------|---------|---------|------------|",
+    ]
+    for c in comparisons:
+        if c.regressed:
+            status = "REGRESSION"
+        elif c.significant:
+            status = "faster" if c.ratio < 1 else "slower"
+        else:
+            status = "same"
+        change = f"{c.ratio - 1:+.1%}"
+        lines.append(
+            f"| day{c.part.day:02} | part{c.part.part} | {h(c.baseline.median):<8} "
+            f"| {h(c.current.median):<7} | {change:<7} | {status:<10} |"
+        )
+    return "\n".join(lines)
+
+
+DEFAULT_INPUT_SIZE = 20_000
+
+
+def import_generator(day: int, root: str = ROOT) -> ModuleType | None:
+    """Import `dayNN/generate.py` with synthetic input generator, if any."""
+    if not os.path.exists(os.path.join(root, f"day{day:02}", "generate.py")):
+        return None
+    return import_day_module(f"day{day:02}.generate", root)
+
+
+def input_size(day: int, root: str = ROOT) -> int:
+    try:
+        return os.path.getsize(os.path.join(root, f"day{day:02}", "input.txt"))
+    except OSError:
+        return DEFAULT_INPUT_SIZE
+
+
+def fit_exponent(sizes: list[int], times: list[float]) -> float:
+    """Slope of least squares line in log-log space: time ~ size ** exponent."""
+    return statistics.linear_regression(
+        [math.log(size) for size in sizes], [math.log(t) for t in times]
+    ).slope
+
+
+class ScalingResult(NamedTuple):
+    part: Part
+    # multiples of real input size
+    factors: list[float]
+    times: list[float]
+    # first factor where time is over the limit (measured or predicted)
+    blown_up_at: float | None
+
+    @property
+    def exponent(self) -> float | None:
+        if len(self.factors) < 2:
+            return None
+        return fit_exponent(self.factors, self.times)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "day": self.part.day,
+            "part": self.part.part,
+            "factors": self.factors,
+            "times": self.times,
+            "blown_up_at": self.blown_up_at,
+            "exponent": self.exponent,
+        }
+
+
+def geometric_factors(
+    min_factor: float, max_factor: float, ratio: float = 2.0
+) -> list[float]:
+    factors = [min_factor]
+    while factors[-1] * ratio <= max_factor:
+        factors.append(factors[-1] * ratio)
+    return factors
+
+
+def scale_part(
+    part: Part,
+    factors: list[float],
+    root: str = ROOT,
+    *,
+    time_limit: float = 1.0,
+    seed: int = 0,
+) -> ScalingResult:
+    """
+    Run `compute` on synthetic inputs of `factors` times real input size
+    until it takes longer than `time_limit`. Sizes which are predicted
+    to be too slow aren't run at all.
+    """
+    module = import_part(part, root)
+    generator = import_generator(part.day, root)
+    if generator is None:
+        raise ValueError(f"no dayNN/generate.py for {part}")
+    compute_kwargs = getattr(generator, "compute_kwargs", lambda size: {})
+    base_size = input_size(part.day, root)
+
+    measured: list[float] = []
+    times: list[float] = []
+    for factor in factors:
+        if times:
+            # linear until there are enough points to fit
+            exponent = fit_exponent(measured, times) if len(times) > 1 else 1.0
+            if times[-1] * (factor / measured[-1]) ** exponent > time_limit:
+                return ScalingResult(part, measured, times, factor)
+
+        size = max(int(base_size * factor), 1)
+        s = generator.generate(size, seed)
+        kwargs = compute_kwargs(size)
+        _, samples = measure(
+            lambda: module.compute(s, **kwargs),
+            min_time=min(time_limit / 5, 0.2),
+            max_time=time_limit,
+            min_runs=3,
+        )
+        measured.append(factor)
+        times.append(statistics.median(samples))
+        if times[-1] > time_limit:
+            return ScalingResult(part, measured, times, factor)
+    return ScalingResult(part, measured, times, None)
+
+
+def format_markdown_scaling(results: Iterable[ScalingResult]) -> str:
+    """Parts which blow up on smaller inputs first, then by fitted exponent."""
+
+    def sort_key(result: ScalingResult) -> tuple[float, float]:
+        blown_up_at = result.blown_up_at
+        exponent = result.exponent
+        return (
+            math.inf if blown_up_at is None else blown_up_at,
+            -math.inf if exponent is None else -exponent,
+        )
+
+    lines = [
+        "| Day   | Part  | Exponent | Largest | Time    | Blows up at |",
+        "|-------|-------|----------|---------|---------|-------------|",
+    ]
+    for r in sorted(results, key=sort_key):
+        exponent = "-" if r.exponent is None else f"{r.exponent:.2f}"
+        largest = f"x{r.factors[-1]:g}"
+        blown_up_at = "-" if r.blown_up_at is None else f"x{r.blown_up_at:g}"
+        lines.append(
+            f"| day{r.part.day:02} | part{r.part.part} | {exponent:<8} "
+            f"| {largest:<7} | {humanized_seconds(r.times[-1]):<7} "
+            f"| {blown_up_at:<11} |"
+        )
+    return "\n".join(lines)
+
+
+def scaling_main(args: argparse.Namespace) -> int:
+    parts = [
+        part
+        for part in discover_parts(args.root, days=args.day, parts=args.part)
+        if import_generator(part.day, args.root) is not None
+    ]
+    if not parts:
+        print("no parts with generate.py found", file=sys.stderr)
+        return 1
+
+    factors = geometric_factors(args.min_factor, args.max_factor)
+    results = []
+    for part in parts:
+        result = scale_part(part, factors, args.root, time_limit=args.time_limit)
+        print(
+            f"{part}: exponent {result.exponent}, blown up at {result.blown_up_at}",
+            file=sys.stderr,
+        )
+        results.append(result)
+
+    print(format_markdown_scaling(results))
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(
+                {
+                    "interpreter": interpreter_name(),
+                    "python": platform.python_version(),
+                    "scaling": [result.to_dict() for result in results],
+                },
+                f,
+                indent=2,
+            )
+    return 0
+
+
+def frame_label(filename: str, name: str) -> str:
+    return f"{os.path.basename(filename)}:{name}"
+
+
+class StackSampler:
+    """
+    Signal based sampling profiler, counts stacks every `interval` seconds
+    of CPU time. Works only on Unix and only for the main thread.
+
+    `keep` filters frames by file name, skipped frames are just left
+    out of the stack.
+    """
+
+    def __init__(
+        self, interval: float = 0.001, keep: Callable[[str], bool] | None = None
+    ) -> None:
+        self.interval = interval
+        self.keep = keep
+        self.stacks: Counter[str] = Counter()
+        self._old_handler: Any = None
+        self._outer_frame: Any = None
+
+    def _sample(self, signum: int, frame: Any) -> None:
+        stack = []
+        # frames outside of `with` block are the same in every sample
+        while frame is not None and frame is not self._outer_frame:
+            code = frame.f_code
+            if self.keep is None or self.keep(code.co_filename):
+                stack.append(frame_label(code.co_filename, code.co_name))
+            frame = frame.f_back
+        if stack:
+            self.stacks[";".join(reversed(stack))] += 1
+
+    def __enter__(self) -> StackSampler:
+        self._outer_frame = sys._getframe(1)
+        self._old_handler = signal.signal(signal.SIGPROF, self._sample)
+        signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        signal.setitimer(signal.ITIMER_PROF, 0, 0)
+        signal.signal(signal.SIGPROF, self._old_handler)
+        self._outer_frame = None
+
+    def collapsed(self) -> str:
+        """Brendan Gregg's collapsed stacks, input for flamegraph.pl or speedscope."""
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.items())
+
+
+def cprofile_collapsed(
+    profile: cProfile.Profile, keep: Callable[[str], bool] | None = None
+) -> str:
+    """
+    cProfile knows only direct callers, so stacks are two frames deep:
+    `caller;callee` with callee's own time in microseconds.
+    """
+    stacks: Counter[str] = Counter()
+    stats = pstats.Stats(profile).stats
+    for (filename, _, name), (_, _, own_time, _, callers) in stats.items():
+        if keep is not None and not keep(filename):
+            continue
+        label = frame_label(filename, name)
+        if not callers:
+            stacks[label] += round(own_time * 1_000_000)
+        for (caller_filename, _, caller_name), caller_stats in callers.items():
+            # caller_stats are (calls, primitive calls, own time, cumulative time)
+            own_time = round(caller_stats[2] * 1_000_000)
+            if keep is None or keep(caller_filename):
+                stack = f"{frame_label(caller_filename, caller_name)};{label}"
+            else:
+                stack = label
+            stacks[stack] += own_time
+    return "".join(f"{stack} {value}\n" for stack, value in stacks.items() if value)
+
+
+def profile_part(
+    part: Part,
+    root: str = ROOT,
+    *,
+    mode: str = "sample",
+    interval: float = 0.001,
+    all_frames: bool = False,
+) -> str:
+    """
+    Run `compute` once under profiler and return collapsed stacks.
+    Only frames from support modules and the part module are kept,
+    unless `all_frames` is set.
+    """
+    module = import_part(part, root)
+    data = module.read_input()
+    support_dir = os.path.dirname(os.path.abspath(__file__))
+    part_path = os.path.abspath(module.__file__)
+
+    def keep(filename: str) -> bool:
+        path = os.path.abspath(filename)
+        return all_frames or path == part_path or os.path.dirname(path) == support_dir
+
+    if mode == "sample":
+        with StackSampler(interval, keep) as sampler:
+            module.compute(data)
+        return sampler.collapsed()
+    elif mode == "cprofile":
+        profile = cProfile.Profile()
+        profile.runcall(module.compute, data)
+        return cprofile_collapsed(profile, keep)
+    else:
+        raise ValueError(f"unknown profile {mode=}")
+
+
+def profile_main(args: argparse.Namespace) -> int:
+    parts = discover_parts(args.root, days=args.day, parts=args.part)
+    if not parts:
+        print("no parts found", file=sys.stderr)
+        return 1
+
+    os.makedirs(args.profile_dir, exist_ok=True)
+    for part in parts:
+        collapsed = profile_part(
+            part,
+            args.root,
+            mode=args.profile,
+            interval=args.sample_interval,
+            all_frames=args.all_frames,
+        )
+        path = os.path.join(
+            args.profile_dir, f"day{part.day:02}-part{part.part}.collapsed"
+        )
+        with open(path, "w") as f:
+            f.write(collapsed)
+        print(f"{part}: {path}")
+    return 0
+
+
+def bench_main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark compute() of every day part in one interpreter."
+    )
+    parser.add_argument("--day", type=int, action="append", help="can be repeated")
+    parser.add_argument("--part", type=int, action="append", help="can be repeated")
+    parser.add_argument("--root", default=ROOT, help="directory with dayNN dirs")
+    parser.add_argument("--min-time", type=float, default=1.0)
+    parser.add_argument("--max-time", type=float, default=20.0)
+    parser.add_argument("--min-runs", type=int, default=5)
+    parser.add_argument("--json", help="write JSON report to this file")
+    parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="also run every part once under tracemalloc in a separate process",
+    )
+    parser.add_argument(
+        "--memory-top",
+        type=int,
+        default=5,
+        help="number of top allocation sites in report (default: 5)",
+    )
+    parser.add_argument("--markdown", help="write markdown table to this file")
+    parser.add_argument(
+        "--report",
+        nargs="+",
+        metavar="JSON",
+        help="don't run anything, print comparison table of JSON reports",
+    )
+    baseline = parser.add_mutually_exclusive_group()
+    baseline.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="save results as baseline for current interpreter",
+    )
+    baseline.add_argument(
+        "--compare",
+        action="store_true",
+        help="compare results with baseline, exit with 1 on regressions",
+    )
+    parser.add_argument(
+        "--baseline",
+        help="baseline file (default: .benchmarks/baseline-<interpreter>.json)",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="slowdown which counts as regression if significant (default: 0.1)",
+    )
+    scaling = parser.add_argument_group(
+        "scaling", "run compute() on synthetic inputs from dayNN/generate.py"
+    )
+    scaling.add_argument("--scaling", action="store_true")
+    scaling.add_argument(
+        "--min-factor",
+        type=float,
+        default=0.25,
+        help="smallest input, times real input size (default: 0.25)",
+    )
+    scaling.add_argument("--max-factor", type=float, default=64)
+    scaling.add_argument(
+        "--time-limit",
+        type=float,
+        default=1.0,
+        help="stop growing input when compute() is slower (default: 1.0)",
+    )
+    profiling = parser.add_argument_group(
+        "profiling", "write collapsed stacks of compute() for flamegraphs"
+    )
+    profiling.add_argument("--profile", choices=["sample", "cprofile"])
+    profiling.add_argument("--profile-dir", default=os.path.join(ROOT, ".profiles"))
+    profiling.add_argument(
+        "--sample-interval",
+        type=float,
+        default=0.001,
+        help="seconds of CPU time between samples (default: 0.001)",
+    )
+    profiling.add_argument(
+        "--all-frames",
+        action="store_true",
+        help="don't filter out frames outside of support and the day module",
+    )
+    args = parser.parse_args()
+    if args.scaling:
+        return scaling_main(args)
+    if args.profile:
+        return profile_main(args)
+
+    baseline_file = args.baseline or baseline_path(args.root)
+    if args.compare and not os.path.exists(baseline_file):
+        print(f"no baseline {baseline_file}, run with --save-baseline", file=sys.stderr)
+        return 1
+
+    if args.report:
+        print(format_markdown_comparison([load_report(path) for path in args.report]))
+        return 0
+
+    parts = discover_parts(args.root, days=args.day, parts=args.part)
+    if not parts:
+        print("no parts found", file=sys.stderr)
+        return 1
+
+    results = []
+    for part in parts:
+        result = bench_part(
+            part,
+            args.root,
+            min_time=args.min_time,
+            max_time=args.max_time,
+            min_runs=args.min_runs,
+        )
+        print(
+            f"{part}: {humanized_seconds(result.compute.median)}"
+            f" ({result.compute.runs} runs)",
+            file=sys.stderr,
+        )
+        if args.memory:
+            memory = memory_part(part, args.root, top=args.memory_top)
+            result = result._replace(memory=memory)
+            print(
+                f"{part}: peak traced {humanized_bytes(memory.peak_traced)}",
+                file=sys.stderr,
+            )
+            for site in memory.top:
+                print(
+                    f"    {site.site}: {humanized_bytes(site.size)}"
+                    f" in {site.count} blocks",
+                    file=sys.stderr,
+                )
+        results.append(result)
+
+    markdown = format_markdown(results)
+    print(markdown)
+    if args.markdown:
+        with open(args.markdown, "w") as f:
+            f.write(markdown + "\n")
+    report = make_report(results)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+    if args.save_baseline:
+        save_baseline(report, baseline_file)
+        print(f"baseline saved to {baseline_file}", file=sys.stderr)
+    if args.compare:
+        comparisons = compare_reports(
+            load_report(baseline_file), report, args.threshold
+        )
+        print()
+        print(format_markdown_regressions(comparisons))
+        if any(comparison.regressed for comparison in comparisons):
+            return 1
+    return 0
@@ -0,0 +1,207 @@
+"""On-disk caches of parsed inputs and of answers."""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import inspect
+import marshal
+import mmap
+import os.path
+import pickle
+import sys
+import types
+from typing import Any, Callable, TypeVar
+
+from support.days import ROOT, Part
+
+T = TypeVar("T")
+
+PARSED_CACHE_DIR = os.path.join(".cache", "parsed")
+
+
+def parsed_input_cache(
+    parse: Callable[..., T], s: str, *args: Any, cache_dir: str | None = None
+) -> T:
+    """
+    Return `parse(s, *args)`, pickled to disk and reused across runs.
+
+    Key is hash of the input, `args`, source of the module with `parse`
+    (so edits of helpers it calls invalidate the cache too) and digest of
+    support modules (parsed values often pickle `sup` objects). Every call
+    unpickles a fresh copy, which may be mutated by the caller.
+    """
+    cache_dir = cache_dir or os.path.join(ROOT, PARSED_CACHE_DIR)
+    key = hashlib.sha256()
+    key.update(s.encode())
+    key.update(repr(args).encode())
+    key.update(inspect.getsource(sys.modules[parse.__module__]).encode())
+    key.update(support_digest().encode())
+    path = os.path.join(
+        cache_dir, f"{parse.__module__}.{parse.__qualname__}-{key.hexdigest()}.pickle"
+    )
+    try:
+        with open(path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                return pickle.loads(buf)
+    except FileNotFoundError:
+        pass
+
+    result = parse(s, *args)
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+    return result
+
+
+def file_digest(path: str | os.PathLike[str], chunk_size: int = 1024 * 1024) -> str:
+    """
+    Hex sha256 of file, the same as `AnswerCache.key` gets for its content
+    read as str, but without reading the whole file to memory.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+ANSWER_CACHE_DIR = os.path.join(".cache", "answers")
+ANSWER_CACHE_MAX_SIZE = 1024 * 1024
+
+
+@functools.lru_cache(maxsize=None)
+def _code_digest(path: str, mtime_ns: int) -> str:
+    """
+    Digest of module bytecode without line numbers, so comments and
+    formatting don't change it.
+    """
+    with open(path) as f:
+        code = compile(f.read(), os.path.basename(path), "exec")
+    return hashlib.sha256(marshal.dumps(_strip_lines(code))).hexdigest()
+
+
+def _strip_lines(code: types.CodeType) -> types.CodeType:
+    consts = tuple(
+        _strip_lines(const) if isinstance(const, types.CodeType) else const
+        for const in code.co_consts
+    )
+    # PyPy code objects have the older `co_lnotab` only
+    lines = "co_linetable" if hasattr(code, "co_linetable") else "co_lnotab"
+    return code.replace(co_firstlineno=0, co_consts=consts, **{lines: b""})
+
+
+def code_digest(path: str) -> str:
+    return _code_digest(path, os.stat(path).st_mtime_ns)
+
+
+def support_digest() -> str:
+    """Digest of all support modules, helpers used by `compute` live there."""
+    package_dir = os.path.dirname(os.path.abspath(__file__))
+    digests = [
+        code_digest(os.path.join(package_dir, name))
+        for name in sorted(os.listdir(package_dir))
+        if name.endswith(".py")
+    ]
+    return hashlib.sha256("".join(digests).encode()).hexdigest()
+
+
+class AnswerCache:
+    """
+    Answers of `compute` on disk, one file per answer, keyed by day, part,
+    digest of input and arguments, and bytecode digests of the part module
+    and of support modules (helpers used by `compute` live there).
+
+    When total size is over `max_size`, least recently used answers are
+    removed (hits update file mtime).
+    """
+
+    def __init__(
+        self, cache_dir: str | None = None, max_size: int = ANSWER_CACHE_MAX_SIZE
+    ) -> None:
+        self.cache_dir = cache_dir or os.path.join(ROOT, ANSWER_CACHE_DIR)
+        self.max_size = max_size
+
+    def key(
+        self,
+        part: Part,
+        module_path: str,
+        s: str | None,
+        args: tuple,
+        kwargs: dict,
+        *,
+        input_digest: str | None = None,
+    ) -> str:
+        """`input_digest` (see `file_digest`) is used instead of hashing `s`."""
+        key = hashlib.sha256()
+        for item in [
+            str(part),
+            code_digest(module_path),
+            support_digest(),
+            input_digest or hashlib.sha256(s.encode()).hexdigest(),
+            repr((args, sorted(kwargs.items()))),
+        ]:
+            key.update(item.encode())
+            key.update(b"\0")
+        return key.hexdigest()
+
+    def get(self, key: str) -> tuple[bool, Any]:
+        """Return (found, answer)."""
+        path = os.path.join(self.cache_dir, f"{key}.pickle")
+        try:
+            with open(path, "rb") as f:
+                answer = pickle.load(f)
+        except FileNotFoundError:
+            return False, None
+        os.utime(path)
+        return True, answer
+
+    def put(self, key: str, answer: Any) -> None:
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = os.path.join(self.cache_dir, f"{key}.pickle")
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump(answer, f)
+        os.replace(tmp_path, path)
+        self.evict()
+
+    def evict(self) -> None:
+        entries = []
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.endswith(".pickle"):
+                stat = entry.stat()
+                entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_size:
+                break
+            os.remove(path)
+            total -= size
+
+
+def cached_compute(
+    compute: Callable[..., T], cache: AnswerCache | None = None
+) -> Callable[..., T]:
+    """
+    Wrap `compute` of a `dayNN/partN.py` module to reuse its answers
+    from `cache` while the input and the code are the same. Errors
+    are not cached.
+    """
+    cache = cache or AnswerCache()
+    module_path = sys.modules[compute.__module__].__file__
+    part = Part.from_path(module_path)
+    if part is None:
+        raise ValueError(f"{module_path} is not a dayNN/partN.py module")
+
+    @functools.wraps(compute)
+    def wrapper(s: str, *args: Any, **kwargs: Any) -> T:
+        key = cache.key(part, module_path, s, args, kwargs)
+        found, answer = cache.get(key)
+        if not found:
+            answer = compute(s, *args, **kwargs)
+            cache.put(key, answer)
+        return answer
+
+    return wrapper
@@ -0,0 +1,85 @@
+"""Discovery and import of `dayNN/partN.py` modules."""
+
+from __future__ import annotations
+
+import importlib.machinery
+import importlib.util
+import os.path
+import re
+import sys
+from types import ModuleType
+from typing import Container, NamedTuple
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+# support/support/ -> repo root
+ROOT = os.path.dirname(os.path.dirname(HERE))
+DAY_DIR_RE = re.compile(r"^day(\d\d)$")
+PART_FILE_RE = re.compile(r"^part(\d+)\.py$")
+
+
+class Part(NamedTuple):
+    day: int
+    part: int
+
+    def __str__(self) -> str:
+        return f"day{self.day:02} part{self.part}"
+
+    @property
+    def module_name(self) -> str:
+        return f"day{self.day:02}.part{self.part}"
+
+    @classmethod
+    def from_path(cls, path: str) -> Part | None:
+        """Part of `dayNN/partN.py` file, None for other files."""
+        day_match = DAY_DIR_RE.match(os.path.basename(os.path.dirname(path)))
+        part_match = PART_FILE_RE.match(os.path.basename(path))
+        if day_match is None or part_match is None:
+            return None
+        return cls(int(day_match[1]), int(part_match[1]))
+
+
+def discover_parts(
+    root: str = ROOT,
+    days: Container[int] | None = None,
+    parts: Container[int] | None = None,
+) -> list[Part]:
+    """Find `dayNN/partN.py` modules, day00 is a template and is skipped."""
+    result = []
+    for day_dir in sorted(os.listdir(root)):
+        day_match = DAY_DIR_RE.match(day_dir)
+        if not day_match or int(day_match[1]) == 0:
+            continue
+        day = int(day_match[1])
+        if days is not None and day not in days:
+            continue
+        for filename in sorted(os.listdir(os.path.join(root, day_dir))):
+            part_match = PART_FILE_RE.match(filename)
+            if part_match and (parts is None or int(part_match[1]) in parts):
+                result.append(Part(day, int(part_match[1])))
+    return result
+
+
+def import_part(part: Part, root: str = ROOT) -> ModuleType:
+    return import_day_module(part.module_name, root)
+
+
+def import_day_module(module_name: str, root: str) -> ModuleType:
+    """
+    Modules are imported by name, not by path, so objects defined in them
+    can be pickled by ProcessPoolExecutor (day06 part2).
+
+    `root` isn't added to sys.path, because `support` dir in it would
+    shadow this module in spawned processes. Instead `dayNN` package
+    is registered in sys.modules with its dir as `__path__`.
+    """
+    package_name = module_name.partition(".")[0]
+    package_dir = os.path.join(str(root), package_name)
+    package = sys.modules.get(package_name)
+    if package is None or list(getattr(package, "__path__", [])) != [package_dir]:
+        for name in list(sys.modules):
+            if name.startswith(f"{package_name}."):
+                del sys.modules[name]
+        spec = importlib.machinery.ModuleSpec(package_name, None, is_package=True)
+        spec.submodule_search_locations = [package_dir]
+        sys.modules[package_name] = importlib.util.module_from_spec(spec)
+    return importlib.import_module(module_name)
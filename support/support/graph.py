@@ -0,0 +1,807 @@
+"""Graph searches, shortest paths, topological sort and cycles."""
+
+from __future__ import annotations
+
+import array
+import heapq
+from collections import deque
+from typing import Callable, Hashable, Iterable, Iterator, NamedTuple, TypeVar
+
+from support.grid import Coords, Grid, Matrix
+from support.tracing import trace
+
+T = TypeVar("T")
+HT = TypeVar("HT", bound=Hashable)
+UNREACHABLE = -1
+
+
+class CSRGraph(NamedTuple):
+    """
+    Grid graph in compressed sparse row format.
+
+    Vertices are flat cell indices (`m * n_len + n`), edges of vertex `u` are
+    `targets[offsets[u]:offsets[u + 1]]` with the same slice of `weights`
+    (or weight 1 for every edge when `weights` is None).
+    """
+
+    offsets: array.array
+    targets: array.array
+    weights: array.array | None
+    n_len: int
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def index(self, m: int, n: int) -> int:
+        return m * self.n_len + n
+
+    def coords(self, idx: int) -> Coords:
+        return divmod(idx, self.n_len)
+
+    def neighbors(self, u: int) -> Iterator[tuple[int, int]]:
+        """Return (vertex, weight) pairs."""
+        start, end = self.offsets[u], self.offsets[u + 1]
+        if self.weights is None:
+            return ((vertex, 1) for vertex in self.targets[start:end])
+        return zip(self.targets[start:end], self.weights[start:end])
+
+
+def grid_to_csr(
+    matrix: Matrix | Grid,
+    passable: Callable[[T], bool] = lambda value: True,
+    weight: Callable[[T], int] | None = None,
+) -> CSRGraph:
+    """
+    Build graph of cross neighbors between passable cells.
+
+    :param matrix: Matrix or Grid
+    :param passable: predicate for cell value, impassable cells have no edges
+    :param weight: cost of entering cell with given value, 1 if not set
+    :return: CSRGraph
+    """
+    m_len, n_len = matrix.m_len, matrix.n_len
+    values = [value for row in matrix for value in row]
+    is_passable = [passable(value) for value in values]
+    offsets = array.array("i", [0])
+    targets = array.array("i")
+    weights = array.array("i") if weight is not None else None
+    for u in range(m_len * n_len):
+        if is_passable[u]:
+            m, n = divmod(u, n_len)
+            # same order as Matrix.neighbors_cross
+            for vertex, in_bounds in (
+                (u - 1, n > 0),
+                (u - n_len, m > 0),
+                (u + n_len, m < m_len - 1),
+                (u + 1, n < n_len - 1),
+            ):
+                if in_bounds and is_passable[vertex]:
+                    targets.append(vertex)
+                    if weights is not None:
+                        weights.append(weight(values[vertex]))
+        offsets.append(len(targets))
+    return CSRGraph(offsets, targets, weights, n_len)
+
+
+def distance_field(
+    matrix: Matrix | Grid,
+    sources: Iterable[Coords],
+    passable: Callable[[T], bool] = lambda value: True,
+) -> array.array:
+    """
+    Multi-source BFS over cross neighbors.
+
+    :return: flat array (`m * n_len + n`) with distance to the nearest source,
+        UNREACHABLE (-1) for cells that can't be reached
+    """
+    m_len, n_len = matrix.m_len, matrix.n_len
+    is_passable = [passable(value) for row in matrix for value in row]
+    dist = array.array("i", [UNREACHABLE]) * (m_len * n_len)
+    queue = deque()
+    for m, n in sources:
+        idx = m * n_len + n
+        if dist[idx] == UNREACHABLE:
+            dist[idx] = 0
+            queue.append(idx)
+
+    while queue:
+        u = queue.popleft()
+        m, n = divmod(u, n_len)
+        next_dist = dist[u] + 1
+        for vertex, in_bounds in (
+            (u - 1, n > 0),
+            (u - n_len, m > 0),
+            (u + n_len, m < m_len - 1),
+            (u + 1, n < n_len - 1),
+        ):
+            if in_bounds and dist[vertex] == UNREACHABLE and is_passable[vertex]:
+                dist[vertex] = next_dist
+                queue.append(vertex)
+    return dist
+
+
+def path_order(prev: array.array, source: int, end: int) -> array.array:
+    """
+    Walk `prev` array (from CSRGraph searches from `source`) back from `end`.
+
+    `source` is needed, because `prev` of both source and unreachable
+    cells is UNREACHABLE.
+
+    :return: flat indices of path cells from source to end,
+        empty when `end` is unreachable
+    """
+    path = array.array("i")
+    while end != source:
+        if end == UNREACHABLE:
+            return array.array("i")
+        path.append(end)
+        end = prev[end]
+    path.append(source)
+    path.reverse()
+    return path
+
+
+@trace
+def bfs(
+    graph: dict[HT, dict[HT, int]] | CSRGraph, source: HT
+) -> dict[HT, HT] | array.array:
+    """
+    For CSRGraph `source` is a flat index and result is an array
+    with UNREACHABLE (-1) in place of None.
+    """
+    if isinstance(graph, CSRGraph):
+        return _bfs_csr(graph, source)
+
+    queue = deque([source])
+    prev = {source: None}
+
+    while queue:
+        u = queue.popleft()
+        for vertex, val in graph[u].items():
+            if vertex not in prev:
+                queue.append(vertex)
+                prev[vertex] = u
+    return prev
+
+
+def _bfs_csr(graph: CSRGraph, source: int) -> array.array:
+    offsets, targets = graph.offsets, graph.targets
+    prev = array.array("i", [UNREACHABLE]) * len(graph)
+    prev[source] = source
+    queue = deque([source])
+    while queue:
+        u = queue.popleft()
+        for i in range(offsets[u], offsets[u + 1]):
+            vertex = targets[i]
+            if prev[vertex] == UNREACHABLE:
+                queue.append(vertex)
+                prev[vertex] = u
+    prev[source] = UNREACHABLE
+    return prev
+
+
+@trace
+def dijkstra(
+    graph: dict[HT, dict[HT, int]] | CSRGraph,
+    source: HT,
+    target: HT | None = None,
+    max_dist: int | None = None,
+) -> tuple[dict[HT, int], dict[HT, HT]] | tuple[array.array, array.array]:
+    """
+    For CSRGraph `source` is a flat index and results are arrays
+    with UNREACHABLE (-1) for vertices that can't be reached.
+
+    :param target: stop as soon as target distance is final
+    :param max_dist: don't go further than this distance
+    :return: tuple of distance and previous vertex, when search stopped early
+        only target and vertices closer than it have final values
+    """
+    if isinstance(graph, CSRGraph):
+        return _a_star_csr(graph, source, target, max_dist=max_dist)
+
+    dist = {source: 0}
+    prev = {source: None}
+    pq = [(0, source)]
+    while pq:
+        dist_u, u = heapq.heappop(pq)
+        if dist_u > dist[u]:
+            # stale entry, vertex was already expanded with shorter distance
+            continue
+        if u == target:
+            break
+        for vertex, val in graph[u].items():
+            new_dist = dist_u + val
+            if max_dist is not None and new_dist > max_dist:
+                continue
+            if vertex not in dist or new_dist < dist[vertex]:
+                dist[vertex] = new_dist
+                prev[vertex] = u
+                heapq.heappush(pq, (new_dist, vertex))
+    return dist, prev
+
+
+def dial_shortest_path(
+    graph: dict[HT, dict[HT, int]] | CSRGraph,
+    source: HT,
+    target: HT | None = None,
+    max_weight: int | None = None,
+) -> tuple[dict[HT, int], dict[HT, HT]] | tuple[array.array, array.array]:
+    """
+    Dijkstra with circular bucket queue (Dial's algorithm).
+
+    Faster than heap when weights are small non-negative integers
+    (e.g. 1 and 1000): no log factor and no tuple comparisons.
+    Same contract as `dijkstra`, but when there are several shortest paths
+    `prev` can point to another one.
+
+    https://en.wikipedia.org/wiki/Dijkstra%27s_algorithm#Specialized_variants
+
+    :param max_weight: max edge weight, calculated from graph if not set
+    """
+    if isinstance(graph, CSRGraph):
+        return _dial_csr(graph, source, target, max_weight)
+
+    if max_weight is None:
+        max_weight = max(
+            (val for edges in graph.values() for val in edges.values()), default=0
+        )
+    size = max_weight + 1
+    buckets = [[] for _ in range(size)]
+    buckets[0].append(source)
+    pending = 1
+    dist = {source: 0}
+    prev = {source: None}
+    current = 0
+    while pending:
+        bucket = buckets[current % size]
+        while bucket:
+            u = bucket.pop()
+            pending -= 1
+            if dist[u] != current:
+                continue
+            if u == target:
+                return dist, prev
+            for vertex, val in graph[u].items():
+                new_dist = current + val
+                if vertex not in dist or new_dist < dist[vertex]:
+                    dist[vertex] = new_dist
+                    prev[vertex] = u
+                    buckets[new_dist % size].append(vertex)
+                    pending += 1
+        current += 1
+    return dist, prev
+
+
+def _dial_csr(
+    graph: CSRGraph,
+    source: int,
+    target: int | None = None,
+    max_weight: int | None = None,
+) -> tuple[array.array, array.array]:
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    if max_weight is None:
+        max_weight = max(weights, default=0) if weights is not None else 1
+    size = max_weight + 1
+    buckets = [[] for _ in range(size)]
+    buckets[0].append(source)
+    pending = 1
+    dist = array.array("q", [UNREACHABLE]) * len(graph)
+    prev = array.array("i", [UNREACHABLE]) * len(graph)
+    dist[source] = 0
+    current = 0
+    while pending:
+        bucket = buckets[current % size]
+        while bucket:
+            u = bucket.pop()
+            pending -= 1
+            if dist[u] != current:
+                continue
+            if u == target:
+                return dist, prev
+            for i in range(offsets[u], offsets[u + 1]):
+                vertex = targets[i]
+                new_dist = current + (1 if weights is None else weights[i])
+                if dist[vertex] == UNREACHABLE or new_dist < dist[vertex]:
+                    dist[vertex] = new_dist
+                    prev[vertex] = u
+                    buckets[new_dist % size].append(vertex)
+                    pending += 1
+        current += 1
+    return dist, prev
+
+
+@trace
+def a_star(
+    graph: dict[HT, dict[HT, int]] | CSRGraph,
+    source: HT,
+    target: HT,
+    heuristic: Callable[[HT, HT], int],
+) -> tuple[dict[HT, int], dict[HT, HT]] | tuple[array.array, array.array]:
+    """
+    A* algorithm implementation.
+
+    heuristic function must be admissible (never overestimate the distance to the goal).
+    https://en.wikipedia.org/wiki/A*_search_algorithm#Admissibility
+    for example, Manhattan distance is admissible.
+    >>> def heuristic(candidate, target):
+    ...     (x1, y1) = candidate
+    ...     (x2, y2) = target
+    ...     return abs(x1 - x2) + abs(y1 - y2)
+
+    :param graph: graph in format {vertex: {neighbor: cost}} or CSRGraph
+        (then vertices are flat indices and results are arrays, see `dijkstra`)
+    :param source: source vertex
+    :param target: target vertex
+    :param heuristic: heuristic function
+    :return: tuple of distance and previous vertex
+    """
+    if isinstance(graph, CSRGraph):
+        return _a_star_csr(graph, source, target, heuristic)
+
+    dist = {source: 0}
+    prev = {source: None}
+    pq = [(0, source)]
+
+    while pq:
+        _, current = heapq.heappop(pq)
+
+        if current == target:
+            break
+
+        for vertex, val in graph[current].items():
+            new_cost = dist[current] + val
+            if vertex not in dist or new_cost < dist[vertex]:
+                dist[vertex] = new_cost
+                priority = new_cost + heuristic(vertex, target)
+                heapq.heappush(pq, (priority, vertex))
+                prev[vertex] = current
+
+    return dist, prev
+
+
+def _a_star_csr(
+    graph: CSRGraph,
+    source: int,
+    target: int | None = None,
+    heuristic: Callable[[int, int], int] | None = None,
+    max_dist: int | None = None,
+) -> tuple[array.array, array.array]:
+    """Dijkstra when called without heuristic."""
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    dist = array.array("q", [UNREACHABLE]) * len(graph)
+    prev = array.array("i", [UNREACHABLE]) * len(graph)
+    dist[source] = 0
+    pq = [(0, 0, source)]
+    while pq:
+        _, dist_u, u = heapq.heappop(pq)
+        if dist_u > dist[u]:
+            continue
+        if u == target:
+            break
+
+        for i in range(offsets[u], offsets[u + 1]):
+            vertex = targets[i]
+            new_cost = dist_u + (1 if weights is None else weights[i])
+            if max_dist is not None and new_cost > max_dist:
+                continue
+            if dist[vertex] == UNREACHABLE or new_cost < dist[vertex]:
+                dist[vertex] = new_cost
+                prev[vertex] = u
+                priority = new_cost
+                if heuristic is not None:
+                    priority += heuristic(vertex, target)
+                heapq.heappush(pq, (priority, new_cost, vertex))
+    return dist, prev
+
+
+def reversed_graph(graph: dict[HT, dict[HT, int]]) -> dict[HT, dict[HT, int]]:
+    result = {vertex: {} for vertex in graph}
+    for u, edges in graph.items():
+        for vertex, val in edges.items():
+            result.setdefault(vertex, {})[u] = val
+    return result
+
+
+class BidirectionalSearchResult(NamedTuple):
+    dist: int | float | None
+    meeting: HT | None
+    forward_prev: dict[HT, HT]
+    backward_prev: dict[HT, HT]
+    expanded: int
+
+    def path(self) -> list[HT]:
+        """Reconstruct path from source to target, empty if there is no path."""
+        if self.meeting is None:
+            return []
+        path = []
+        vertex = self.meeting
+        while vertex is not None:
+            path.append(vertex)
+            vertex = self.forward_prev[vertex]
+        path.reverse()
+        vertex = self.backward_prev[self.meeting]
+        while vertex is not None:
+            path.append(vertex)
+            vertex = self.backward_prev[vertex]
+        return path
+
+
+def bidirectional_dijkstra(
+    graph: dict[HT, dict[HT, int]],
+    source: HT,
+    target: HT,
+    reverse_graph: dict[HT, dict[HT, int]] | None = None,
+) -> BidirectionalSearchResult:
+    """
+    Search from source and target at the same time until frontiers meet.
+
+    :param graph: graph in format {vertex: {neighbor: cost}}
+    :param reverse_graph: graph with reversed edges, built if not set;
+        for undirected graphs pass `graph` itself
+    :return: result with distance (None if target is unreachable),
+        path reconstructor and number of expanded vertices
+    """
+    return _bidirectional_search(
+        graph, source, target, reverse_graph, potential=lambda vertex: 0
+    )
+
+
+def bidirectional_a_star(
+    graph: dict[HT, dict[HT, int]],
+    source: HT,
+    target: HT,
+    heuristic: Callable[[HT, HT], int],
+    reverse_graph: dict[HT, dict[HT, int]] | None = None,
+) -> BidirectionalSearchResult:
+    """
+    Bidirectional A* with average potentials (Ikeda et al.).
+
+    heuristic must be consistent and symmetric (like Manhattan distance),
+    see `a_star` and `bidirectional_dijkstra` for other params.
+    """
+    return _bidirectional_search(
+        graph,
+        source,
+        target,
+        reverse_graph,
+        potential=lambda vertex: (heuristic(vertex, target) - heuristic(source, vertex))
+        / 2,
+    )
+
+
+def _bidirectional_search(
+    graph: dict[HT, dict[HT, int]],
+    source: HT,
+    target: HT,
+    reverse_graph: dict[HT, dict[HT, int]] | None,
+    potential: Callable[[HT], float],
+) -> BidirectionalSearchResult:
+    # Forward search uses `potential` and backward one uses `-potential`,
+    # so both run over the same reduced costs and can stop as soon as
+    # sum of their smallest keys reaches the best found distance.
+    if reverse_graph is None:
+        reverse_graph = reversed_graph(graph)
+    graphs = (graph, reverse_graph)
+    signs = (1, -1)
+    dists = ({source: 0}, {target: 0})
+    prevs = ({source: None}, {target: None})
+    queues = ([(potential(source), 0, source)], [(-potential(target), 0, target)])
+    best, meeting = (0, source) if source == target else (None, None)
+    expanded = 0
+    while queues[0] and queues[1]:
+        if best is not None and queues[0][0][0] + queues[1][0][0] >= best:
+            break
+
+        side = 0 if queues[0][0][0] <= queues[1][0][0] else 1
+        _, dist_u, u = heapq.heappop(queues[side])
+        dist, other_dist = dists[side], dists[1 - side]
+        if dist_u > dist[u]:
+            continue
+        expanded += 1
+        for vertex, val in graphs[side][u].items():
+            new_dist = dist_u + val
+            if vertex not in dist or new_dist < dist[vertex]:
+                dist[vertex] = new_dist
+                prevs[side][vertex] = u
+                priority = new_dist + signs[side] * potential(vertex)
+                heapq.heappush(queues[side], (priority, new_dist, vertex))
+                if vertex in other_dist:
+                    total = new_dist + other_dist[vertex]
+                    if best is None or total < best:
+                        best, meeting = total, vertex
+
+    return BidirectionalSearchResult(best, meeting, *prevs, expanded)
+
+
+class CycleError(ValueError):
+    """Raised by topological sort, `cycle` contains nodes of one of the cycles."""
+
+    def __init__(self, cycle: list[HT]) -> None:
+        super().__init__(f"graph has at least one cycle: {cycle}")
+        self.cycle = cycle
+
+
+def topological_sort(graph: dict[HT, list[HT]]) -> list[HT]:
+    """
+    Iterative Kahn's algorithm.
+
+    https://en.wikipedia.org/wiki/Topological_sorting#Kahn's_algorithm
+
+    :param graph: node -> list of nodes that must go after it
+    :return: nodes in reverse topological order (every node goes after
+        all of its neighbors)
+    :raises CycleError: if graph has a cycle
+    """
+    return topological_sort_many(graph, [None])[0]
+
+
+def topological_sort_many(
+    graph: dict[HT, list[HT]], subsets: Iterable[Iterable[HT] | None]
+) -> list[list[HT]]:
+    """
+    Sort many subsets of nodes against one precedence graph.
+
+    Graph is indexed once, then each subset is sorted in time linear
+    to its size plus the number of edges going out of its nodes.
+    Global graph may have cycles, only subsets must be acyclic.
+
+    :param graph: see `topological_sort`
+    :param subsets: iterable of nodes subsets, None means all nodes.
+        Nodes missing from the graph have no constraints.
+    :return: sorted subsets, in the same order as `topological_sort`
+    :raises CycleError: if any subset has a cycle
+    :raises ValueError: if a subset has the same node twice
+    """
+    ids = {}
+    nodes = []
+    successors = []
+
+    def node_id(node: HT) -> int:
+        idx = ids.get(node)
+        if idx is None:
+            idx = ids[node] = len(nodes)
+            nodes.append(node)
+            successors.append([])
+        return idx
+
+    for node, neighbors in graph.items():
+        idx = node_id(node)
+        successors[idx].extend([node_id(neighbor) for neighbor in neighbors])
+
+    results = []
+    for subset in subsets:
+        # nodes missing from the graph get ids after the indexed ones, only
+        # for this subset, so queries don't change the index
+        extra_ids = {}
+        if subset is None:
+            subset_ids = range(len(nodes))
+        else:
+            subset_ids = {}
+            for node in subset:
+                idx = ids.get(node)
+                if idx is None:
+                    idx = extra_ids.setdefault(node, len(nodes) + len(extra_ids))
+                if idx in subset_ids:
+                    raise ValueError(f"node {node!r} is in subset twice")
+                subset_ids[idx] = None
+        extra_nodes = list(extra_ids)
+        results.append(
+            [
+                nodes[idx] if idx < len(nodes) else extra_nodes[idx - len(nodes)]
+                for idx in _kahn(subset_ids, successors, nodes)
+            ]
+        )
+    return results
+
+
+def _kahn(
+    subset: Iterable[int], successors: list[list[int]], nodes: list[HT]
+) -> list[int]:
+    """Ids past the end of `successors` are nodes without edges."""
+    out_degree = dict.fromkeys(subset, 0)
+    predecessors = {u: [] for u in out_degree}
+    for u in out_degree:
+        for v in successors[u] if u < len(successors) else ():
+            if v in out_degree:
+                out_degree[u] += 1
+                predecessors[v].append(u)
+
+    result = [u for u, degree in out_degree.items() if degree == 0]
+    # result doubles as a queue: nodes are appended once they are ready
+    for v in result:
+        for u in predecessors[v]:
+            out_degree[u] -= 1
+            if out_degree[u] == 0:
+                result.append(u)
+
+    if len(result) < len(out_degree):
+        cycle = _find_cycle(out_degree, successors)
+        # nodes without edges can't be in a cycle, so all of it is indexed
+        raise CycleError([nodes[idx] for idx in cycle])
+    return result
+
+
+def _find_cycle(out_degree: dict[int, int], successors: list[list[int]]) -> list[int]:
+    # every node that is left has at least one successor that is left too
+    left = {u for u, degree in out_degree.items() if degree > 0}
+    path = {}
+    u = next(iter(left))
+    while u not in path:
+        path[u] = len(path)
+        u = next(v for v in successors[u] if v in left)
+    return list(path)[path[u] :]
+
+
+def iter_bits(mask: int) -> Iterator[int]:
+    """Yield indices of set bits, from the lowest one."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class GraphCycleFinder:
+    """
+    Cliques in undirected graph.
+
+    Vertex sets are int bitmasks over vertex indices, so set operations
+    are single big int operations.
+    """
+
+    def __init__(self, graph: dict[HT, list[HT]] | None = None) -> None:
+        self.graph = graph or {}
+        self.cliques = []
+
+    def add_edge(self, u: HT, v: HT) -> None:
+        self.graph.setdefault(u, []).append(v)
+        self.graph.setdefault(v, []).append(u)
+
+    def _build_adjacency(self) -> tuple[list[HT], list[set[int]]]:
+        ids = {}
+        for node, neighbors in self.graph.items():
+            ids.setdefault(node, len(ids))
+            for neighbor in neighbors:
+                ids.setdefault(neighbor, len(ids))
+        adjacency = [set() for _ in ids]
+        for node, neighbors in self.graph.items():
+            u = ids[node]
+            for neighbor in neighbors:
+                v = ids[neighbor]
+                if u != v:
+                    adjacency[u].add(v)
+                    adjacency[v].add(u)
+        return list(ids), adjacency
+
+    @staticmethod
+    def degeneracy_order(adjacency: list[set[int]]) -> list[int]:
+        """
+        Repeatedly take vertex with the smallest degree among remaining ones.
+
+        https://en.wikipedia.org/wiki/Degeneracy_(graph_theory)
+        """
+        degrees = [len(neighbors) for neighbors in adjacency]
+        buckets = [set() for _ in range(max(degrees, default=0) + 1)]
+        for u, degree in enumerate(degrees):
+            buckets[degree].add(u)
+        removed = [False] * len(adjacency)
+        order = []
+        min_degree = 0
+        for _ in range(len(adjacency)):
+            while not buckets[min_degree]:
+                min_degree += 1
+            u = buckets[min_degree].pop()
+            removed[u] = True
+            order.append(u)
+            for v in adjacency[u]:
+                if not removed[v]:
+                    buckets[degrees[v]].remove(v)
+                    degrees[v] -= 1
+                    buckets[degrees[v]].add(v)
+            min_degree = max(min_degree - 1, 0)
+        return order
+
+    def _iter_subproblems(
+        self,
+        adjacency: list[set[int]],
+        min_size: Callable[[], int] = lambda: 0,
+        with_excluded: bool = True,
+    ) -> Iterator[tuple[int, list[int], list[int], int, int]]:
+        """
+        Split search by vertices in degeneracy order: cliques containing
+        vertex `v` consist of its neighbors, later ones are candidates (p)
+        and earlier ones are excluded (x). Every vertex has few later
+        neighbors in this order, and neighbors are reindexed locally,
+        so bitmasks stay small.
+
+        :param min_size: skip vertices that can't be in a clique bigger than this
+        :param with_excluded: build x, it is needed only to check maximality
+        """
+        order = self.degeneracy_order(adjacency)
+        position = [0] * len(order)
+        for i, u in enumerate(order):
+            position[u] = i
+
+        for v in order:
+            v_position = position[v]
+            neighbors = adjacency[v]
+            later = [u for u in neighbors if position[u] > v_position]
+            if 1 + len(later) <= min_size():
+                continue
+
+            if with_excluded:
+                neighbors_set = neighbors
+                neighbors = later + [u for u in neighbors if position[u] < v_position]
+            else:
+                neighbors, neighbors_set = later, set(later)
+            local = {u: i for i, u in enumerate(neighbors)}
+            masks = []
+            for u in neighbors:
+                mask = 0
+                for w in adjacency[u] & neighbors_set:
+                    mask |= 1 << local[w]
+                masks.append(mask)
+            p = (1 << len(later)) - 1
+            x = ((1 << len(neighbors)) - 1) & ~p
+            yield v, neighbors, masks, p, x
+
+    def bron_kerbosch(self, r: int, p: int, x: int, masks: list[int]) -> Iterator[int]:
+        """
+        Bron–Kerbosch algorithm with Tomita pivoting.
+
+        https://en.wikipedia.org/wiki/Bron%E2%80%93Kerbosch_algorithm
+        :return: maximal cliques as bitmasks
+        """
+        if not p and not x:
+            yield r
+            return
+
+        # pivot with the most neighbors in p leaves the fewest branches
+        pivot = max(iter_bits(p | x), key=lambda u: (p & masks[u]).bit_count())
+        for v in iter_bits(p & ~masks[pivot]):
+            bit = 1 << v
+            yield from self.bron_kerbosch(r | bit, p & masks[v], x & masks[v], masks)
+            p &= ~bit
+            x |= bit
+
+    def find_cliques(self) -> list[set[HT]]:
+        """Find all maximal cliques in the graph."""
+        nodes, adjacency = self._build_adjacency()
+        self.cliques = [
+            {nodes[v], *(nodes[neighbors[i]] for i in iter_bits(clique))}
+            for v, neighbors, masks, p, x in self._iter_subproblems(adjacency)
+            for clique in self.bron_kerbosch(0, p, x, masks)
+        ]
+        return self.cliques
+
+    def find_cycles(self) -> list[set[HT]]:
+        """Maximal cliques of at least 3 nodes, every such clique is a cycle."""
+        return [clique for clique in self.find_cliques() if len(clique) >= 3]
+
+    def max_clique(self) -> set[HT]:
+        """Find maximum clique, pruning branches that can't beat the best one."""
+        nodes, adjacency = self._build_adjacency()
+        best = set()
+
+        def expand(r: int, r_size: int, p: int) -> None:
+            nonlocal best_r, best_size
+            if not p:
+                if r_size > best_size:
+                    best_r, best_size = r, r_size
+                return
+
+            pivot = max(iter_bits(p), key=lambda u: (p & masks[u]).bit_count())
+            for u in iter_bits(p & ~masks[pivot]):
+                if r_size + p.bit_count() <= best_size:
+                    return
+                expand(r | 1 << u, r_size + 1, p & masks[u])
+                p &= ~(1 << u)
+
+        subproblems = self._iter_subproblems(
+            adjacency, min_size=lambda: len(best), with_excluded=False
+        )
+        for v, neighbors, masks, p, _ in subproblems:
+            best_r, best_size = None, len(best)
+            expand(0, 1, p)
+            if best_r is not None:
+                best = {nodes[v], *(nodes[neighbors[i]] for i in iter_bits(best_r))}
+        return best
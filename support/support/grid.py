@@ -0,0 +1,414 @@
+"""Directions, `Matrix` and `Grid`."""
+
+from __future__ import annotations
+
+import itertools
+import random
+from array import array
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Callable, Generator, Iterable, Iterator, NamedTuple, TypeVar
+
+
+class Vector2D(NamedTuple):
+    x: int
+    y: int
+
+    def __add__(self, other: Vector2D | tuple[int, int]) -> Vector2D:
+        x, y = other
+        return Vector2D(self.x + x, self.y + y)
+
+    def __mul__(self, other: int) -> Vector2D:
+        return Vector2D(self.x * other, self.y * other)
+
+
+class Direction(Vector2D, Enum):
+    UP = Vector2D(-1, 0)
+    DOWN = Vector2D(1, 0)
+    LEFT = Vector2D(0, -1)
+    RIGHT = Vector2D(0, 1)
+    UPLEFT = Vector2D(-1, -1)
+    UPRIGHT = Vector2D(-1, 1)
+    DOWNLEFT = Vector2D(1, -1)
+    DOWNRIGHT = Vector2D(1, 1)
+
+
+Coords = tuple[int, int]
+inf_coords = (float("inf"), float("inf"))
+T = TypeVar("T")
+
+CROSS_OFFSETS = ((0, -1), (-1, 0), (1, 0), (0, 1))
+DIAG_OFFSETS = ((-1, -1), (1, -1), (-1, 1), (1, 1))
+# clockwise order (from up-left corner)
+ALL_OFFSETS = ((-1, -1), (-1, 0), (-1, 1), (0, 1), (1, 1), (1, 0), (1, -1), (0, -1))
+NEIGHBOR_OFFSETS = {
+    "cross": CROSS_OFFSETS,
+    "diag": DIAG_OFFSETS,
+    "cross_diag": CROSS_OFFSETS + DIAG_OFFSETS,
+    "cross_diag_all": ALL_OFFSETS,
+}
+
+
+class NeighborIndex(NamedTuple):
+    """
+    Neighbors of every cell in CSR layout: neighbors of the cell with flat
+    index `i` (`m * n_len + n`) are `targets[offsets[i] : offsets[i + 1]]`,
+    also flat indexes (-1 for out of bounds cells of "cross_diag_all" kind).
+    """
+
+    offsets: array
+    targets: array
+
+
+@dataclass
+class Matrix:
+    data: list[list[T]]
+    neighbor_index: dict[str, NeighborIndex] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+
+    @property
+    def m_len(self) -> int:
+        return len(self.data)
+
+    @property
+    def n_len(self) -> int:
+        return len(self.data[0])
+
+    @property
+    def bounds(self) -> tuple[int, int]:
+        return self.m_len - 1, self.n_len - 1
+
+    @classmethod
+    def create_from_input(
+        cls, s: str, *, split_by: str = "", cast_func: Callable[[str], T] = str
+    ) -> Matrix:
+        matrix = []
+        for line in s.strip().splitlines():
+            if split_by:
+                line = line.split(split_by)
+            if cast_func is not str:
+                matrix.append([cast_func(item) for item in line])
+            else:
+                matrix.append(list(line))
+
+        return cls(matrix)
+
+    def __iter__(self) -> Iterator[list[T]]:
+        return iter(self.data)
+
+    def __getitem__(self, m: int) -> list[T]:
+        return self.data[m]
+
+    def copy(self) -> Matrix:
+        # neighbor tables depend only on the shape, so they can be shared
+        return Matrix([row.copy() for row in self.data], dict(self.neighbor_index))
+
+    def build_neighbor_index(self, kind: str = "cross") -> NeighborIndex:
+        """
+        Precompute neighbors of every cell, so `neighbors_*` methods become
+        array slices instead of building and filtering coords on every call.
+
+        Table is flat (`m * n_len + n`) and contains only in-bounds neighbors,
+        except for "cross_diag_all" kind where out of bounds cells are -1
+        (returned as None). Opt-in, because it costs memory (about 5 ints per
+        cell for "cross"): worth it when neighbors of the same cells are
+        requested many times.
+
+        :param kind: one of "cross", "diag", "cross_diag", "cross_diag_all"
+        :return: built table
+        """
+        if kind in self.neighbor_index:
+            return self.neighbor_index[kind]
+        try:
+            neighbor_offsets = NEIGHBOR_OFFSETS[kind]
+        except KeyError:
+            raise ValueError(f"unknown neighbors {kind=}") from None
+
+        keep_out_of_bounds = kind == "cross_diag_all"
+        m_len, n_len = self.m_len, self.n_len
+        offsets = array("i", [0])
+        targets = array("i")
+        for m in range(m_len):
+            for n in range(n_len):
+                for dm, dn in neighbor_offsets:
+                    next_m, next_n = m + dm, n + dn
+                    if 0 <= next_m < m_len and 0 <= next_n < n_len:
+                        targets.append(next_m * n_len + next_n)
+                    elif keep_out_of_bounds:
+                        targets.append(-1)
+                offsets.append(len(targets))
+
+        index = self.neighbor_index[kind] = NeighborIndex(offsets, targets)
+        return index
+
+    def _indexed_neighbors(self, kind: str, m: int, n: int) -> Iterator[Coords] | None:
+        """Neighbors from index, None if there is no index or cell is out of it."""
+        index = self.neighbor_index.get(kind)
+        n_len = len(self.data[0])
+        if index is None or not (0 <= m < len(self.data) and 0 <= n < n_len):
+            return None
+        i = m * n_len + n
+        start, end = index.offsets[i], index.offsets[i + 1]
+        return map(divmod, index.targets[start:end], itertools.repeat(n_len))
+
+    def neighbors_cross(self, m: int, n: int) -> Iterator[Coords]:
+        if (indexed := self._indexed_neighbors("cross", m, n)) is not None:
+            return indexed
+        neighbors = (
+            (m, n - 1),
+            (m - 1, n),
+            (m + 1, n),
+            (m, n + 1),
+        )
+        return filter_neighbors(neighbors, max_bounds=self.bounds)
+
+    def neighbors_diag(self, m: int, n: int) -> Iterator[Coords]:
+        if (indexed := self._indexed_neighbors("diag", m, n)) is not None:
+            return indexed
+        neighbors = (
+            (m - 1, n - 1),
+            (m + 1, n - 1),
+            (m - 1, n + 1),
+            (m + 1, n + 1),
+        )
+        return filter_neighbors(neighbors, max_bounds=self.bounds)
+
+    def neighbors_cross_diag(self, m: int, n: int) -> Iterator[Coords]:
+        if (indexed := self._indexed_neighbors("cross_diag", m, n)) is not None:
+            return indexed
+        return itertools.chain(self.neighbors_cross(m, n), self.neighbors_diag(m, n))
+
+    def neighbors_cross_diag_all(
+        self, m: int, n: int, *, default=None
+    ) -> Iterator[Coords | None]:
+        """
+        Return all neighbors, including out of bounds.
+        Clockwise order (from up-left corner).
+        """
+        indexed = self._indexed_neighbors("cross_diag_all", m, n)
+        if indexed is not None and default is None:
+            # -1 (out of bounds) becomes (-1, n_len - 1) after divmod
+            return (None if coords[0] < 0 else coords for coords in indexed)
+        max_m, max_n = self.bounds
+        return (
+            (
+                (m + dm, n + dn)
+                if 0 <= m + dm <= max_m and 0 <= n + dn <= max_n
+                else default
+            )
+            for dm, dn in ALL_OFFSETS
+        )
+
+    def next_coords(
+        self, m: int, n: int, direction: Vector2D, size: int = 1
+    ) -> Coords | None:
+        next_m, next_n = m + direction.x * size, n + direction.y * size
+        if (
+            0 > next_m
+            or 0 > next_n
+            or next_m > self.bounds[0]
+            or next_n > self.bounds[1]
+        ):
+            return None
+
+        return next_m, next_n
+
+    def get_values(self, m: int, n: int, direction: Vector2D, size: int = 2) -> list[T]:
+        results = []
+        for i in range(size):
+            next_m, next_n = m + direction.x * i, n + direction.y * i
+            if next_m < 0 or next_n < 0:
+                return results
+
+            try:
+                results.append(self.data[next_m][next_n])
+            except IndexError:
+                return results
+        return results
+
+
+DIGITS_TO_VALUES = bytes.maketrans(b"0123456789", bytes(range(10)))
+
+
+class Grid:
+    """
+    Matrix of single-byte cells backed by one contiguous bytearray.
+
+    Cell (m, n) lives at flat index `m * n_len + n`. Rows are memoryviews
+    over the same buffer, so `grid[m][n]` returns (and accepts) an int
+    byte value: compare with `ord("#")` or `b"#"[0]`, not with "#".
+    """
+
+    __slots__ = ("data", "width", "height", "_rows")
+
+    def __init__(self, data: bytearray, width: int, height: int) -> None:
+        if len(data) != width * height:
+            raise ValueError(f"{len(data)=} must be equal to {width * height=}")
+        self.data = data
+        self.width = width
+        self.height = height
+        view = memoryview(data)
+        self._rows = [view[m * width : (m + 1) * width] for m in range(height)]
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.height}x{self.width})"
+
+    @property
+    def m_len(self) -> int:
+        return self.height
+
+    @property
+    def n_len(self) -> int:
+        return self.width
+
+    @property
+    def bounds(self) -> tuple[int, int]:
+        return self.height - 1, self.width - 1
+
+    @classmethod
+    def create_from_input(cls, s: str | bytes, *, digits: bool = False) -> Grid:
+        """
+        Build grid directly from input.
+
+        With `digits=True` cells "0".."9" are stored as values 0..9.
+        """
+        if isinstance(s, str):
+            s = s.encode()
+        lines = s.strip().splitlines()
+        width = len(lines[0]) if lines else 0
+        if any(len(line) != width for line in lines):
+            raise ValueError("all lines must have the same length")
+        data = bytearray().join(lines)
+        if digits:
+            data = data.translate(DIGITS_TO_VALUES)
+        return cls(data, width, len(lines))
+
+    @classmethod
+    def filled(cls, m_len: int, n_len: int, value: bytes = b".") -> Grid:
+        return cls(bytearray(value * (m_len * n_len)), n_len, m_len)
+
+    def __iter__(self) -> Iterator[memoryview]:
+        return iter(self._rows)
+
+    def __getitem__(self, m: int) -> memoryview:
+        return self._rows[m]
+
+    def copy(self) -> Grid:
+        return Grid(self.data.copy(), self.width, self.height)
+
+    def index(self, m: int, n: int) -> int:
+        return m * self.width + n
+
+    def coords(self, idx: int) -> Coords:
+        return divmod(idx, self.width)
+
+    def find(self, value: bytes) -> Coords | None:
+        idx = self.data.find(value)
+        if idx == -1:
+            return None
+        return self.coords(idx)
+
+    def neighbors_cross(self, m: int, n: int) -> Generator[Coords, None, None]:
+        if n > 0:
+            yield m, n - 1
+        if m > 0:
+            yield m - 1, n
+        if m < self.height - 1:
+            yield m + 1, n
+        if n < self.width - 1:
+            yield m, n + 1
+
+    def neighbors_cross_idx(self, idx: int) -> Generator[int, None, None]:
+        """Same as `neighbors_cross`, but for flat indices."""
+        width = self.width
+        n = idx % width
+        if n > 0:
+            yield idx - 1
+        if idx >= width:
+            yield idx - width
+        if idx + width < len(self.data):
+            yield idx + width
+        if n < width - 1:
+            yield idx + 1
+
+    def next_coords(
+        self, m: int, n: int, direction: Vector2D, size: int = 1
+    ) -> Coords | None:
+        next_m, next_n = m + direction.x * size, n + direction.y * size
+        if not (0 <= next_m < self.height and 0 <= next_n < self.width):
+            return None
+        return next_m, next_n
+
+    def get_values(
+        self, m: int, n: int, direction: Vector2D, size: int = 2
+    ) -> bytearray:
+        """Same as `Matrix.get_values`, but values are returned as bytearray."""
+        height, width = self.height, self.width
+        if not (0 <= m < height and 0 <= n < width):
+            return bytearray()
+        dm, dn = direction
+        last_m, last_n = m + dm * (size - 1), n + dn * (size - 1)
+        if not (0 <= last_m < height and 0 <= last_n < width):
+            # clip size to the number of steps that stay inside the grid
+            for delta, pos, length in ((dm, m, height), (dn, n, width)):
+                if delta > 0:
+                    size = min(size, length - pos)
+                elif delta < 0:
+                    size = min(size, pos + 1)
+        start = m * width + n
+        if size <= 1:
+            # step is 0 for UPRIGHT and DOWNLEFT on a grid one column wide
+            return self.data[start : start + max(size, 0)]
+        step = dm * width + dn
+        end = start + step * size
+        return self.data[start : end if end >= 0 else None : step]
+
+
+def filter_neighbors(
+    neighbors: Iterable[Coords], *, max_bounds: Coords = inf_coords
+) -> Generator[Coords, None, None]:
+    yield from (
+        (m, n)
+        for m, n in neighbors
+        if 0 <= m <= max_bounds[0] and 0 <= n <= max_bounds[1]
+    )
+
+
+def cartesian_shortest_path(coords1: Coords, coords2: Coords) -> int:
+    return abs(coords1[0] - coords2[0]) + abs(coords1[1] - coords2[1])
+
+
+def random_maze(
+    m_len: int, n_len: int, rng: random.Random, *, loops: float = 0.0
+) -> list[list[str]]:
+    """
+    Perfect maze (randomized DFS) of "#" walls and "." cells on odd coords,
+    surrounded by walls. `loops` is a share of inner walls to knock down
+    to make more than one path between cells.
+    """
+    maze = [["#"] * n_len for _ in range(m_len)]
+    maze[1][1] = "."
+    stack = [(1, 1)]
+    while stack:
+        m, n = stack[-1]
+        candidates = [
+            (m + dm, n + dn)
+            for dm, dn in ((-2, 0), (0, 2), (2, 0), (0, -2))
+            if 0 < m + dm < m_len - 1
+            and 0 < n + dn < n_len - 1
+            and maze[m + dm][n + dn] == "#"
+        ]
+        if not candidates:
+            stack.pop()
+            continue
+        next_m, next_n = rng.choice(candidates)
+        maze[(m + next_m) // 2][(n + next_n) // 2] = "."
+        maze[next_m][next_n] = "."
+        stack.append((next_m, next_n))
+
+    for m in range(1, m_len - 1):
+        for n in range(1, n_len - 1):
+            if maze[m][n] == "#" and (m + n) % 2 == 1 and rng.random() < loops:
+                maze[m][n] = "."
+    return maze
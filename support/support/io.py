@@ -0,0 +1,134 @@
+"""Parsing and printing helpers."""
+
+from __future__ import annotations
+
+import mmap
+import os
+import re
+from array import array
+from typing import TYPE_CHECKING, Any, Generator, TextIO, Union
+
+if TYPE_CHECKING:
+    from support.grid import Grid
+
+BytesLike = Union[bytes, bytearray, memoryview, mmap.mmap]
+
+INTS_RE = re.compile(rb"-?\d+")
+# everything except digits and minus becomes a separator
+INTS_SEPARATORS = bytes(c if c in b"-0123456789" else ord(" ") for c in range(256))
+
+
+def humanized_seconds(seconds: float) -> str:
+    """Convert seconds to human-readable format."""
+
+    if seconds >= 1:
+        return f"{seconds:.2f}s"
+    elif seconds >= 0.001:
+        return f"{seconds * 1000:.0f}ms"
+    elif seconds >= 0.000_001:
+        return f"{seconds * 1_000_000:.0f}μs"
+    else:
+        return f"{seconds * 1_000_000_000:.0f}ns"
+
+
+def humanized_bytes(size: float) -> str:
+    for unit in ("B", "KB", "MB"):
+        if abs(size) < 1024:
+            return f"{size:.0f}{unit}"
+        size /= 1024
+    return f"{size:.1f}GB"
+
+
+def print_matrix(matrix: list[list[Any]], file: TextIO | None = None) -> None:
+    if not matrix or not matrix[0]:
+        print("Empty matrix")
+        return
+
+    # Find the maximum length of any item in the matrix for formatting.
+    max_item_len = max(len(str(item)) for row in matrix for item in row)
+
+    # Determine the width for row and column labels.
+    row_label_width = len(str(len(matrix) - 1))
+    col_label_width = max(max_item_len, len(str(len(matrix[0]) - 1)))
+
+    # Print column headers.
+    col_headers = [" " * row_label_width] + [
+        f"{i:<{col_label_width}}" for i in range(len(matrix[0]))
+    ]
+    if file is None:
+        # For cases when printing in pytest or etc.
+        print()
+    print(" ".join(col_headers), file=file)
+
+    # Print each row with its label.
+    for i, row in enumerate(matrix):
+        row_str = [f"{i:<{row_label_width}}"] + [
+            f"{str(item):<{col_label_width}}" for item in row
+        ]
+        print(" ".join(row_str), file=file)
+
+
+def iter_lines_as_numbers(s: str) -> Generator[int, None, None]:
+    for line in s.strip().splitlines():
+        yield int(line)
+
+
+def read_input_bytes(path: str | os.PathLike[str]) -> mmap.mmap | bytes:
+    """
+    Map input file to memory without decoding it.
+
+    Result supports slicing, `find` and bytes regexes, so it can be passed
+    to `ints` and `int_grid` directly. Empty files can't be mapped,
+    for them b"" is returned.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return b""
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def ints(buf: BytesLike | str) -> array[int]:
+    """All integers (with optional leading minus) found in `buf`."""
+    data = buf.encode() if isinstance(buf, str) else bytes(buf)
+    try:
+        # splitting is about twice as fast as `re.findall`
+        return array("q", map(int, data.translate(INTS_SEPARATORS).split()))
+    except ValueError:
+        # minus that is not a sign, e.g. "1-2" or " - "
+        return array("q", map(int, INTS_RE.findall(data)))
+
+
+def int_grid(buf: BytesLike | str) -> Grid:
+    """
+    `Grid` of digits, cells "0".."9" are stored as values 0..9.
+
+    Same as `Grid.create_from_input(s, digits=True)`, but lines are
+    not split into separate objects: newlines are dropped in one
+    `translate` pass over the whole buffer.
+    """
+    # not at module level: `sup.ints` alone shouldn't import grid
+    from support.grid import DIGITS_TO_VALUES, Grid
+
+    data = bytearray(buf.encode() if isinstance(buf, str) else buf)
+    end = len(data)
+    while end and data[end - 1] in b"\r\n":
+        end -= 1
+    del data[end:]
+
+    if not data:
+        return Grid(data, 0, 0)
+
+    line_end = data.find(b"\n")
+    if line_end == -1:
+        line_end = len(data)
+    sep_len = 2 if data[line_end - 1 : line_end] == b"\r" else 1
+    line_len = line_end + 1
+    height = data.count(b"\n") + 1
+    # with lines of the same length every newline is at a multiple of line_len
+    if data[line_len - 1 :: line_len] != b"\n" * (height - 1) or (
+        len(data) + sep_len != line_len * height
+    ):
+        raise ValueError("all lines must have the same length")
+    data = data.translate(DIGITS_TO_VALUES, b"\r\n")
+    width = len(data) // height
+    return Grid(data, width, height)
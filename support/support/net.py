@@ -0,0 +1,133 @@
+"""Download of inputs and submit of answers to adventofcode.com."""
+
+from __future__ import annotations
+
+import argparse
+import os.path
+import re
+import sys
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+
+from support.days import ROOT
+
+
+def _get_cookie_headers() -> dict[str, str]:
+    with open(os.path.join(ROOT, ".env")) as f:
+        contents = f.read().strip()
+    return {"Cookie": contents, "User-Agent": "Merry Christmas!"}
+
+
+def get_input(year: int, day: int) -> str:
+    url = f"https://adventofcode.com/{year}/day/{day}/input"
+    req = urllib.request.Request(url, headers=_get_cookie_headers())
+    return urllib.request.urlopen(req).read().decode()
+
+
+def get_year_day() -> tuple[int, int]:
+    cwd = os.getcwd()
+    day_s = os.path.basename(cwd)
+    year_s = os.path.basename(os.path.dirname(cwd))
+
+    if not day_s.startswith("day") or not year_s.startswith("advent_of_code_"):
+        raise AssertionError(f"unexpected working dir: {day_s=} {year_s=}")
+    year_index = len("advent_of_code_")
+    day_index = len("day")
+    return int(year_s[year_index:]), int(day_s[day_index:])
+
+
+def download_input() -> int:
+    parser = argparse.ArgumentParser()
+    parser.parse_args()
+
+    year, day = get_year_day()
+
+    for i in range(5):
+        try:
+            s = get_input(year, day)
+        except urllib.error.URLError as e:
+            print(f"zzz: not ready yet: {e}")
+            time.sleep(1)
+        else:
+            break
+    else:
+        raise SystemExit("timed out after attempting many times")
+
+    with open("input.txt", "w") as f:
+        f.write(s)
+
+    lines = s.splitlines()
+    if len(lines) > 10:
+        for line in lines[:10]:
+            print(line)
+        print("...")
+    else:
+        print(lines[0][:80])
+        print("...")
+
+    return 0
+
+
+TOO_QUICK = re.compile("You gave an answer too recently.*to wait.")
+WRONG = re.compile(r"That's not the right answer.*?\.")
+RIGHT = "That's the right answer!"
+ALREADY_DONE = re.compile(r"You don't seem to be solving.*\?")
+
+
+def _post_answer(year: int, day: int, part: int, answer: int) -> str:
+    params = urllib.parse.urlencode({"level": part, "answer": answer})
+    req = urllib.request.Request(
+        f"https://adventofcode.com/{year}/day/{day}/answer",
+        method="POST",
+        data=params.encode(),
+        headers=_get_cookie_headers(),
+    )
+    resp = urllib.request.urlopen(req)
+
+    return resp.read().decode()
+
+
+def submit_solution() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--part", type=int, required=True)
+    args = parser.parse_args()
+
+    year, day = get_year_day()
+    answer = int("".join(char for char in sys.stdin.read() if char.isdigit()))
+
+    print(f"answer: {answer}")
+
+    contents = _post_answer(year, day, args.part, answer)
+
+    for error_regex in (WRONG, TOO_QUICK, ALREADY_DONE):
+        error_match = error_regex.search(contents)
+        if error_match:
+            print(f"\033[41m{error_match[0]}\033[m")
+            return 1
+
+    if RIGHT in contents:
+        print(f"\033[42m{RIGHT}\033[m")
+        return 0
+    else:
+        # unexpected output?
+        print(contents)
+        return 1
+
+
+def submit_25_pt2() -> int:
+    parser = argparse.ArgumentParser()
+    parser.parse_args()
+
+    year, day = get_year_day()
+
+    assert day == 25, day
+    contents = _post_answer(year, day, part=2, answer=0)
+
+    if "Congratulations!" in contents:
+        print("\033[42mCongratulations!\033[m")
+        return 0
+    else:
+        print(contents)
+        return 1
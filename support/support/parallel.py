@@ -0,0 +1,220 @@
+"""Process pool shared by days and read-only data in shared memory."""
+
+from __future__ import annotations
+
+import functools
+import importlib
+import math
+import multiprocessing
+import multiprocessing.util
+import os.path
+import pickle
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Any, Callable, Iterable, TypeVar
+
+from support.days import DAY_DIR_RE, import_day_module
+
+T = TypeVar("T")
+
+MAX_WORKERS_ENV = "AOC_MAX_WORKERS"
+
+
+def max_workers() -> int:
+    """
+    Number of workers for pools inside `compute`. `aoc run --jobs K` sets it
+    to a share of cores per job, so nested pools don't oversubscribe cores.
+    """
+    return int(os.environ.get(MAX_WORKERS_ENV, 0)) or os.cpu_count() or 1
+
+
+def pool_chunksize(items_count: int, workers: int) -> int:
+    """About 4 chunks per worker, like `multiprocessing.Pool.map`."""
+    return max(math.ceil(items_count / (workers * 4)), 1)
+
+
+class WorkerPool:
+    """
+    Process pool which is started on first `map` and reused by next calls,
+    so `compute` pays for workers startup once per process, not per call.
+    With one worker `map` runs in the calling process.
+    """
+
+    def __init__(self, workers: int | None = None) -> None:
+        self.workers = workers or max_workers()
+        self.pid = os.getpid()
+        self._executor: ProcessPoolExecutor | None = None
+
+    def map(
+        self,
+        func: Callable[..., T],
+        iterable: Iterable[Any],
+        *,
+        shared: Any = None,
+        chunksize: int | None = None,
+    ) -> list[T]:
+        """
+        Like `executor.map`, but with adaptive `chunksize` by default.
+
+        With `shared` it calls `func(shared, item)`. `shared` is pickled once
+        to shared memory instead of once per item (or chunk), and every
+        worker unpickles it once. It must not be changed by `func`.
+        """
+        items = list(iterable)
+        if self.workers == 1 or len(items) <= 1:
+            if shared is None:
+                return [func(item) for item in items]
+            return [func(shared, item) for item in items]
+
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(self.workers)
+            # not atexit: a process started by multiprocessing (`aoc run`
+            # worker) joins its children before atexit, so it would wait
+            # for idle pool workers forever. Priority is above the one of
+            # queues, so they are still open to send stop to workers.
+            multiprocessing.util.Finalize(self, self.shutdown, exitpriority=100)
+        chunksize = chunksize or pool_chunksize(len(items), self.workers)
+        task = functools.partial(_pool_task, _func_ref(func))
+        if shared is None:
+            return list(self._executor.map(task, items, chunksize=chunksize))
+
+        data = pickle.dumps(shared, protocol=pickle.HIGHEST_PROTOCOL)
+        memory = shared_memory.SharedMemory(create=True, size=max(len(data), 1))
+        try:
+            memory.buf[: len(data)] = data
+            task = functools.partial(
+                _pool_task_with_shared, _func_ref(func), (memory.name, len(data))
+            )
+            return list(self._executor.map(task, items, chunksize=chunksize))
+        finally:
+            memory.close()
+            memory.unlink()
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+
+_POOL: WorkerPool | None = None
+
+
+def pool() -> WorkerPool:
+    """
+    Pool shared by all days in the process, of `max_workers()` size.
+    A forked child (e.g. `aoc run` worker) gets its own pool.
+    """
+    global _POOL
+    if _POOL is None or _POOL.pid != os.getpid():
+        _POOL = WorkerPool()
+    return _POOL
+
+
+def _func_ref(func: Callable[..., Any]) -> tuple[str, str, str | None]:
+    """
+    Functions are sent to workers by reference, like pickle does. Reference
+    has module path, because workers may be started before `dayNN` module
+    was imported by `import_part`.
+    """
+    module = sys.modules[func.__module__]
+    return func.__module__, func.__qualname__, getattr(module, "__file__", None)
+
+
+def _resolve_func(ref: tuple[str, str, str | None]) -> Callable[..., Any]:
+    module_name, qualname, path = ref
+    module = sys.modules.get(module_name)
+    if module is None:
+        if path is not None and DAY_DIR_RE.match(module_name.partition(".")[0]):
+            root = os.path.dirname(os.path.dirname(path))
+            module = import_day_module(module_name, root)
+        else:
+            module = importlib.import_module(module_name)
+    return functools.reduce(getattr, qualname.split("."), module)
+
+
+# shared argument of last `map` in the worker, by shared memory name
+_pool_shared: dict[str, Any] = {}
+
+
+def _load_shared(name: str, size: int) -> Any:
+    if name not in _pool_shared:
+        _pool_shared.clear()
+        memory = shared_memory.SharedMemory(name)
+        try:
+            _pool_shared[name] = pickle.loads(memory.buf[:size])
+        finally:
+            memory.close()
+    return _pool_shared[name]
+
+
+def _pool_task(ref: tuple[str, str, str | None], item: Any) -> Any:
+    return _resolve_func(ref)(item)
+
+
+def _pool_task_with_shared(
+    ref: tuple[str, str, str | None], shared_ref: tuple[str, int], item: Any
+) -> Any:
+    return _resolve_func(ref)(_load_shared(*shared_ref), item)
+
+
+class SharedGrid:
+    """
+    Read-only grid of bytes in shared memory, for pool workers. It is pickled
+    as the name of its memory block, so workers attach to the same memory
+    instead of getting a copy. Creator unlinks the block on `__exit__`.
+
+    `cells` is a flat memoryview, cell (m, n) is `cells[m * n_len + n]`.
+    """
+
+    def __init__(
+        self, memory: shared_memory.SharedMemory, m_len: int, n_len: int
+    ) -> None:
+        self.memory = memory
+        self.m_len = m_len
+        self.n_len = n_len
+        self.cells = memory.buf
+        self._owner_pid: int | None = None
+
+    @property
+    def bounds(self) -> tuple[int, int]:
+        return self.m_len - 1, self.n_len - 1
+
+    def __getitem__(self, coords: tuple[int, int]) -> str:
+        m, n = coords
+        return chr(self.cells[m * self.n_len + n])
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return _attach_shared_grid, (self.memory.name, self.m_len, self.n_len)
+
+    def __enter__(self) -> SharedGrid:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.cells.release()
+        self.memory.close()
+        if self._owner_pid == os.getpid():
+            self.memory.unlink()
+
+
+def shared_grid(s: str) -> SharedGrid:
+    """
+    Grid of ASCII chars from input, in shared memory:
+
+    with sup.shared_grid(s) as grid:
+        sup.pool().map(func, variants, shared=grid)
+    """
+    lines = s.strip().splitlines()
+    n_len = len(lines[0])
+    if any(len(line) != n_len for line in lines):
+        raise ValueError("grid lines must have the same length")
+    data = "".join(lines).encode("ascii")
+    memory = shared_memory.SharedMemory(create=True, size=max(len(data), 1))
+    memory.buf[: len(data)] = data
+    grid = SharedGrid(memory, len(lines), n_len)
+    grid._owner_pid = os.getpid()
+    return grid
+
+
+def _attach_shared_grid(name: str, m_len: int, n_len: int) -> SharedGrid:
+    return SharedGrid(shared_memory.SharedMemory(name), m_len, n_len)
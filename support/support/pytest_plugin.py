@@ -0,0 +1,33 @@
+"""
+pytest plugin (`pytest11` entry point of the package):
+
+pytest --answer-cache part1.py
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from support.cache import ANSWER_CACHE_DIR, cached_compute
+from support.days import Part
+
+
+def pytest_addoption(parser: Any) -> None:
+    parser.addoption(
+        "--answer-cache",
+        action="store_true",
+        help=f"reuse answers of compute() for unchanged code and input "
+        f"(from {ANSWER_CACHE_DIR})",
+    )
+
+
+def pytest_runtest_setup(item: Any) -> None:
+    module = getattr(item, "module", None)
+    if (
+        not item.config.getoption("answer_cache")
+        or not hasattr(module, "compute")
+        or hasattr(module.compute, "__wrapped__")
+        or Part.from_path(module.__file__) is None
+    ):
+        return
+    module.compute = cached_compute(module.compute)
@@ -0,0 +1,184 @@
+"""Integer ranges and sets of them."""
+
+from __future__ import annotations
+
+import array
+import bisect
+import heapq
+import operator
+from typing import Iterable, Iterator
+
+
+class Range:
+    __slots__ = ("start", "end")
+
+    def __init__(self, start: int, end: int) -> None:
+        self.start = start
+        self.end = end
+        if self.start >= self.end:
+            raise ValueError(f"{self.start=} must be < {self.end=}")
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.start}, {self.end})"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Range):
+            return NotImplemented
+        return self.start == other.start and self.end == other.end
+
+    def __contains__(self, n: int) -> bool:
+        return self.start <= n < self.end
+
+    def __len__(self) -> int:
+        return self.end - self.start
+
+    def has_intersection(self, other: Range) -> bool:
+        return self.start < other.end and other.start < self.end
+
+    def intersection(self, other: Range) -> Range | None:
+        if not self.has_intersection(other):
+            return None
+        return Range(max(self.start, other.start), min(self.end, other.end))
+
+    def remainder(self, other: Range) -> list[Range]:
+        intersection = self.intersection(other)
+        if intersection is None:
+            return []
+
+        result = []
+        if self.start < intersection.start:
+            result.append(Range(self.start, intersection.start))
+        if intersection.end < self.end:
+            result.append(Range(intersection.end, self.end))
+        return result
+
+
+class RangeSet:
+    """
+    Set of disjoint half-open ranges, kept as sorted parallel arrays
+    of starts and ends. Touching or overlapping ranges are merged.
+
+    Lookups are O(log n) with bisect, `add` and `remove` are O(log n)
+    plus memmove of the tail of the arrays. `find_first_fit` is O(n).
+    """
+
+    __slots__ = ("starts", "ends", "_length")
+
+    def __init__(self, ranges: Iterable[Range] = ()) -> None:
+        # bulk build is O(n log n), instead of n inserts into the middle
+        self._set_sorted(sorted((item.start, item.end) for item in ranges))
+
+    def _set_sorted(self, pairs: Iterable[tuple[int, int]]) -> None:
+        starts = array.array("q")
+        ends = array.array("q")
+        for start, end in pairs:
+            if ends and start <= ends[-1]:
+                if end > ends[-1]:
+                    ends[-1] = end
+            else:
+                starts.append(start)
+                ends.append(end)
+        self.starts = starts
+        self.ends = ends
+        self._length = sum(ends) - sum(starts)
+
+    def __repr__(self) -> str:
+        items = ", ".join(f"({start}, {end})" for start, end in self._pairs())
+        return f"{self.__class__.__name__}([{items}])"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, RangeSet):
+            return NotImplemented
+        return self.starts == other.starts and self.ends == other.ends
+
+    def __len__(self) -> int:
+        """Total covered length."""
+        return self._length
+
+    def __bool__(self) -> bool:
+        return bool(self.starts)
+
+    def __iter__(self) -> Iterator[Range]:
+        for start, end in self._pairs():
+            yield Range(start, end)
+
+    def __contains__(self, n: int) -> bool:
+        return self.contains(n)
+
+    def _pairs(self) -> Iterator[tuple[int, int]]:
+        return zip(self.starts, self.ends)
+
+    def contains(self, n: int) -> bool:
+        i = bisect.bisect_right(self.starts, n) - 1
+        return i >= 0 and n < self.ends[i]
+
+    def add(self, start: int, end: int) -> None:
+        if start >= end:
+            raise ValueError(f"{start=} must be < {end=}")
+        starts, ends = self.starts, self.ends
+        # merge with every range that overlaps or touches [start, end)
+        i = bisect.bisect_left(ends, start)
+        j = bisect.bisect_right(starts, end)
+        if i < j:
+            self._length -= sum(ends[i:j]) - sum(starts[i:j])
+            start = min(start, starts[i])
+            end = max(end, ends[j - 1])
+        starts[i:j] = array.array("q", [start])
+        ends[i:j] = array.array("q", [end])
+        self._length += end - start
+
+    def remove(self, start: int, end: int) -> None:
+        if start >= end:
+            raise ValueError(f"{start=} must be < {end=}")
+        starts, ends = self.starts, self.ends
+        # ranges that have common points with [start, end)
+        i = bisect.bisect_right(ends, start)
+        j = bisect.bisect_left(starts, end)
+        if i >= j:
+            return
+        self._length -= sum(ends[i:j]) - sum(starts[i:j])
+        new_starts = array.array("q")
+        new_ends = array.array("q")
+        if starts[i] < start:
+            new_starts.append(starts[i])
+            new_ends.append(start)
+        if ends[j - 1] > end:
+            new_starts.append(end)
+            new_ends.append(ends[j - 1])
+        starts[i:j] = new_starts
+        ends[i:j] = new_ends
+        self._length += sum(new_ends) - sum(new_starts)
+
+    def union(self, other: RangeSet) -> RangeSet:
+        result = RangeSet()
+        result._set_sorted(heapq.merge(self._pairs(), other._pairs()))
+        return result
+
+    def intersect(self, other: RangeSet) -> RangeSet:
+        pairs = []
+        i = j = 0
+        while i < len(self.starts) and j < len(other.starts):
+            start = max(self.starts[i], other.starts[j])
+            end = min(self.ends[i], other.ends[j])
+            if start < end:
+                pairs.append((start, end))
+            if self.ends[i] < other.ends[j]:
+                i += 1
+            else:
+                j += 1
+        result = RangeSet()
+        result._set_sorted(pairs)
+        return result
+
+    def find_first_fit(self, size: int) -> Range | None:
+        """
+        Find leftmost range with at least `size` length.
+
+        Unlike point operations it is O(n): there is no index of range
+        lengths, so a first-fit allocator on top of it (day09 part2) is
+        O(allocations * ranges).
+        """
+        for i, length in enumerate(map(operator.sub, self.ends, self.starts)):
+            if length >= size:
+                return Range(self.starts[i], self.ends[i])
+        return None
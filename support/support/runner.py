@@ -0,0 +1,347 @@
+"""Run of day parts on real inputs (`aoc run`)."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import multiprocessing
+import multiprocessing.util
+import os.path
+import re
+import signal
+import sys
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Any, Iterable, Iterator, NamedTuple
+
+from support.bench import BenchResult, baseline_path, interpreter_name, load_report
+from support.cache import ANSWER_CACHE_DIR, AnswerCache, file_digest
+from support.days import DAY_DIR_RE, ROOT, Part, discover_parts, import_part
+from support.io import humanized_seconds
+from support.parallel import MAX_WORKERS_ENV, max_workers
+from support.stream import iter_lines
+
+
+class RunResult(NamedTuple):
+    part: Part
+    answer: str | None
+    seconds: float
+    error: str | None = None
+    cached: bool = False
+
+
+def run_part(
+    part: Part,
+    root: str = ROOT,
+    *,
+    cache: AnswerCache | None = None,
+    stream: bool = False,
+) -> RunResult:
+    """
+    Run `compute` once on real input, errors are returned, not raised.
+    With `cache`, answer is reused when the code and the input are the same.
+    With `stream`, parts which have `compute_stream(lines)` get lines
+    of input file read by chunks, instead of the whole input as str.
+    """
+    start = time.perf_counter()
+    try:
+        module = import_part(part, root)
+        stream = stream and hasattr(module, "compute_stream")
+        data = None if stream else module.read_input()
+        if cache is not None:
+            key = cache.key(
+                part,
+                module.__file__,
+                data,
+                (),
+                {},
+                input_digest=file_digest(module.INPUT_TXT) if stream else None,
+            )
+            found, answer = cache.get(key)
+            if found:
+                return RunResult(part, str(answer), 0.0, cached=True)
+        start = time.perf_counter()
+        if stream:
+            answer = module.compute_stream(iter_lines(module.INPUT_TXT))
+        else:
+            answer = module.compute(data)
+    except Exception as e:
+        return RunResult(part, None, time.perf_counter() - start, repr(e))
+    seconds = time.perf_counter() - start
+    if cache is not None:
+        cache.put(key, answer)
+    return RunResult(part, str(answer), seconds)
+
+
+def run_parts(
+    parts: list[Part],
+    root: str = ROOT,
+    *,
+    jobs: int = 1,
+    timeout: float | None = None,
+    past_timings: dict[Part, float] | None = None,
+    cache: AnswerCache | None = None,
+    stream: bool = False,
+) -> Iterator[RunResult]:
+    """
+    Results are yielded as they complete. With `jobs` > 1 or `timeout`
+    parts run in a process pool, longest first by `past_timings`
+    (parts without timings go first, they may be long).
+    """
+    if jobs == 1 and timeout is None:
+        for part in parts:
+            yield run_part(part, root, cache=cache, stream=stream)
+        return
+
+    past_timings = past_timings or {}
+    queue = deque(sorted(parts, key=lambda part: -past_timings.get(part, math.inf)))
+    while queue:
+        yield from _run_pool(queue, str(root), jobs, timeout, cache, stream)
+
+
+_started: Any = None
+
+
+def _init_run_worker(started: Any, workers: int) -> None:
+    global _started
+    _started = started
+    os.environ[MAX_WORKERS_ENV] = str(workers)
+    if hasattr(os, "setpgrp"):
+        # own process group, to kill part together with its own pool workers
+        os.setpgrp()
+
+
+def _kill_worker(pid: int) -> None:
+    try:
+        if hasattr(os, "killpg"):
+            os.killpg(pid, signal.SIGKILL)
+        else:
+            os.kill(pid, signal.SIGTERM)
+    except ProcessLookupError:
+        pass
+
+
+def _run_in_worker(
+    part: Part, root: str, cache: AnswerCache | None, stream: bool
+) -> RunResult:
+    _started.put((part, os.getpid(), time.monotonic()))
+    return run_part(part, root, cache=cache, stream=stream)
+
+
+def _run_pool(
+    queue: deque[Part],
+    root: str,
+    jobs: int,
+    timeout: float | None,
+    cache: AnswerCache | None,
+    stream: bool,
+) -> Iterator[RunResult]:
+    """
+    Run parts from `queue` until one of them times out. Its worker is killed,
+    which breaks the pool, so parts which aren't done yet are put back
+    to `queue` to run again in a new pool.
+    """
+    context = multiprocessing.get_context()
+    started = context.Queue()
+    executor = ProcessPoolExecutor(
+        jobs,
+        mp_context=context,
+        initializer=_init_run_worker,
+        initargs=(started, max(max_workers() // jobs, 1)),
+    )
+    futures = {
+        executor.submit(_run_in_worker, part, root, cache, stream): part
+        for part in queue
+    }
+    queue.clear()
+    running: dict[Part, tuple[int, float]] = {}
+    # last part started by each worker, to not kill a worker which has
+    # already finished the timed out part and took the next one
+    worker_parts: dict[int, Part] = {}
+
+    def read_started() -> None:
+        pending = set(futures.values())
+        while not started.empty():
+            part, pid, start = started.get()
+            worker_parts[pid] = part
+            # message may come after the result of a fast part
+            if part in pending:
+                running[part] = pid, start
+
+    try:
+        while futures:
+            done, _ = wait(
+                futures,
+                timeout=None if timeout is None else 0.1,
+                return_when=FIRST_COMPLETED,
+            )
+            for future in [future for future in futures if future in done]:
+                running.pop(futures.pop(future), None)
+                yield future.result()
+            read_started()
+
+            now = time.monotonic()
+            pending = {part: future for future, part in futures.items()}
+            expired = [
+                (part, pid, now - start)
+                for part, (pid, start) in running.items()
+                if timeout is not None
+                and now - start > timeout
+                and worker_parts[pid] == part
+                and not pending[part].done()
+            ]
+            for part, pid, seconds in expired:
+                _kill_worker(pid)
+                yield RunResult(part, None, seconds, f"timed out after {timeout}s")
+            if expired:
+                timed_out = {part for part, _, _ in expired}
+                for future, part in futures.items():
+                    if part in timed_out:
+                        continue
+                    # finished between `wait` and kill, or killed with the pool
+                    if future.done() and future.exception() is None:
+                        yield future.result()
+                    else:
+                        queue.append(part)
+                return
+    except BaseException:
+        # workers have their own process groups, so Ctrl-C doesn't reach them
+        read_started()
+        for pid in worker_parts:
+            _kill_worker(pid)
+        raise
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+def run_timings_path(root: str = ROOT, interpreter: str | None = None) -> str:
+    interpreter = interpreter or interpreter_name()
+    return os.path.join(root, ".benchmarks", f"run-{interpreter}.json")
+
+
+def load_past_timings(root: str = ROOT) -> dict[Part, float]:
+    """Medians from benchmark baseline, updated with timings of last runs."""
+    timings = {}
+    if os.path.exists(baseline_path(root)):
+        for data in load_report(baseline_path(root))["results"]:
+            result = BenchResult.from_dict(data)
+            timings[result.part] = result.compute.median
+    if os.path.exists(run_timings_path(root)):
+        with open(run_timings_path(root)) as f:
+            for module_name, seconds in json.load(f).items():
+                day, part = re.findall(r"\d+", module_name)
+                timings[Part(int(day), int(part))] = seconds
+    return timings
+
+
+def save_run_timings(results: Iterable[RunResult], root: str = ROOT) -> None:
+    path = run_timings_path(root)
+    timings = {}
+    if os.path.exists(path):
+        with open(path) as f:
+            timings = json.load(f)
+    for result in results:
+        if result.error is None and not result.cached:
+            timings[result.part.module_name] = result.seconds
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(dict(sorted(timings.items())), f, indent=2)
+
+
+RUN_TABLE_HEADER = """\
+| Day   | Part  | Answer               | Time    |
+|-------|-------|----------------------|---------|"""
+
+
+def format_run_row(result: RunResult) -> str:
+    r = result
+    answer = r.answer if r.error is None else f"ERROR: {r.error}"
+    seconds = "cached" if r.cached else humanized_seconds(r.seconds)
+    return f"| day{r.part.day:02} | part{r.part.part} | {answer:<20} | {seconds:<7} |"
+
+
+def format_markdown_run(results: Iterable[RunResult]) -> str:
+    return "\n".join([RUN_TABLE_HEADER, *map(format_run_row, results)])
+
+
+def current_day() -> int | None:
+    """Day of current working dir, when it is a `dayNN` dir."""
+    day_match = DAY_DIR_RE.match(os.path.basename(os.getcwd()))
+    return int(day_match[1]) if day_match else None
+
+
+def run_main(args: argparse.Namespace) -> int:
+    days = args.day
+    if days is None and not args.all:
+        day = current_day()
+        if day is None:
+            print("use --day N or --all outside of dayNN dir", file=sys.stderr)
+            return 1
+        days = [day]
+    parts = discover_parts(args.root, days=days, parts=args.part)
+    if not parts:
+        print("no parts found", file=sys.stderr)
+        return 1
+
+    start = time.perf_counter()
+    print(RUN_TABLE_HEADER, flush=True)
+    results = []
+    for result in run_parts(
+        parts,
+        args.root,
+        jobs=args.jobs,
+        timeout=args.timeout,
+        past_timings=load_past_timings(args.root),
+        cache=(
+            AnswerCache(os.path.join(args.root, ANSWER_CACHE_DIR))
+            if args.cache
+            else None
+        ),
+        stream=args.stream,
+    ):
+        print(format_run_row(result), flush=True)
+        results.append(result)
+    save_run_timings(results, args.root)
+    print(f"\n{len(results)} parts in {humanized_seconds(time.perf_counter() - start)}")
+    return 1 if any(result.error is not None for result in results) else 0
+
+
+def aoc_main() -> int:
+    parser = argparse.ArgumentParser(prog="aoc")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run = subparsers.add_parser(
+        "run", help="run compute() of day parts in one interpreter"
+    )
+    run.add_argument("--day", type=int, action="append", help="can be repeated")
+    run.add_argument("--part", type=int, action="append", help="can be repeated")
+    run.add_argument("--all", action="store_true", help="run all days")
+    run.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="run parts in a process pool of this size (default: 1)",
+    )
+    run.add_argument(
+        "--timeout",
+        type=float,
+        help="kill part after this many seconds (runs parts in a process pool)",
+    )
+    run.add_argument(
+        "--cache",
+        action="store_true",
+        help="reuse answers of parts with unchanged code and input",
+    )
+    run.add_argument(
+        "--stream",
+        action="store_true",
+        help="use compute_stream() of parts which have it, input is read by chunks",
+    )
+    run.add_argument("--root", default=ROOT, help="directory with dayNN dirs")
+
+    args = parser.parse_args()
+    if args.command == "run":
+        return run_main(args)
+    raise AssertionError(f"unknown command {args.command}")
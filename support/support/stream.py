@@ -0,0 +1,79 @@
+"""Chunked reading of inputs for `compute_stream` of day parts."""
+
+from __future__ import annotations
+
+import os
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, TypeVar
+
+T = TypeVar("T")
+
+STREAM_CHUNK_SIZE = 1024 * 1024
+STREAM_BATCH_SIZE = 10_000
+
+
+def iter_chunks(
+    path: str | os.PathLike[str], chunk_size: int = STREAM_CHUNK_SIZE
+) -> Iterator[bytes]:
+    """
+    Read file by `chunk_size` bytes. Every chunk ends with a whole line:
+    the incomplete last line of a read is carried over to the next chunk,
+    so memory is bounded by `chunk_size` plus the longest line.
+    """
+    carry: list[bytes] = []
+    with open(path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            end = chunk.rfind(b"\n") + 1
+            if not end:
+                carry.append(chunk)
+                continue
+            yield b"".join([*carry, chunk[:end]])
+            carry = [chunk[end:]]
+    if tail := b"".join(carry):
+        yield tail
+
+
+def iter_lines(
+    path: str | os.PathLike[str], chunk_size: int = STREAM_CHUNK_SIZE
+) -> Iterator[bytes]:
+    """Lines of file without line endings, read by `iter_chunks`."""
+    for chunk in iter_chunks(path, chunk_size):
+        yield from chunk.splitlines()
+
+
+def iter_blocks(lines: Iterable[bytes]) -> Iterator[list[bytes]]:
+    """Groups of lines separated by blank lines."""
+    block = []
+    for line in lines:
+        if line.strip():
+            block.append(line)
+        elif block:
+            yield block
+            block = []
+    if block:
+        yield block
+
+
+def map_batches(
+    func: Callable[[list[Any]], T],
+    items: Iterable[Any],
+    batch_size: int = STREAM_BATCH_SIZE,
+) -> Iterator[T]:
+    """
+    `func(batch)` for consecutive batches of `items`, in order, computed
+    by `pool()`. Batches are sent to the pool by two per worker, so only
+    those are in memory, not all `items`. `func` must be importable
+    (module-level), its results are meant to be reduced by the caller.
+    """
+    # not at module level: `sup.iter_lines` alone shouldn't import multiprocessing
+    from support.parallel import pool
+
+    items = iter(items)
+    window_size = pool().workers * 2
+    while True:
+        window = []
+        while len(window) < window_size and (batch := list(islice(items, batch_size))):
+            window.append(batch)
+        if not window:
+            return
+        yield from pool().map(func, window, chunksize=1)
@@ -0,0 +1,193 @@
+"""
+Hierarchical spans for finding slow steps of a solution.
+
+AOC_TRACE=1 prints span tree to stderr at exit,
+AOC_TRACE=path.json writes Chrome trace events (chrome://tracing, Perfetto).
+"""
+
+from __future__ import annotations
+
+import atexit
+import functools
+import json
+import os.path
+import sys
+import time
+from typing import Any, Callable, TypeVar
+
+from support.io import humanized_seconds
+
+T = TypeVar("T")
+
+TRACE_ENV = os.environ.get("AOC_TRACE", "")
+
+
+class SpanNode:
+    """Aggregated stats of all spans with the same name under the same parent."""
+
+    __slots__ = ("name", "parent", "children", "count", "total")
+
+    def __init__(self, name: str, parent: SpanNode | None = None) -> None:
+        self.name = name
+        self.parent = parent
+        self.children: dict[str, SpanNode] = {}
+        self.count = 0
+        self.total = 0.0
+
+    @property
+    def self_time(self) -> float:
+        return self.total - sum(child.total for child in self.children.values())
+
+    def child(self, name: str) -> SpanNode:
+        node = self.children.get(name)
+        if node is None:
+            node = self.children[name] = SpanNode(name, self)
+        return node
+
+
+class Tracer:
+    __slots__ = ("enabled", "root", "current", "events", "_epoch")
+
+    def __init__(self, enabled: bool = False, record_events: bool = False) -> None:
+        self.enabled = enabled
+        self.reset(record_events)
+
+    def reset(self, record_events: bool = False) -> None:
+        self.root = self.current = SpanNode("<root>")
+        # (name, start, duration) for Chrome trace, only when asked,
+        # because unlike the tree it grows with every span
+        self.events: list[tuple[str, float, float]] | None = (
+            [] if record_events else None
+        )
+        self._epoch = time.perf_counter()
+
+    def report(self) -> str:
+        lines = [f"{'span':<40} {'calls':>8} {'total':>8} {'self':>8}"]
+
+        def walk(node: SpanNode, depth: int) -> None:
+            for child in sorted(
+                node.children.values(), key=lambda n: n.total, reverse=True
+            ):
+                label = "  " * depth + child.name
+                lines.append(
+                    f"{label:<40} {child.count:>8} "
+                    f"{humanized_seconds(child.total):>8} "
+                    f"{humanized_seconds(child.self_time):>8}"
+                )
+                walk(child, depth + 1)
+
+        walk(self.root, 0)
+        return "\n".join(lines)
+
+    def chrome_trace(self) -> dict[str, Any]:
+        """Spans as complete ("X") events of Trace Event Format."""
+        pid = os.getpid()
+        return {
+            "traceEvents": [
+                {
+                    "name": name,
+                    "ph": "X",
+                    "ts": (start - self._epoch) * 1_000_000,
+                    "dur": duration * 1_000_000,
+                    "pid": pid,
+                    "tid": 0,
+                }
+                for name, start, duration in self.events or ()
+            ],
+            "displayTimeUnit": "ms",
+        }
+
+
+TRACER = Tracer(
+    enabled=TRACE_ENV not in ("", "0"), record_events=TRACE_ENV.endswith(".json")
+)
+
+
+class Span:
+    __slots__ = ("name", "_node", "_start")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __enter__(self) -> Span:
+        self._node = TRACER.current = TRACER.current.child(self.name)
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        duration = time.perf_counter() - self._start
+        node = self._node
+        node.count += 1
+        node.total += duration
+        TRACER.current = node.parent
+        if TRACER.events is not None:
+            TRACER.events.append((self.name, self._start, duration))
+
+    def __call__(self, func: Callable[..., T]) -> Callable[..., T]:
+        name = self.name
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> T:
+            with Span(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+
+class _NoSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> _NoSpan:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        pass
+
+    def __call__(self, func: Callable[..., T]) -> Callable[..., T]:
+        return func
+
+
+_NO_SPAN = _NoSpan()
+
+
+def trace(name: str | Callable[..., T]) -> Any:
+    """
+    Record a span: `with sup.trace("parse"):`, `@sup.trace("solve")`
+    or `@sup.trace`. Spans nest and are aggregated by name under their parent.
+
+    When tracing is disabled this returns a no-op object and decorators
+    return the function itself, so decorated functions cost nothing.
+    Because of this, functions decorated before `enable_trace()`
+    aren't traced.
+    """
+    if callable(name):
+        func = name
+        return trace(func.__qualname__)(func)
+    if not TRACER.enabled:
+        return _NO_SPAN
+    return Span(name)
+
+
+def enable_trace(enabled: bool = True, *, record_events: bool = False) -> None:
+    TRACER.enabled = enabled
+    TRACER.reset(record_events)
+
+
+def trace_report() -> str:
+    return TRACER.report()
+
+
+def write_chrome_trace(path: str) -> None:
+    with open(path, "w") as f:
+        json.dump(TRACER.chrome_trace(), f)
+
+
+def _dump_trace_at_exit() -> None:
+    if TRACE_ENV.endswith(".json"):
+        write_chrome_trace(TRACE_ENV)
+    else:
+        print(trace_report(), file=sys.stderr)
+
+
+if TRACER.enabled:
+    atexit.register(_dump_trace_at_exit)
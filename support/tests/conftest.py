@@ -0,0 +1,41 @@
+import textwrap
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture()
+def make_part(tmp_path):
+    """
+    Write fake `dayNN/partN.py` to `tmp_path` (used as root) and return
+    its path. `body` is the body of `compute(s)` (it starts at line 2),
+    `read_input()` returns `input`, `extra` is source appended to the module.
+    With `input_txt` it is written to `dayNN/input.txt` (see `INPUT_TXT`).
+    """
+
+    def maker(
+        day: int,
+        part: int,
+        body: str = "return len(s)",
+        *,
+        input: str = "abc",
+        args: str = "s",
+        extra: str = "",
+        input_txt: bytes | None = None,
+    ) -> Path:
+        day_dir = tmp_path / f"day{day:02}"
+        day_dir.mkdir(exist_ok=True)
+        if input_txt is not None:
+            (day_dir / "input.txt").write_bytes(input_txt)
+        path = day_dir / f"part{part}.py"
+        path.write_text(
+            f"def compute({args}):\n"
+            f"{textwrap.indent(body, '    ')}\n"
+            "def read_input():\n"
+            f"    return {input!r}\n"
+            "INPUT_TXT = __import__('pathlib').Path(__file__).parent / 'input.txt'\n"
+            f"{extra}"
+        )
+        return path
+
+    return maker
@@ -0,0 +1,104 @@
+import os
+
+import pytest
+
+from support import (
+    AnswerCache,
+    Part,
+    cached_compute,
+    code_digest,
+    format_run_row,
+    import_part,
+    run_part,
+)
+
+
+@pytest.mark.parametrize(
+    "path,expected",
+    [
+        ("/aoc/day07/part2.py", Part(7, 2)),
+        ("day12/part1.py", Part(12, 1)),
+        ("/aoc/day07/generate.py", None),
+        ("/aoc/support/part1.py", None),
+    ],
+)
+def test_part_from_path(path, expected):
+    assert Part.from_path(path) == expected
+
+
+@pytest.fixture()
+def root(tmp_path, make_part):
+    make_part(
+        38,
+        1,
+        "calls.append(s)\nreturn len(s) * factor",
+        args="s, factor=1",
+        extra="calls = []\n",
+    )
+    return tmp_path
+
+
+def test_cached_compute(root):
+    module = import_part(Part(38, 1), root)
+    compute = cached_compute(module.compute, AnswerCache(root / "cache"))
+
+    assert compute("ab") == 2
+    assert compute("ab") == 2
+    assert compute("ab", factor=3) == 6
+    assert compute("abc") == 3
+    assert module.calls == ["ab", "ab", "abc"]
+
+
+def test_cached_compute_code_changed(root):
+    module = import_part(Part(38, 1), root)
+    cache = AnswerCache(root / "cache")
+    cached_compute(module.compute, cache)("ab")
+    path = root / "day38" / "part1.py"
+    path.write_text(path.read_text().replace("factor=1", "factor=2"))
+    os.utime(path, ns=(0, 0))
+
+    cached_compute(module.compute, cache)("ab")
+
+    assert module.calls == ["ab", "ab"]
+
+
+def test_answer_cache_evicts_least_recently_used(tmp_path):
+    cache = AnswerCache(tmp_path, max_size=100)
+    cache.put("a", "x" * 30)
+    cache.put("b", "x" * 30)
+    os.utime(tmp_path / "a.pickle", ns=(1, 1))
+    os.utime(tmp_path / "b.pickle", ns=(2, 2))
+    assert cache.get("a") == (True, "x" * 30)  # now b is least recently used
+
+    cache.put("c", "x" * 30)
+
+    assert cache.get("a")[0]
+    assert cache.get("b") == (False, None)
+    assert cache.get("c")[0]
+
+
+def test_run_part_cache(root):
+    cache = AnswerCache(root / "cache")
+
+    first = run_part(Part(38, 1), root, cache=cache)
+    second = run_part(Part(38, 1), root, cache=cache)
+
+    assert (first.answer, first.cached) == ("3", False)
+    assert (second.answer, second.cached) == ("3", True)
+    assert "| cached  |" in format_run_row(second)
+
+
+def test_code_digest_ignores_comments_and_blank_lines(tmp_path):
+    path = tmp_path / "part1.py"
+    path.write_text("def compute(s):\n    return len(s)\n")
+    digest = code_digest(str(path))
+
+    path.write_text("# comment\n\ndef compute(s):\n\n    return len(s)  # x\n")
+    os.utime(path, ns=(1, 1))
+    formatted_digest = code_digest(str(path))
+    path.write_text("def compute(s):\n    return len(s) + 1\n")
+    os.utime(path, ns=(2, 2))
+    changed_digest = code_digest(str(path))
+
+    assert formatted_digest == digest
+    assert changed_digest != digest
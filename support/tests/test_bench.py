@@ -0,0 +1,163 @@
+import pytest
+
+from support import (
+    BenchResult,
+    Part,
+    Stats,
+    bench_part,
+    compare_reports,
+    discover_parts,
+    fit_exponent,
+    format_markdown_comparison,
+    geometric_factors,
+    load_report,
+    make_report,
+    measure,
+    save_baseline,
+    scale_part,
+)
+
+
+def test_stats_from_samples():
+    result = Stats.from_samples([float(i) for i in range(100, 0, -1)])
+
+    assert result.runs == 100
+    assert result.min == 1.0
+    assert result.median == 50.5
+    assert result.p95 == 95.0
+    assert result.ci_low < result.median < result.ci_high
+
+
+def test_stats_from_one_sample():
+    result = Stats.from_samples([2.0])
+
+    assert result == Stats(1, 2.0, 2.0, 2.0, 2.0, 2.0)
+
+
+@pytest.mark.parametrize(
+    "kwargs,expected_runs",
+    [
+        ({"min_time": 0, "min_runs": 3}, 3),
+        ({"min_time": 10, "max_runs": 7}, 7),
+        ({"min_time": 10, "max_time": 0, "min_runs": 5}, 1),
+    ],
+)
+def test_measure_number_of_runs(kwargs, expected_runs):
+    result, samples = measure(lambda: 42, **kwargs)
+
+    assert result == 42
+    assert len(samples) == expected_runs
+
+
+@pytest.fixture()
+def root(tmp_path, make_part):
+    for day in [0, 31, 32]:
+        for part in [1, 2]:
+            make_part(day, part, f"return len(s) * {part}", input=f"day{day:02}")
+    (tmp_path / "day32" / "input.txt").write_text("")
+    (tmp_path / "support").mkdir()
+    return tmp_path
+
+
+def test_discover_parts(root):
+    assert discover_parts(root) == [
+        Part(31, 1),
+        Part(31, 2),
+        Part(32, 1),
+        Part(32, 2),
+    ]
+    assert discover_parts(root, days=[32], parts=[1]) == [Part(32, 1)]
+
+
+def test_bench_part_and_report(root):
+    result = bench_part(Part(32, 2), root, min_time=0, min_runs=2)
+
+    assert result.answer == "10"
+    assert result.compute.runs == result.read.runs == 2
+
+    report = make_report([result])
+    assert BenchResult.from_dict(report["results"][0]) == result
+    assert "| day32 | part2 |" in format_markdown_comparison([report, report])
+
+
+def make_result(day, median, spread=0.01):
+    stats = Stats(10, median, median, median, median - spread, median + spread)
+    return BenchResult(Part(day, 1), "0", stats, stats)
+
+
+@pytest.mark.parametrize(
+    "current_median,threshold,expected_regressed",
+    [
+        (1.0, 0.1, False),
+        (1.05, 0.1, False),  # significant, but under threshold
+        (1.2, 0.1, True),
+        (1.2, 0.5, False),
+        (0.5, 0.1, False),
+    ],
+)
+def test_compare_reports(current_median, threshold, expected_regressed):
+    baseline = make_report([make_result(1, 1.0), make_result(2, 1.0)])
+    current = make_report([make_result(1, current_median), make_result(3, 1.0)])
+
+    result = compare_reports(baseline, current, threshold)
+
+    assert [comparison.part for comparison in result] == [Part(1, 1)]
+    assert result[0].regressed is expected_regressed
+
+
+def test_compare_reports_not_significant():
+    baseline = make_report([make_result(1, 1.0, spread=0.5)])
+    current = make_report([make_result(1, 1.3, spread=0.5)])
+
+    result = compare_reports(baseline, current)
+
+    assert result[0].ratio == pytest.approx(1.3)
+    assert not result[0].regressed
+
+
+def test_compare_reports_different_interpreters():
+    baseline = {**make_report([]), "interpreter": "pypy"}
+
+    with pytest.raises(ValueError, match="can't compare"):
+        compare_reports(baseline, make_report([]))
+
+
+def test_save_baseline_keeps_other_parts(tmp_path):
+    path = str(tmp_path / ".benchmarks" / "baseline.json")
+    save_baseline(make_report([make_result(1, 1.0), make_result(2, 1.0)]), path)
+    save_baseline(make_report([make_result(2, 3.0)]), path)
+
+    result = [BenchResult.from_dict(r) for r in load_report(path)["results"]]
+
+    assert [r.compute.median for r in result] == [1.0, 3.0]
+
+
+@pytest.mark.parametrize("exponent", [1, 2, 0.5])
+def test_fit_exponent(exponent):
+    sizes = [100, 200, 400, 800]
+
+    result = fit_exponent(sizes, [3 * size**exponent for size in sizes])
+
+    assert result == pytest.approx(exponent)
+
+
+def test_geometric_factors():
+    assert geometric_factors(0.25, 4) == [0.25, 0.5, 1, 2, 4]
+    assert geometric_factors(1, 10, ratio=3) == [1, 3, 9]
+
+
+def test_scale_part(root):
+    (root / "day32" / "generate.py").write_text(
+        "def generate(size, seed=0):\n    return 'x' * size\n"
+    )
+
+    result = scale_part(Part(32, 2), [1, 2, 4], root, time_limit=10)
+
+    assert result.factors == [1, 2, 4]
+    assert len(result.times) == 3
+    assert result.blown_up_at is None
+
+
+def test_scale_part_without_generator(root):
+    with pytest.raises(ValueError, match="no dayNN/generate.py"):
+        scale_part(Part(31, 1), [1], root)
@@ -0,0 +1,133 @@
+"""
+Count heap pops and vertex expansions of sup.dijkstra on real inputs.
+
+Run with `-s` to see the table.
+"""
+
+import heapq
+from pathlib import Path
+
+import pytest
+
+import support as sup
+
+ROOT = Path(__file__).parents[2]
+DIRECTIONS = [
+    sup.Direction.UP,
+    sup.Direction.RIGHT,
+    sup.Direction.DOWN,
+    sup.Direction.LEFT,
+]
+
+
+class CountingGraph(dict):
+    expansions = 0
+
+    def __getitem__(self, key):
+        self.expansions += 1
+        return super().__getitem__(key)
+
+
+def legacy_dijkstra(graph, source):
+    """sup.dijkstra before stale-entry skipping and early exit."""
+    dist = {source: 0}
+    prev = {source: None}
+    pq = [(0, source)]
+    while pq:
+        _, u = heapq.heappop(pq)
+        for vertex, val in graph[u].items():
+            if vertex not in dist or dist[u] + val < dist[vertex]:
+                dist[vertex] = dist[u] + val
+                prev[vertex] = u
+                heapq.heappush(pq, (dist[vertex], vertex))
+    return dist, prev
+
+
+def read_matrix(day: str) -> sup.Matrix:
+    s = (ROOT / day / "input.txt").read_text()
+    return sup.Matrix.create_from_input(s.split("\n\n")[0])
+
+
+def maze_graph(matrix: sup.Matrix) -> CountingGraph:
+    graph = CountingGraph()
+    for m, row in enumerate(matrix):
+        for n, char in enumerate(row):
+            graph[(m, n)] = {
+                coords: 1
+                for coords in matrix.neighbors_cross(m, n)
+                if matrix[coords[0]][coords[1]] != "#" and char != "#"
+            }
+    return graph
+
+
+def day16():
+    matrix = read_matrix("day16")
+    graph = CountingGraph()
+    for m, row in enumerate(matrix):
+        for n, char in enumerate(row):
+            if char == "#":
+                continue
+            for i, direction in enumerate(DIRECTIONS):
+                edges = {(m, n, (i + 1) % 4): 1000, (m, n, (i - 1) % 4): 1000}
+                next_m, next_n = m + direction.x, n + direction.y
+                if matrix[next_m][next_n] != "#":
+                    edges[(next_m, next_n, i)] = 1
+                graph[(m, n, i)] = edges
+                if char == "S":
+                    start = (m, n, 1)
+                elif char == "E":
+                    end = (m, n, 0)
+    return graph, start, end
+
+
+def day18():
+    lines = (ROOT / "day18" / "input.txt").read_text().splitlines()
+    grid = [["."] * 71 for _ in range(71)]
+    for line in lines[:1024]:
+        m, n = map(int, line.split(","))
+        grid[m][n] = "#"
+    return maze_graph(sup.Matrix(grid)), (0, 0), (70, 70)
+
+
+def day20():
+    matrix = read_matrix("day20")
+    start = end = None
+    for m, row in enumerate(matrix):
+        for n, char in enumerate(row):
+            if char == "S":
+                start = (m, n)
+            elif char == "E":
+                end = (m, n)
+    return maze_graph(matrix), start, end
+
+
+@pytest.mark.parametrize("make_graph", [day16, day18, day20])
+def test_dijkstra_pops(make_graph, monkeypatch) -> None:
+    graph, start, end = make_graph()
+    pops = 0
+    heappop = heapq.heappop
+
+    def counting_heappop(heap):
+        nonlocal pops
+        pops += 1
+        return heappop(heap)
+
+    monkeypatch.setattr(heapq, "heappop", counting_heappop)
+    results = {}
+    for label, func in [
+        ("legacy", legacy_dijkstra),
+        ("stale skip", sup.dijkstra),
+        ("stale skip + target", lambda g, s: sup.dijkstra(g, s, target=end)),
+    ]:
+        pops = graph.expansions = 0
+        dist, _ = func(graph, start)
+        results[label] = (pops, graph.expansions, dist[end])
+
+    print(f"\n{make_graph.__name__}: {'pops':>8} {'expanded':>9}")
+    for label, (label_pops, expansions, _) in results.items():
+        print(f"{label:>20} {label_pops:>8} {expansions:>9}")
+
+    legacy, stale_skip, with_target = results.values()
+    assert legacy[2] == stale_skip[2] == with_target[2]
+    assert stale_skip[1] <= legacy[1]
+    assert with_target[0] <= stale_skip[0]
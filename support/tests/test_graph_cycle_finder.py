@@ -0,0 +1,94 @@
+import random
+from itertools import combinations
+
+import pytest
+
+from support import GraphCycleFinder
+
+EDGES = [
+    ("a", "b"),
+    ("a", "c"),
+    ("b", "c"),
+    ("b", "d"),
+    ("c", "d"),
+    ("d", "e"),
+    ("f", "g"),
+    ("h", "i"),
+    ("h", "j"),
+    ("h", "k"),
+    ("i", "j"),
+    ("i", "k"),
+    ("j", "k"),
+]
+
+
+@pytest.fixture()
+def finder():
+    finder = GraphCycleFinder()
+    for u, v in EDGES:
+        finder.add_edge(u, v)
+    return finder
+
+
+def brute_force_maximal_cliques(nodes, edges):
+    neighbors = {node: set() for node in nodes}
+    for u, v in edges:
+        neighbors[u].add(v)
+        neighbors[v].add(u)
+    cliques = [
+        set(subset)
+        for size in range(1, len(nodes) + 1)
+        for subset in combinations(nodes, size)
+        if all(v in neighbors[u] for u, v in combinations(subset, 2))
+    ]
+    return [
+        clique for clique in cliques if not any(clique < other for other in cliques)
+    ]
+
+
+def test_find_cliques(finder):
+    result = finder.find_cliques()
+
+    assert sorted(map(sorted, result)) == [
+        ["a", "b", "c"],
+        ["b", "c", "d"],
+        ["d", "e"],
+        ["f", "g"],
+        ["h", "i", "j", "k"],
+    ]
+
+
+def test_find_cycles(finder):
+    result = finder.find_cycles()
+
+    assert sorted(map(sorted, result)) == [
+        ["a", "b", "c"],
+        ["b", "c", "d"],
+        ["h", "i", "j", "k"],
+    ]
+
+
+def test_max_clique(finder):
+    assert finder.max_clique() == {"h", "i", "j", "k"}
+
+
+def test_max_clique_empty_graph():
+    assert GraphCycleFinder().max_clique() == set()
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_same_as_brute_force_on_random_graph(seed):
+    rnd = random.Random(seed)
+    nodes = list(range(12))
+    edges = [pair for pair in combinations(nodes, 2) if rnd.random() < 0.5]
+    finder = GraphCycleFinder({node: [] for node in nodes})
+    for u, v in edges:
+        finder.add_edge(u, v)
+
+    expected = brute_force_maximal_cliques(nodes, edges)
+    result = finder.find_cliques()
+    max_clique = finder.max_clique()
+
+    assert sorted(map(sorted, result)) == sorted(map(sorted, expected))
+    assert len(max_clique) == max(map(len, expected))
+    assert max_clique in expected
@@ -0,0 +1,92 @@
+import pytest
+
+from support import Direction, Grid, Matrix
+
+
+@pytest.fixture()
+def grid():
+    return Grid.create_from_input("abcd\nefgh\nijkl\n")
+
+
+@pytest.mark.parametrize(
+    "input_s",
+    [
+        ".#.\n###",
+        "\n.#.\n###",
+        ".#.\n###\n",
+        b"\n\n.#.\n###\n\n",
+    ],
+)
+def test_create_from_input(input_s) -> None:
+    result = Grid.create_from_input(input_s)
+
+    assert result.data == bytearray(b".#.###")
+    assert (result.m_len, result.n_len, result.bounds) == (2, 3, (1, 2))
+    assert [bytes(row) for row in result] == [b".#.", b"###"]
+
+
+def test_create_from_input_digits() -> None:
+    result = Grid.create_from_input("012\n789", digits=True)
+
+    assert list(result.data) == [0, 1, 2, 7, 8, 9]
+
+
+def test_create_from_input_ragged_lines() -> None:
+    with pytest.raises(ValueError, match="same length"):
+        Grid.create_from_input("abc\nde")
+
+
+def test_rows_are_views(grid) -> None:
+    grid[1][2] = ord("#")
+
+    assert grid.data[grid.index(1, 2)] == ord("#")
+    assert grid.coords(6) == (1, 2)
+    assert grid.find(b"#") == (1, 2)
+
+
+def test_copy(grid) -> None:
+    result = grid.copy()
+    result[0][0] = ord("#")
+
+    assert grid[0][0] == ord("a")
+    assert result[0][0] == ord("#")
+
+
+@pytest.mark.parametrize(
+    "coords",
+    [(0, 0), (0, 3), (1, 1), (2, 0), (2, 3)],
+)
+def test_neighbors_cross_same_as_matrix(grid, coords) -> None:
+    matrix = Matrix.create_from_input("abcd\nefgh\nijkl\n")
+
+    result = list(grid.neighbors_cross(*coords))
+    result_idx = list(grid.neighbors_cross_idx(grid.index(*coords)))
+
+    assert result == list(matrix.neighbors_cross(*coords))
+    assert result_idx == [grid.index(m, n) for m, n in result]
+
+
+@pytest.mark.parametrize("direction", list(Direction))
+@pytest.mark.parametrize(
+    "input_s,coords",
+    [
+        ("abcd\nefgh\nijkl\n", (0, 0)),
+        ("abcd\nefgh\nijkl\n", (1, 2)),
+        ("abcd\nefgh\nijkl\n", (2, 3)),
+        ("a\nb\nc\n", (0, 0)),
+        ("a\nb\nc\n", (1, 0)),
+        ("a\nb\nc\n", (2, 0)),
+    ],
+)
+@pytest.mark.parametrize("size", [1, 3, 5])
+def test_get_values_and_next_coords_same_as_matrix(
+    input_s, coords, direction, size
+) -> None:
+    grid = Grid.create_from_input(input_s)
+    matrix = Matrix.create_from_input(input_s)
+
+    values = grid.get_values(*coords, direction, size)
+    next_coords = grid.next_coords(*coords, direction, size)
+
+    assert values.decode() == "".join(matrix.get_values(*coords, direction, size))
+    assert next_coords == matrix.next_coords(*coords, direction, size)
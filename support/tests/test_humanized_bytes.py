@@ -0,0 +1,16 @@
+import pytest
+
+from support import humanized_bytes
+
+
+@pytest.mark.parametrize(
+    "size,expected",
+    [
+        (12, "12B"),
+        (2048, "2KB"),
+        (5 * 1024 * 1024, "5MB"),
+        (3 * 1024 * 1024 * 1024, "3.0GB"),
+    ],
+)
+def test_humanized_bytes(size, expected):
+    assert humanized_bytes(size) == expected
@@ -0,0 +1,82 @@
+import pytest
+
+from support import Grid, int_grid, ints, read_input_bytes
+
+
+@pytest.mark.parametrize(
+    "buf,expected",
+    [
+        (b"3   4\n4   3\n", [3, 4, 4, 3]),
+        (b"p=0,4 v=3,-3\n", [0, 4, 3, -3]),
+        (b"Button A: X+94, Y+34", [94, 34]),
+        ("7 6 4 2 1\n", [7, 6, 4, 2, 1]),
+        (b"", []),
+        (b"9223372036854775807", [2**63 - 1]),
+        (b"1-2 - 3 --4 5-", [1, -2, 3, -4, 5]),
+        (b"1_000 +5 x-7y", [1, 0, 5, -7]),
+    ],
+)
+def test_ints(buf, expected):
+    result = ints(buf)
+
+    assert result.typecode == "q"
+    assert result.tolist() == expected
+
+
+def test_ints_too_big_number():
+    with pytest.raises(OverflowError):
+        ints(b"9223372036854775808")
+
+
+def test_read_input_bytes(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_bytes(b"1,2\n-3,4\n")
+
+    buf = read_input_bytes(path)
+
+    assert buf[:] == b"1,2\n-3,4\n"
+    assert ints(buf).tolist() == [1, 2, -3, 4]
+
+
+def test_read_input_bytes_empty_file(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_bytes(b"")
+
+    assert read_input_bytes(path) == b""
+
+
+@pytest.mark.parametrize(
+    "buf",
+    [
+        b"0123\n4567\n8901\n",
+        b"0123\n4567\n8901",
+        b"0123\r\n4567\r\n8901\r\n\r\n",
+        "0123\n4567\n8901\n",
+    ],
+)
+def test_int_grid(buf):
+    grid = int_grid(buf)
+
+    assert (grid.height, grid.width) == (3, 4)
+    assert grid.data == bytearray([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 0, 1])
+    assert grid.data == Grid.create_from_input("0123\n4567\n8901\n", digits=True).data
+
+
+def test_int_grid_from_mmap(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_bytes(b"12\n34\n")
+
+    grid = int_grid(read_input_bytes(path))
+
+    assert grid[1][0] == 3
+
+
+def test_int_grid_empty():
+    grid = int_grid(b"")
+
+    assert (grid.height, grid.width) == (0, 0)
+
+
+def test_int_grid_ragged_lines():
+    with pytest.raises(ValueError, match="same length"):
+        int_grid(b"012\n34\n")
@@ -0,0 +1,33 @@
+import subprocess
+import sys
+
+import pytest
+
+
+@pytest.mark.parametrize(
+    "names,not_imported",
+    [
+        ("read_input_bytes, ints", ["support.grid", "support.parallel"]),
+        ("iter_lines", ["support.parallel", "multiprocessing", "concurrent.futures"]),
+        ("Matrix", ["support.bench", "support.net", "multiprocessing"]),
+    ],
+)
+def test_names_dont_import_heavy_modules(tmp_path, names, not_imported):
+    code = (
+        "import sys\n"
+        "import support as sup\n"
+        f"for name in '{names}'.split(', '):\n"
+        "    getattr(sup, name)\n"
+        "print(' '.join(sys.modules))\n"
+    )
+
+    # run from tmp_path: in the repo root `support` dir shadows the package
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=tmp_path,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert not set(not_imported) & set(result.stdout.split())
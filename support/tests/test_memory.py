@@ -0,0 +1,31 @@
+import pytest
+
+from support import BenchResult, Part, Stats, format_markdown, memory_part
+
+
+@pytest.fixture()
+def root(tmp_path, make_part):
+    make_part(
+        34, 1, "data = [bytearray(1024) for _ in range(10_000)]\nreturn len(data)"
+    )
+    return tmp_path
+
+
+def test_memory_part(root):
+    result = memory_part(Part(34, 1), root, top=3)
+
+    assert result.peak_traced > 10_000 * 1024
+    assert result.peak_rss is None or result.peak_rss > result.peak_traced
+    assert len(result.top) <= 3
+    assert result.top[0].site == "part1.py:2"
+    assert result.top[0].count >= 10_000
+
+
+def test_memory_in_report(root):
+    stats = Stats(1, 1.0, 1.0, 1.0, 1.0, 1.0)
+    result = BenchResult(
+        Part(34, 1), "1", stats, stats, memory=memory_part(Part(34, 1), root)
+    )
+
+    assert BenchResult.from_dict(result.to_dict()) == result
+    assert "Peak traced" in format_markdown([result])
@@ -3,11 +3,15 @@ import pytest
 from support import Matrix
 
 
-@pytest.fixture()
-def make_matrix():
+@pytest.fixture(params=[False, True], ids=["generators", "neighbor_index"])
+def make_matrix(request):
     def maker(bounds):
         max_m, max_n = bounds
-        return Matrix([[0 for _ in range(max_n + 1)] for _ in range(max_m + 1)])
+        matrix = Matrix([[0 for _ in range(max_n + 1)] for _ in range(max_m + 1)])
+        if request.param:
+            for kind in ("cross", "diag", "cross_diag", "cross_diag_all"):
+                matrix.build_neighbor_index(kind)
+        return matrix
 
     return maker
 
@@ -76,3 +80,81 @@ def test_neighbors_cross_diag(make_matrix, coords, max_bounds, expected):
     result = matrix.neighbors_cross_diag(x, y)
 
     assert list(result) == expected
+
+
+@pytest.mark.parametrize(
+    "coords,max_bounds,expected",
+    [
+        ((0, 0), (0, 0), [None] * 8),
+        (
+            (0, 0),
+            (1, 1),
+            [None, None, None, (0, 1), (1, 1), (1, 0), None, None],
+        ),
+        (
+            (1, 1),
+            (2, 2),
+            [(0, 0), (0, 1), (0, 2), (1, 2), (2, 2), (2, 1), (2, 0), (1, 0)],
+        ),
+    ],
+)
+def test_neighbors_cross_diag_all(make_matrix, coords, max_bounds, expected):
+    matrix = make_matrix(max_bounds)
+    x, y = coords
+
+    result = matrix.neighbors_cross_diag_all(x, y)
+
+    assert list(result) == expected
+
+
+def test_neighbor_index_is_shared_with_copy(make_matrix):
+    matrix = make_matrix((3, 3))
+    table = matrix.build_neighbor_index("cross")
+
+    result = matrix.copy()
+
+    assert result.build_neighbor_index("cross") is table
+
+
+def test_neighbor_index_of_copy_is_independent():
+    matrix = Matrix([[0] * 3 for _ in range(3)])
+    matrix.build_neighbor_index("cross")
+
+    result = matrix.copy()
+    result.build_neighbor_index("diag")
+
+    assert list(matrix.neighbor_index) == ["cross"]
+
+
+def test_neighbor_index_is_flat_arrays():
+    matrix = Matrix([[0] * 3 for _ in range(2)])
+
+    index = matrix.build_neighbor_index("cross")
+
+    assert index.offsets.typecode == index.targets.typecode == "i"
+    assert index.offsets.tolist() == [0, 2, 5, 7, 9, 12, 14]
+    assert index.targets[:2].tolist() == [3, 1]
+
+
+@pytest.mark.parametrize("coords", [(-1, 0), (0, -1), (4, 0), (0, 4), (-1, -1)])
+def test_neighbor_index_out_of_bounds_cell(coords):
+    matrix = Matrix([[0] * 4 for _ in range(4)])
+    expected = {
+        kind: list(getattr(matrix, f"neighbors_{kind}")(*coords))
+        for kind in ("cross", "diag", "cross_diag", "cross_diag_all")
+    }
+    for kind in expected:
+        matrix.build_neighbor_index(kind)
+
+    result = {
+        kind: list(getattr(matrix, f"neighbors_{kind}")(*coords)) for kind in expected
+    }
+
+    assert result == expected
+
+
+def test_build_neighbor_index_unknown_kind(make_matrix):
+    matrix = make_matrix((3, 3))
+
+    with pytest.raises(ValueError, match="unknown neighbors kind"):
+        matrix.build_neighbor_index("knight")
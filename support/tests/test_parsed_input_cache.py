@@ -0,0 +1,80 @@
+import support.cache
+from support import Part, bench_part, format_markdown, parsed_input_cache
+
+calls = []
+
+
+def parse(s, sep=","):
+    calls.append(s)
+    return s.split(sep)
+
+
+def test_parsed_input_cache(tmp_path):
+    calls.clear()
+
+    first = parsed_input_cache(parse, "1,2", cache_dir=tmp_path)
+    first.append("3")
+    second = parsed_input_cache(parse, "1,2", cache_dir=tmp_path)
+
+    assert second == ["1", "2"]
+    assert calls == ["1,2"]
+
+
+def test_parsed_input_cache_key(tmp_path):
+    calls.clear()
+
+    assert parsed_input_cache(parse, "1,2", cache_dir=tmp_path) == ["1", "2"]
+    assert parsed_input_cache(parse, "1;2", cache_dir=tmp_path) == ["1;2"]
+    assert parsed_input_cache(parse, "1;2", ";", cache_dir=tmp_path) == ["1", "2"]
+    assert len(calls) == 3
+
+
+def test_bench_part_solve(tmp_path, make_part):
+    make_part(
+        37,
+        1,
+        "return solve(parse(s))",
+        extra=(
+            "def parse(s):\n"
+            "    return list(s)\n"
+            "def solve(data):\n"
+            "    data.append('x')\n"
+            "    return len(data)\n"
+        ),
+    )
+
+    result = bench_part(Part(37, 1), tmp_path, min_time=0, min_runs=3)
+
+    assert result.answer == "4"
+    assert result.solve.runs == 3
+    assert list((tmp_path / ".cache" / "parsed").iterdir())
+    assert "| Solve   |" in format_markdown([result])
+
+
+def test_bench_part_helper_named_parse(tmp_path, make_part):
+    make_part(
+        37,
+        1,
+        "return len(parse(s))",
+        extra=(
+            "def parse(s):\n"
+            "    return list(s)\n"
+            "def solve(data):\n"
+            "    raise AssertionError('not a solve of compute')\n"
+        ),
+    )
+
+    result = bench_part(Part(37, 1), tmp_path, min_time=0, min_runs=3)
+
+    assert result.answer == "3"
+    assert result.solve is None
+
+
+def test_parsed_input_cache_key_support_changed(tmp_path, monkeypatch):
+    calls.clear()
+    parsed_input_cache(parse, "1,2", cache_dir=tmp_path)
+
+    monkeypatch.setattr(support.cache, "support_digest", lambda: "changed")
+    parsed_input_cache(parse, "1,2", cache_dir=tmp_path)
+
+    assert len(calls) == 2
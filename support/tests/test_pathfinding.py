@@ -85,3 +85,180 @@ def test_pathfinding_functions_wo_weights(graph, function) -> None:
         (2, 1): (2, 0),
         (2, 2): (2, 1),
     }
+
+
+@pytest.fixture()
+def csr_graph(matrix):
+    return sup.grid_to_csr(matrix, weight=lambda value: value)
+
+
+@pytest.mark.parametrize(
+    "function",
+    [
+        sup.dijkstra,
+        partial(sup.a_star, target=8, heuristic=lambda a, b: 0),
+    ],
+)
+def test_pathfinding_functions_with_weights_csr(csr_graph, function) -> None:
+    result_dist, result_prev = function(csr_graph, 0)
+
+    assert list(result_dist) == [0, 2, 5, 4, 7, 11, 11, 15, 20]
+    assert list(result_prev) == [-1, 0, 1, 0, 1, 2, 3, 4, 5]
+
+
+def test_bfs_csr(matrix) -> None:
+    csr_graph = sup.grid_to_csr(matrix)
+
+    result_prev = sup.bfs(csr_graph, 0)
+
+    assert list(result_prev) == [-1, 0, 1, 0, 3, 4, 3, 6, 7]
+
+
+def test_grid_to_csr_skips_impassable_cells() -> None:
+    grid = sup.Grid.create_from_input("..#\n#..\n...")
+
+    result = sup.grid_to_csr(grid, passable=lambda value: value != ord("#"))
+    dist, _ = sup.dijkstra(result, result.index(0, 0))
+
+    assert result.weights is None
+    assert list(result.neighbors(result.index(0, 1))) == [(0, 1), (4, 1)]
+    assert list(result.neighbors(result.index(0, 2))) == []
+    assert dist[result.index(2, 2)] == 4
+    assert dist[result.index(1, 0)] == sup.UNREACHABLE
+
+
+def test_dijkstra_stops_at_target(graph) -> None:
+    result_dist, result_prev = sup.dijkstra(graph, (0, 0), target=(1, 1))
+
+    assert result_dist[(1, 1)] == 7
+    assert result_prev[(1, 1)] == (0, 1)
+    assert (2, 2) not in result_dist
+
+
+@pytest.mark.parametrize("csr", [False, True])
+def test_dijkstra_max_dist(graph, csr_graph, csr) -> None:
+    if csr:
+        result_dist, _ = sup.dijkstra(csr_graph, 0, max_dist=7)
+        result_dist = {
+            csr_graph.coords(idx): val
+            for idx, val in enumerate(result_dist)
+            if val != sup.UNREACHABLE
+        }
+    else:
+        result_dist, _ = sup.dijkstra(graph, (0, 0), max_dist=7)
+
+    assert result_dist == {(0, 0): 0, (0, 1): 2, (0, 2): 5, (1, 0): 4, (1, 1): 7}
+
+
+@pytest.mark.parametrize("target", [None, (2, 2), (1, 1)])
+def test_dial_shortest_path_same_as_dijkstra(graph, target) -> None:
+    expected_dist, _ = sup.dijkstra(graph, (0, 0), target=target)
+
+    result_dist, result_prev = sup.dial_shortest_path(graph, (0, 0), target=target)
+
+    if target is None:
+        assert result_dist == expected_dist
+    assert result_dist[target or (2, 2)] == expected_dist[target or (2, 2)]
+    for vertex, prev_vertex in result_prev.items():
+        if prev_vertex is not None:
+            weight = graph[prev_vertex][vertex]
+            assert result_dist[prev_vertex] + weight == result_dist[vertex]
+
+
+def test_dial_shortest_path_csr(csr_graph) -> None:
+    result_dist, result_prev = sup.dial_shortest_path(csr_graph, 0)
+
+    assert list(result_dist) == [0, 2, 5, 4, 7, 11, 11, 15, 20]
+    assert list(result_prev) == [-1, 0, 1, 0, 1, 2, 3, 4, 5]
+
+
+def manhattan(a, b):
+    return sup.cartesian_shortest_path(a, b)
+
+
+@pytest.mark.parametrize(
+    "function",
+    [
+        sup.bidirectional_dijkstra,
+        partial(sup.bidirectional_a_star, heuristic=lambda a, b: 0),
+    ],
+)
+@pytest.mark.parametrize("target", [(0, 0), (1, 1), (2, 2), (2, 0)])
+def test_bidirectional_search(graph, function, target) -> None:
+    expected_dist, _ = sup.dijkstra(graph, (0, 0))
+
+    result = function(graph, (0, 0), target)
+
+    path = result.path()
+    assert result.dist == expected_dist[target]
+    assert path[0] == (0, 0)
+    assert path[-1] == target
+    assert sum(graph[u][v] for u, v in zip(path, path[1:])) == result.dist
+
+
+def test_bidirectional_search_unreachable() -> None:
+    graph = {"a": {"b": 1}, "b": {}, "c": {"b": 1}}
+
+    result = sup.bidirectional_dijkstra(graph, "a", "c")
+
+    assert result.dist is None
+    assert result.path() == []
+
+
+def test_bidirectional_search_directed() -> None:
+    graph = {"a": {"b": 1, "c": 5}, "b": {"c": 1}, "c": {"a": 1}}
+
+    result = sup.bidirectional_dijkstra(graph, "a", "c")
+
+    assert result.dist == 2
+    assert result.path() == ["a", "b", "c"]
+
+
+def test_bidirectional_search_expands_less_on_open_grid() -> None:
+    matrix = sup.Matrix([[0] * 40 for _ in range(40)])
+    graph = {
+        (m, n): {coords: 1 for coords in matrix.neighbors_cross(m, n)}
+        for m in range(40)
+        for n in range(40)
+    }
+    source, target = (10, 5), (30, 35)
+    dist, _ = sup.dijkstra(graph, source, target=target)
+
+    result_dijkstra = sup.bidirectional_dijkstra(graph, source, target, graph)
+    result_a_star = sup.bidirectional_a_star(graph, source, target, manhattan, graph)
+
+    assert result_dijkstra.dist == result_a_star.dist == dist[target]
+    assert result_a_star.expanded < result_dijkstra.expanded < len(dist)
+
+
+def test_distance_field() -> None:
+    grid = sup.Grid.create_from_input("..#.\n#...\n.##.")
+
+    result = sup.distance_field(
+        grid, [(0, 0), (2, 3)], passable=lambda value: value != ord("#")
+    )
+
+    assert list(result) == [0, 1, -1, 2, -1, 2, 2, 1, -1, -1, -1, 0]
+
+
+def test_path_order(csr_graph) -> None:
+    _, prev = sup.dijkstra(csr_graph, 0)
+
+    result = sup.path_order(prev, 0, csr_graph.index(2, 1))
+
+    assert list(result) == [0, 1, 4, 7]
+
+
+def test_path_order_source_is_end(csr_graph) -> None:
+    _, prev = sup.dijkstra(csr_graph, 0)
+
+    assert list(sup.path_order(prev, 0, 0)) == [0]
+
+
+def test_path_order_unreachable() -> None:
+    graph = sup.grid_to_csr(
+        sup.Matrix.create_from_input(".#.\n.#."), passable=lambda value: value != "#"
+    )
+    _, prev = sup.dijkstra(graph, 0)
+
+    assert list(sup.path_order(prev, 0, graph.index(0, 2))) == []
@@ -0,0 +1,98 @@
+import os
+import pickle
+from multiprocessing import shared_memory
+
+import pytest
+
+import support.parallel
+from support import Part, WorkerPool, import_part, pool, pool_chunksize, shared_grid
+
+
+def square(x):
+    return x * x
+
+
+def lookup(shared, key):
+    return shared[key], os.getpid()
+
+
+@pytest.fixture()
+def worker_pool():
+    worker_pool = WorkerPool(2)
+    yield worker_pool
+    worker_pool.shutdown()
+
+
+@pytest.mark.parametrize(
+    "items_count,workers,expected",
+    [
+        (0, 4, 1),
+        (7, 4, 1),
+        (100, 4, 7),
+        (1000, 2, 125),
+    ],
+)
+def test_pool_chunksize(items_count, workers, expected):
+    assert pool_chunksize(items_count, workers) == expected
+
+
+def test_map(worker_pool):
+    assert worker_pool.map(square, range(100)) == [x * x for x in range(100)]
+
+
+def test_map_shared(worker_pool):
+    shared = {i: str(i) for i in range(1000)}
+
+    result = worker_pool.map(lookup, [5, 500, 999], shared=shared, chunksize=1)
+
+    assert [value for value, _ in result] == ["5", "500", "999"]
+    assert all(pid != os.getpid() for _, pid in result)
+
+
+def test_map_reuses_workers(worker_pool):
+    first = {pid for _, pid in worker_pool.map(lookup, range(10), shared=[0] * 10)}
+    second = {pid for _, pid in worker_pool.map(lookup, range(10), shared=[1] * 10)}
+
+    assert len(first | second) <= worker_pool.workers
+
+
+def test_map_one_worker_runs_inline():
+    result = WorkerPool(1).map(lookup, [0], shared=["a"])
+
+    assert result == [("a", os.getpid())]
+
+
+def test_pool_is_singleton(monkeypatch):
+    monkeypatch.setattr(support.parallel, "_POOL", None)
+
+    assert pool() is pool()
+
+
+def test_map_day_module_imported_after_start(worker_pool, tmp_path):
+    worker_pool.map(square, range(10))
+    (tmp_path / "day36").mkdir()
+    (tmp_path / "day36" / "part1.py").write_text("def double(x):\n    return 2 * x\n")
+    module = import_part(Part(36, 1), tmp_path)
+
+    assert worker_pool.map(module.double, range(10)) == list(range(0, 20, 2))
+
+
+def grid_cell(grid, coords):
+    return grid[coords]
+
+
+def test_shared_grid(worker_pool):
+    with shared_grid("#..\n.#.\n") as grid:
+        result = worker_pool.map(grid_cell, [(0, 0), (0, 1), (1, 1)], shared=grid)
+
+        assert result == ["#", ".", "#"]
+        assert grid.bounds == (1, 2)
+        assert pickle.loads(pickle.dumps(grid)).memory.name == grid.memory.name
+
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(grid.memory.name)
+
+
+def test_shared_grid_ragged():
+    with pytest.raises(ValueError, match="same length"):
+        shared_grid("#..\n.#\n")
@@ -0,0 +1,77 @@
+import cProfile
+import time
+
+import pytest
+
+from support import Part, StackSampler, cprofile_collapsed, profile_part
+
+
+def busy(seconds):
+    end = time.process_time() + seconds
+    while time.process_time() < end:
+        pass
+
+
+def parse_collapsed(s):
+    result = {}
+    for line in s.splitlines():
+        stack, value = line.rsplit(" ", 1)
+        result[stack] = int(value)
+    return result
+
+
+def test_stack_sampler():
+    with StackSampler(interval=0.001) as sampler:
+        busy(0.1)
+
+    result = parse_collapsed(sampler.collapsed())
+
+    assert result
+    assert all(stack.startswith("test_profile.py:busy") for stack in result)
+
+
+def test_stack_sampler_filters_frames():
+    with StackSampler(interval=0.001, keep=lambda f: "test_profile" in f) as sampler:
+        busy(0.1)
+
+    assert all(";" not in stack for stack in parse_collapsed(sampler.collapsed()))
+
+
+def test_cprofile_collapsed():
+    def outer():
+        busy(0.01)
+
+    profile = cProfile.Profile()
+    profile.runcall(outer)
+
+    result = parse_collapsed(
+        cprofile_collapsed(profile, keep=lambda f: f.endswith("test_profile.py"))
+    )
+
+    assert "test_profile.py:outer;test_profile.py:busy" in result
+
+
+@pytest.fixture()
+def root(tmp_path, make_part):
+    make_part(
+        33,
+        1,
+        "end = time.process_time() + 0.1\n"
+        "while time.process_time() < end:\n"
+        "    pass",
+        extra="import time\n",
+    )
+    return tmp_path
+
+
+@pytest.mark.parametrize("mode", ["sample", "cprofile"])
+def test_profile_part(root, mode):
+    result = parse_collapsed(profile_part(Part(33, 1), root, mode=mode))
+
+    assert result
+    assert all(stack.startswith("part1.py:compute") for stack in result)
+
+
+def test_profile_part_unknown_mode(root):
+    with pytest.raises(ValueError, match="unknown profile"):
+        profile_part(Part(33, 1), root, mode="perf")
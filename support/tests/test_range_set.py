@@ -0,0 +1,111 @@
+import random
+
+import pytest
+
+from support import Range, RangeSet
+
+
+def make(*pairs):
+    return RangeSet(Range(start, end) for start, end in pairs)
+
+
+def as_pairs(range_set):
+    return [(item.start, item.end) for item in range_set]
+
+
+@pytest.mark.parametrize(
+    "pairs,expected",
+    [
+        ([(0, 5)], [(0, 5)]),
+        ([(0, 5), (10, 15)], [(0, 5), (10, 15)]),
+        ([(10, 15), (0, 5)], [(0, 5), (10, 15)]),
+        ([(0, 5), (5, 10)], [(0, 10)]),
+        ([(0, 5), (3, 10)], [(0, 10)]),
+        ([(0, 5), (10, 15), (4, 11)], [(0, 15)]),
+        ([(0, 5), (10, 15), (20, 25), (6, 21)], [(0, 5), (6, 25)]),
+        ([(2, 3), (0, 10)], [(0, 10)]),
+    ],
+)
+def test_add(pairs, expected):
+    result = make(*pairs)
+
+    assert as_pairs(result) == expected
+    assert len(result) == sum(end - start for start, end in expected)
+
+
+@pytest.mark.parametrize(
+    "to_remove,expected",
+    [
+        ((0, 5), [(10, 20), (30, 40)]),
+        ((10, 20), [(30, 40)]),
+        ((12, 15), [(10, 12), (15, 20), (30, 40)]),
+        ((15, 35), [(10, 15), (35, 40)]),
+        ((0, 100), []),
+        ((20, 30), [(10, 20), (30, 40)]),
+    ],
+)
+def test_remove(to_remove, expected):
+    range_set = make((10, 20), (30, 40))
+
+    range_set.remove(*to_remove)
+
+    assert as_pairs(range_set) == expected
+    assert len(range_set) == sum(end - start for start, end in expected)
+
+
+@pytest.mark.parametrize(
+    "candidate,expected",
+    [(9, False), (10, True), (19, True), (20, False), (30, True), (40, False)],
+)
+def test_contains(candidate, expected):
+    range_set = make((10, 20), (30, 40))
+
+    assert (candidate in range_set) is expected
+
+
+def test_union_and_intersect():
+    first = make((0, 10), (20, 30), (40, 50))
+    second = make((5, 25), (30, 35), (45, 60))
+
+    assert as_pairs(first.union(second)) == [(0, 35), (40, 60)]
+    assert as_pairs(first.intersect(second)) == [
+        (5, 10),
+        (20, 25),
+        (45, 50),
+    ]
+    assert len(first.intersect(second)) == 15
+
+
+@pytest.mark.parametrize(
+    "size,expected",
+    [(1, Range(0, 2)), (2, Range(0, 2)), (3, Range(10, 15)), (6, None)],
+)
+def test_find_first_fit(size, expected):
+    range_set = make((0, 2), (10, 15))
+
+    assert range_set.find_first_fit(size) == expected
+
+
+def test_invalid_range():
+    with pytest.raises(ValueError):
+        RangeSet().add(5, 5)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_same_as_python_set(seed):
+    rnd = random.Random(seed)
+    range_set = RangeSet()
+    expected = set()
+    for _ in range(200):
+        start = rnd.randrange(100)
+        end = start + rnd.randrange(1, 10)
+        if rnd.random() < 0.6:
+            range_set.add(start, end)
+            expected.update(range(start, end))
+        else:
+            range_set.remove(start, end)
+            expected.difference_update(range(start, end))
+
+        assert len(range_set) == len(expected)
+    assert {n for n in range(-1, 120) if n in range_set} == expected
+    assert all(a.end < b.start for a, b in zip(range_set, list(range_set)[1:]))
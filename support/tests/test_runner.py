@@ -0,0 +1,88 @@
+import pytest
+
+from support import (
+    Part,
+    RunResult,
+    format_markdown_run,
+    load_past_timings,
+    run_part,
+    run_parts,
+    save_run_timings,
+)
+
+
+@pytest.fixture()
+def root(tmp_path, make_part):
+    make_part(35, 1, "return len(s)")
+    make_part(35, 2, "return 1 / 0")
+    make_part(35, 3, "__import__('time').sleep(60)")
+    return tmp_path
+
+
+def test_run_part(root):
+    result = run_part(Part(35, 1), root)
+
+    assert result.answer == "3"
+    assert result.error is None
+    assert result.seconds >= 0
+
+
+def test_run_part_error(root):
+    result = run_part(Part(35, 2), root)
+
+    assert result.answer is None
+    assert result.error == "ZeroDivisionError('division by zero')"
+    assert "ERROR: ZeroDivisionError" in format_markdown_run([result])
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_run_parts(root, jobs):
+    parts = [Part(35, 2), Part(35, 1)]
+
+    result = list(run_parts(parts, root, jobs=jobs))
+
+    assert sorted(r.part for r in result) == sorted(parts)
+    assert {r.part: r.answer for r in result} == {parts[0]: None, parts[1]: "3"}
+
+
+def test_run_parts_longest_first(root):
+    parts = [Part(35, 1), Part(35, 2)]
+    past_timings = {Part(35, 1): 0.1, Part(35, 2): 1.0}
+
+    result = list(run_parts(parts, root, jobs=1, timeout=10, past_timings=past_timings))
+
+    assert [r.part for r in result] == [Part(35, 2), Part(35, 1)]
+
+
+def test_run_parts_timeout(root):
+    parts = [Part(35, 3), Part(35, 1)]
+
+    result = {r.part: r for r in run_parts(parts, root, jobs=1, timeout=0.5)}
+
+    assert result[Part(35, 3)].error == "timed out after 0.5s"
+    assert result[Part(35, 1)].answer == "3"
+
+
+def test_run_parts_timeout_with_fast_parts(root, make_part):
+    for part in range(4, 12):
+        make_part(35, part)
+    parts = [Part(35, 3)] + [Part(35, part) for part in range(4, 12)]
+
+    result = list(run_parts(parts, root, jobs=2, timeout=1))
+
+    assert sorted(r.part for r in result) == sorted(parts)
+    assert {r.part: r.error for r in result if r.error} == {
+        Part(35, 3): "timed out after 1s"
+    }
+
+
+def test_run_timings_roundtrip(root):
+    save_run_timings(
+        [
+            RunResult(Part(35, 1), "3", 0.25),
+            RunResult(Part(35, 2), None, 0.5, "ZeroDivisionError()"),
+        ],
+        root,
+    )
+
+    assert load_past_timings(root) == {Part(35, 1): 0.25}
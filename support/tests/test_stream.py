@@ -0,0 +1,127 @@
+import pytest
+
+import support.parallel
+from support import (
+    AnswerCache,
+    Part,
+    WorkerPool,
+    file_digest,
+    iter_blocks,
+    iter_chunks,
+    iter_lines,
+    map_batches,
+    run_part,
+)
+
+
+def count_lines(lines):
+    return len(lines)
+
+
+@pytest.fixture()
+def input_path(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_bytes(b"1\n22\n333\n4444\n\n55555\n666666")
+    return path
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 5, 8, 1024])
+def test_iter_chunks_ends_with_whole_lines(input_path, chunk_size):
+    chunks = list(iter_chunks(input_path, chunk_size))
+
+    assert b"".join(chunks) == input_path.read_bytes()
+    assert all(chunk.endswith(b"\n") for chunk in chunks[:-1])
+
+
+def test_iter_chunks_line_longer_than_chunk(input_path):
+    chunks = list(iter_chunks(input_path, 4))
+
+    assert b"55555\n" in chunks
+    assert chunks[-1] == b"666666"
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 1024])
+def test_iter_lines(input_path, chunk_size):
+    lines = list(iter_lines(input_path, chunk_size))
+
+    assert lines == [b"1", b"22", b"333", b"4444", b"", b"55555", b"666666"]
+
+
+def test_iter_lines_crlf(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_bytes(b"ab\r\ncd\r\n")
+
+    assert list(iter_lines(path, 3)) == [b"ab", b"cd"]
+
+
+def test_iter_lines_empty_file(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_bytes(b"")
+
+    assert list(iter_lines(path)) == []
+
+
+def test_iter_blocks():
+    lines = [b"", b"a", b"b", b"", b"", b"c", b" "]
+
+    assert list(iter_blocks(lines)) == [[b"a", b"b"], [b"c"]]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_map_batches(monkeypatch, workers):
+    worker_pool = WorkerPool(workers)
+    monkeypatch.setattr(support.parallel, "_POOL", worker_pool)
+
+    try:
+        result = list(map_batches(count_lines, iter(range(25)), batch_size=4))
+    finally:
+        worker_pool.shutdown()
+
+    assert result == [4, 4, 4, 4, 4, 4, 1]
+
+
+def test_map_batches_empty():
+    assert list(map_batches(count_lines, [])) == []
+
+
+def test_file_digest_same_as_for_str(input_path):
+    cache = AnswerCache(input_path.parent / "cache")
+    part = Part(36, 1)
+    s = input_path.read_text()
+
+    assert cache.key(part, __file__, s, (), {}) == cache.key(
+        part, __file__, None, (), {}, input_digest=file_digest(input_path)
+    )
+
+
+@pytest.fixture()
+def root(tmp_path, make_part):
+    input_txt = b"a\nbb\nccc\n"
+    make_part(
+        36,
+        1,
+        "return 'str'",
+        extra="def compute_stream(lines):\n    return sum(map(len, lines))\n",
+        input_txt=input_txt,
+    )
+    make_part(36, 2, "return 'str'", input_txt=input_txt)
+    return tmp_path
+
+
+def test_run_part_stream(root):
+    assert run_part(Part(36, 1), root, stream=True).answer == "6"
+    assert run_part(Part(36, 1), root).answer == "str"
+
+
+def test_run_part_stream_without_compute_stream(root):
+    assert run_part(Part(36, 2), root, stream=True).answer == "str"
+
+
+def test_run_part_stream_cache(root):
+    cache = AnswerCache(root / "cache")
+
+    first = run_part(Part(36, 1), root, cache=cache, stream=True)
+    second = run_part(Part(36, 1), root, cache=cache, stream=True)
+
+    assert (first.answer, first.cached) == ("6", False)
+    assert (second.answer, second.cached) == ("6", True)
@@ -1,6 +1,8 @@
+import sys
+
 import pytest
 
-from support import topological_sort
+from support import CycleError, topological_sort, topological_sort_many
 
 
 @pytest.mark.parametrize(
@@ -19,3 +21,59 @@ from support import topological_sort
 )
 def test_topological_sort(graph, expected):
     assert topological_sort(graph) == expected
+
+
+def test_topological_sort_long_chain():
+    size = sys.getrecursionlimit() * 2
+    graph = {i: [i + 1] for i in range(size)}
+
+    result = topological_sort(graph)
+
+    assert result == list(range(size, -1, -1))
+
+
+@pytest.mark.parametrize(
+    "graph,expected_cycle",
+    [
+        ({"a": ["a"]}, ["a"]),
+        ({"a": ["b"], "b": ["c"], "c": ["b"]}, ["b", "c"]),
+        ({"x": ["a"], "a": ["b"], "b": ["c"], "c": ["a"]}, ["a", "b", "c"]),
+    ],
+)
+def test_topological_sort_cycle(graph, expected_cycle):
+    with pytest.raises(CycleError, match="graph has at least one cycle") as exc:
+        topological_sort(graph)
+
+    assert sorted(exc.value.cycle) == expected_cycle
+
+
+def test_topological_sort_many():
+    # globally cyclic, but every subset is not
+    graph = {"a": ["b"], "b": ["c"], "c": ["a"], "d": ["a"]}
+
+    result = topological_sort_many(graph, [["a", "b"], ["c", "a", "d"], ["e", "b"]])
+
+    assert result == [["b", "a"], ["a", "c", "d"], ["e", "b"]]
+
+
+def test_topological_sort_many_cycle_in_subset():
+    graph = {"a": ["b"], "b": ["c"], "c": ["a"]}
+
+    with pytest.raises(CycleError):
+        topological_sort_many(graph, [["a", "b"], ["a", "b", "c"]])
+
+
+def test_topological_sort_many_doesnt_change_index():
+    graph = {"a": ["b"]}
+
+    result = topological_sort_many(graph, [["x", "a", "b"], ["y", "b"], None])
+
+    assert result == [["x", "b", "a"], ["y", "b"], ["b", "a"]]
+
+
+@pytest.mark.parametrize("subset", [["a", "b", "a"], ["x", "a", "x"]])
+def test_topological_sort_many_duplicate_node(subset):
+    graph = {"a": ["b"]}
+
+    with pytest.raises(ValueError, match=f"node '{subset[0]}' is in subset twice"):
+        topological_sort_many(graph, [subset])
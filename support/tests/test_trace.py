@@ -0,0 +1,79 @@
+import json
+
+import pytest
+
+import support as sup
+
+
+@pytest.fixture()
+def tracer():
+    sup.enable_trace(record_events=True)
+    yield sup.TRACER
+    sup.enable_trace(False)
+
+
+def test_nested_spans_are_aggregated(tracer):
+    @sup.trace
+    def solve():
+        with sup.trace("step"):
+            pass
+
+    with sup.trace("compute"):
+        with sup.trace("parse"):
+            pass
+        for _ in range(3):
+            solve()
+
+    compute = tracer.root.children["compute"]
+    assert compute.count == 1
+    assert list(compute.children) == ["parse", solve.__qualname__]
+    assert compute.children[solve.__qualname__].count == 3
+    assert compute.children[solve.__qualname__].children["step"].count == 3
+    assert compute.total >= compute.self_time >= 0
+    assert tracer.current is tracer.root
+
+
+def test_span_is_closed_on_exception(tracer):
+    with pytest.raises(ZeroDivisionError):
+        with sup.trace("compute"):
+            1 / 0
+
+    assert tracer.current is tracer.root
+    assert tracer.root.children["compute"].count == 1
+
+
+def test_report(tracer):
+    with sup.trace("compute"):
+        with sup.trace("parse"):
+            pass
+
+    result = sup.trace_report().splitlines()
+
+    assert result[0].split() == ["span", "calls", "total", "self"]
+    assert result[1].split()[:2] == ["compute", "1"]
+    assert result[2].startswith("  parse")
+
+
+def test_chrome_trace(tracer, tmp_path):
+    with sup.trace("compute"):
+        with sup.trace("parse"):
+            pass
+    path = tmp_path / "trace.json"
+
+    sup.write_chrome_trace(str(path))
+
+    events = json.loads(path.read_text())["traceEvents"]
+    assert [event["name"] for event in events] == ["parse", "compute"]
+    assert {event["ph"] for event in events} == {"X"}
+
+
+def test_disabled():
+    def solve():
+        return 42
+
+    sup.enable_trace(False)
+
+    assert sup.trace(solve) is solve
+    with sup.trace("compute"):
+        pass
+    assert sup.TRACER.root.children == {}